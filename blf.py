@@ -1,10 +1,23 @@
 import struct
 import zlib
+import mmap
 import datetime
 import time
-from functools import reduce
+import math
 import sys
+import os
 import argparse
+import heapq
+from itertools import islice
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# numpy is only needed for the columnar batch API
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # 0 = unknown, 2 = CANoe
 APPLICATION_ID = 5
@@ -21,9 +34,22 @@ FILE_HEADER_STRUCT = struct.Struct("<4sLBBBBBBBBQQLL8H8H72x")
 # flags, object version, size uncompressed or timestamp
 OBJ_HEADER_STRUCT = struct.Struct("<4sHHLLL2xHQ")
 
+# object size: the only field of OBJ_HEADER_STRUCT needed to walk objects
+OBJ_SIZE_STRUCT = struct.Struct("<L")
+OBJ_SIZE_OFFSET = 8
+
 # channel, flags, dlc, arbitration id, data
 CAN_MSG_STRUCT = struct.Struct("<HBBL8s")
 
+# channel, flags, dlc, arbitration id: CAN_MSG_STRUCT without data
+CAN_MSG_HEAD_STRUCT = struct.Struct("<HBBL")
+
+# offset of CAN message data from the start of the object header
+CAN_DATA_OFFSET = OBJ_HEADER_STRUCT.size + CAN_MSG_HEAD_STRUCT.size
+
+# channel, arbitration id: the part of CAN_MSG_STRUCT used by filters
+CAN_FILTER_STRUCT = struct.Struct("<H2xL")
+
 # channel, length
 CAN_ERROR_STRUCT = struct.Struct("<HH4x")
 
@@ -40,6 +66,36 @@ GLOBAL_MARKER = 96
 CAN_MSG_EXT = 0x80000000
 REMOTE_FLAG = 0x80
 
+if np is not None:
+    # One row per CAN message or error frame, see BLFReader.iter_batches
+    FRAME_DTYPE = np.dtype([
+        ("timestamp", "<f8"),
+        ("channel", "<u2"),
+        ("arbitration_id", "<u4"),
+        ("flags", "u1"),
+        ("dlc", "u1"),
+        ("data", "u1", (8,)),
+        ("is_extended_id", "?"),
+        ("is_remote_frame", "?"),
+        ("is_error_frame", "?"),
+    ])
+
+    # OBJ_HEADER_STRUCT fields used by the batch decoder
+    _OBJ_HEADER_DTYPE = np.dtype({
+        "names": ["signature", "type", "timestamp"],
+        "formats": ["S4", "<u4", "<u8"],
+        "offsets": [0, 12, 24],
+        "itemsize": OBJ_HEADER_STRUCT.size,
+    })
+
+    # CAN_MSG_STRUCT fields as seen from the start of the object header
+    _CAN_OBJ_DTYPE = np.dtype({
+        "names": ["channel", "flags", "dlc", "can_id", "data"],
+        "formats": ["<u2", "u1", "u1", "<u4", ("u1", (8,))],
+        "offsets": [32, 34, 35, 36, 40],
+        "itemsize": OBJ_HEADER_STRUCT.size + CAN_MSG_STRUCT.size,
+    })
+
 
 def timestamp_to_systemtime(timestamp):
     if timestamp is None or timestamp < 631152000:
@@ -60,6 +116,9 @@ def systemtime_to_timestamp(systemtime):
         return 0
 
 class Message(object):
+    __slots__ = ('timestamp', 'arbitration_id', 'is_extended_id',
+                 'is_remote_frame', 'dlc', 'data', 'is_error_frame', 'channel')
+
     def __init__(self, **args):
         self.timestamp       = args['timestamp']
         self.arbitration_id  = args.get('arbitration_id', 0)
@@ -68,6 +127,54 @@ class Message(object):
         self.dlc             = args.get('dlc', 0)
         self.data            = args.get('data', [])
         self.is_error_frame  = args.get('is_error_frame', False)
+        self.channel         = args.get('channel', None)
+
+# Frame._bits layout: dlc (4 bits), flags, position of data in the buffer.
+# Without a position the value fits the cached small integers.
+FRAME_EXTENDED = 0x10
+FRAME_REMOTE = 0x20
+FRAME_ERROR = 0x40
+FRAME_POS_SHIFT = 7
+
+class Frame(object):
+    """
+    Compact CAN frame record yielded by BLFReader, same fields as Message.
+
+    dlc, flags and the payload position are packed in one integer. buf is
+    either the payload itself (position 0) or, for lazy frames, the whole
+    decompressed container shared by its frames until data is read.
+    """
+    __slots__ = ('timestamp', 'channel', 'arbitration_id', '_bits', '_buf')
+
+    def __init__(self, timestamp, channel, arbitration_id, bits, buf):
+        self.timestamp      = timestamp
+        self.channel        = channel
+        self.arbitration_id = arbitration_id
+        self._bits          = bits
+        self._buf           = buf
+
+    @property
+    def dlc(self):
+        return self._bits & 0xF
+
+    @property
+    def is_extended_id(self):
+        return bool(self._bits & FRAME_EXTENDED)
+
+    @property
+    def is_remote_frame(self):
+        return bool(self._bits & FRAME_REMOTE)
+
+    @property
+    def is_error_frame(self):
+        return bool(self._bits & FRAME_ERROR)
+
+    @property
+    def data(self):
+        pos = self._bits >> FRAME_POS_SHIFT
+        if not pos:
+            return self._buf
+        return self._buf[pos:pos + min(self._bits & 0xF, 8)]
 
 class BLFReader(object):
     """
@@ -77,20 +184,142 @@ class BLFReader(object):
     silently ignored.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, use_mmap=False, workers=1,
+                 start=None, end=None, ids=None, id_mask=None, id_range=None,
+                 channels=None, error_frames=True, lazy_data=False,
+                 follow=False, poll_interval=0.5, idle_timeout=None):
+        """
+        With use_mmap the file is mapped into memory and containers are
+        decompressed straight from the mapping instead of being read
+        object by object.
+
+        With workers > 1 containers are decompressed ahead of the parser
+        by a pool of that many threads, frames keep the file order.
+
+        start and end limit frames to that timestamp interval (same clock
+        as Message.timestamp). The container index (see get_index) is
+        used to seek to the first relevant container and stop early.
+
+        Other filters are checked right after the object header is parsed,
+        rejected objects are never decoded:
+            ids          - set of accepted arbitration ids
+            id_mask      - (mask, value), accept id if id & mask == value
+            id_range     - (low, high), accept ids in the closed interval
+            channels     - set of accepted channels
+            error_frames - False drops error frames
+        Id filters do not apply to error frames as they have no id.
+
+        With lazy_data frames keep a reference to their container instead
+        of a copy of the payload. It saves the copy when data is not read,
+        but a kept frame holds the whole container in memory.
+
+        With follow the reader does not stop at the end of a file which is
+        still being written. It keeps the offset of the last complete
+        container, checks the file for growth every poll_interval seconds
+        and yields frames of new containers. idle_timeout ends following
+        after that many seconds without growth. Follow mode reads with
+        plain file calls and decompresses serially.
+        """
+        self.use_mmap = use_mmap
+        self.workers = workers
+        self.start = start
+        self.end = end
+        self.ids = None if ids is None else frozenset(ids)
+        self.id_mask = id_mask
+        self.id_range = id_range
+        self.channels = None if channels is None else frozenset(channels)
+        self.error_frames = error_frames
+        self.lazy_data = lazy_data
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self._filtered = not (start is None and end is None and ids is None and
+                              id_mask is None and id_range is None and
+                              channels is None and error_frames)
         self.fp = open(filename, "rb")
         data = self.fp.read(FILE_HEADER_STRUCT.size)
         header = FILE_HEADER_STRUCT.unpack(data)
         #print(header)
         assert header[0] == b"LOGG", "Unknown file format"
         self.start_timestamp = systemtime_to_timestamp(header[14:22])
+        # file offset to start from, bytes to skip in the first container
+        # and offset of the container to stop at
+        self._seek = (FILE_HEADER_STRUCT.size, 0, None)
+        if start is not None or end is not None:
+            self._seek = self._find_containers(get_index(filename))
 
-    def __iter__(self):
-        tail = b""
-        while True:
+    def _find_containers(self, index):
+        start = self.start
+        end = self.end
+        first = 0
+        if start is not None:
+            # first container which can hold a frame not before start
+            while (first < len(index) and
+                   self._to_timestamp(index[first][3]) < start):
+                first += 1
+        if first == len(index):
+            return (None, 0, None)
+        stop = None
+        if end is not None:
+            # containers after end are not read except the first one,
+            # it may complete an object split from the previous container
+            for i in range(first, len(index) - 1):
+                if self._to_timestamp(index[i][2]) > end:
+                    stop = index[i + 1][0]
+                    break
+        return (index[first][0], index[first][1], stop)
+
+    def _to_timestamp(self, raw):
+        return raw / 1000000000.0 + self.start_timestamp
+
+    def _iter_chunks(self):
+        """Yield (file offset, decompressed payload) per LOG_CONTAINER"""
+        if self.use_mmap and not self.follow:
+            with mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    yield from self._decompress(
+                        self._iter_mapped_containers(view))
+                finally:
+                    view.release()
+        else:
+            yield from self._decompress(self._iter_file_containers())
+        self.fp.close()
+
+    def _decompress(self, containers):
+        if self.workers <= 1 or self.follow:
+            for offset, obj_data, uncompressed_size in containers:
+                yield offset, zlib.decompress(obj_data, 15, uncompressed_size)
+            return
+        # zlib releases the GIL, so threads decompress in parallel while
+        # the consumer parses. Keep a bounded window of pending containers.
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = deque()
+            for offset, obj_data, uncompressed_size in containers:
+                pending.append((offset, pool.submit(
+                    zlib.decompress, obj_data, 15, uncompressed_size)))
+                if len(pending) > 2 * self.workers:
+                    offset, future = pending.popleft()
+                    yield offset, future.result()
+            while pending:
+                offset, future = pending.popleft()
+                yield offset, future.result()
+
+    def _iter_file_containers(self):
+        """Yield (offset, compressed data, uncompressed size) per LOG_CONTAINER"""
+        offset, _, stop = self._seek
+        if offset is None:
+            return
+        self.fp.seek(offset)
+        while offset != stop:
             data = self.fp.read(OBJ_HEADER_STRUCT.size)
-            if not data:
-                # EOF
+            if len(data) < OBJ_HEADER_STRUCT.size and self.follow:
+                # Wait for the rest of the object and read it again
+                if not self._wait_growth(offset, OBJ_HEADER_STRUCT.size):
+                    break
+                continue
+            if len(data) < OBJ_HEADER_STRUCT.size:
+                # EOF or truncated file, same as _iter_mapped_containers
                 break
             header = OBJ_HEADER_STRUCT.unpack(data)
             #print(header)
@@ -99,86 +328,700 @@ class BLFReader(object):
             obj_data_size = header[3] - OBJ_HEADER_STRUCT.size
             obj_data = self.fp.read(obj_data_size)
             # Read padding bytes
-            self.fp.read(obj_data_size % 4)
+            padding = self.fp.read(obj_data_size % 4)
+            if self.follow and (len(obj_data) < obj_data_size or
+                                len(padding) < obj_data_size % 4):
+                if not self._wait_growth(
+                        offset, header[3] + obj_data_size % 4):
+                    break
+                continue
+            if len(obj_data) < obj_data_size:
+                # Truncated file, same as _iter_mapped_containers
+                break
             if obj_type == LOG_CONTAINER:
                 uncompressed_size = header[7]
-                data = zlib.decompress(obj_data, 15, uncompressed_size)
-                if tail:
-                    data = tail + data
-                pos = 0
-                while pos + OBJ_HEADER_STRUCT.size < len(data):
-                    header = OBJ_HEADER_STRUCT.unpack(
-                        data[pos:pos + OBJ_HEADER_STRUCT.size])
-                    #print(header)
-                    assert header[0] == b"LOBJ", "Parse error"
-                    obj_size = header[3]
-                    if pos + obj_size > len(data):
-                        # Object continues in next log container
-                        break
-                    obj_data = data[pos + OBJ_HEADER_STRUCT.size:pos + obj_size]
-                    obj_type = header[4]
-                    timestamp = header[7] / 1000000000.0 + self.start_timestamp
-                    if obj_type == CAN_MESSAGE:
-                        (channel, flags, dlc, can_id,
-                         can_data) = CAN_MSG_STRUCT.unpack(obj_data)
-                        msg = Message(timestamp=timestamp,
-                                      arbitration_id=can_id & 0x1FFFFFFF,
-                                      extended_id=bool(can_id & CAN_MSG_EXT),
-                                      is_remote_frame=bool(flags & REMOTE_FLAG),
-                                      dlc=dlc,
-                                      data=can_data[:dlc])
-                        msg.channel = channel
-                        yield msg
-                    elif obj_type == CAN_ERROR:
-                        channel, length = CAN_ERROR_STRUCT.unpack(obj_data)
-                        msg = Message(timestamp=timestamp, is_error_frame=True)
-                        msg.channel = channel
-                        yield msg
-                    pos += obj_size
-                    # Add padding bytes
-                    pos += obj_size % 4
-                # Save remaing data that could not be processed
-                tail = data[pos:]
+                yield offset, obj_data, uncompressed_size
+            offset += header[3] + obj_data_size % 4
+
+    def _wait_growth(self, offset, needed):
+        """
+        Sleep until the file holds needed bytes from offset, then seek back
+        to offset. Return False if idle_timeout passed before that.
+        """
+        waited = 0.0
+        while os.fstat(self.fp.fileno()).st_size < offset + needed:
+            if self.idle_timeout is not None and waited >= self.idle_timeout:
+                return False
+            time.sleep(self.poll_interval)
+            waited += self.poll_interval
+        self.fp.seek(offset)
+        return True
+
+    def _iter_mapped_containers(self, view):
+        pos, _, stop = self._seek
+        if pos is None:
+            return
+        while pos != stop and pos + OBJ_HEADER_STRUCT.size <= len(view):
+            header = OBJ_HEADER_STRUCT.unpack_from(view, pos)
+            assert header[0] == b"LOBJ", "Parse error"
+            obj_data_size = header[3] - OBJ_HEADER_STRUCT.size
+            start = pos + OBJ_HEADER_STRUCT.size
+            end = start + obj_data_size
+            if end > len(view):
+                # Truncated file
+                break
+            if header[4] == LOG_CONTAINER:
+                uncompressed_size = header[7]
+                yield pos, view[start:end], uncompressed_size
+            # Skip padding bytes
+            pos = end + obj_data_size % 4
+
+    def _iter_container_positions(self):
+        """
+        Yield (offset, data, skip, split, positions) per LOG_CONTAINER.
+        positions is an array of offsets in data of the objects complete
+        in this container, found by their size field only. split is the
+        object split from the previous container and completed by this
+        one or None, skip is the count of its bytes at the start of data.
+        """
+        tail = b""
+        pos = self._seek[1]
+        unpack_size = OBJ_SIZE_STRUCT.unpack_from
+        for offset, data in self._iter_chunks():
+            split = None
+            if tail:
+                split, pos = _complete_split(tail, data)
+                if split is None:
+                    tail = tail + data
+                    continue
+            skip = pos
+            positions = array("q")
+            append = positions.append
+            end = len(data) - OBJ_HEADER_STRUCT.size
+            while pos < end:
+                obj_size = unpack_size(data, pos + OBJ_SIZE_OFFSET)[0]
+                if pos + obj_size > len(data) or not obj_size:
+                    # Object continues in next log container, an empty
+                    # object is garbage and is left to the signature check
+                    break
+                append(pos)
+                pos += obj_size
+                # Add padding bytes
+                pos += obj_size % 4
+            # Save remaing data that could not be processed
+            tail = data[pos:]
+            pos = 0
+            yield offset, data, skip, split, positions
+
+    def _iter_container_objects(self):
+        """
+        Yield (offset, data, skip, objects) per LOG_CONTAINER. objects is
+        a list of (buffer, pos, header) for every object that is complete
+        once the container is decoded, skip is the count of bytes at the
+        start of data taken by an object split from the previous container.
+        buffer is data itself except for that split object.
+        """
+        accept = self._accept if self._filtered else None
+        tail = b""
+        pos = self._seek[1]
+        for offset, data in self._iter_chunks():
+            objects = []
+            if tail:
+                obj, pos = _complete_split(tail, data)
+                if obj is None:
+                    tail = tail + data
+                    continue
+                header = OBJ_HEADER_STRUCT.unpack_from(obj)
+                assert header[0] == b"LOBJ", "Parse error"
+                if accept is None or accept(obj, 0, header):
+                    objects.append((obj, 0, header))
+            skip = pos
+            while pos + OBJ_HEADER_STRUCT.size < len(data):
+                header = OBJ_HEADER_STRUCT.unpack_from(data, pos)
+                #print(header)
+                assert header[0] == b"LOBJ", "Parse error"
+                obj_size = header[3]
+                if pos + obj_size > len(data):
+                    # Object continues in next log container
+                    break
+                if accept is None or accept(data, pos, header):
+                    objects.append((data, pos, header))
+                pos += obj_size
+                # Add padding bytes
+                pos += obj_size % 4
+            # Save remaing data that could not be processed
+            tail = data[pos:]
+            pos = 0
+            yield offset, data, skip, objects
+
+    def _accept(self, data, pos, header):
+        """Check reader filters against an object before decoding it"""
+        obj_type = header[4]
+        if obj_type == CAN_MESSAGE:
+            channel, can_id = CAN_FILTER_STRUCT.unpack_from(
+                data, pos + OBJ_HEADER_STRUCT.size)
+            can_id &= 0x1FFFFFFF
+            if self.ids is not None and can_id not in self.ids:
+                return False
+            if (self.id_mask is not None and
+                    can_id & self.id_mask[0] != self.id_mask[1]):
+                return False
+            if (self.id_range is not None and
+                    not self.id_range[0] <= can_id <= self.id_range[1]):
+                return False
+        elif obj_type == CAN_ERROR:
+            if not self.error_frames:
+                return False
+            channel = CAN_ERROR_STRUCT.unpack_from(
+                data, pos + OBJ_HEADER_STRUCT.size)[0]
+        else:
+            return False
+        if self.channels is not None and channel not in self.channels:
+            return False
+        if self.start is not None or self.end is not None:
+            timestamp = self._to_timestamp(header[7])
+            if self.start is not None and timestamp < self.start:
+                return False
+            if self.end is not None and timestamp > self.end:
+                return False
+        return True
+
+    def __iter__(self):
+        """Yield a Frame per CAN message and error frame"""
+        start_timestamp = self.start_timestamp
+        lazy_data = self.lazy_data
+        # Frames share one int object per arbitration id
+        ids = {}
+        for _, _, _, objects in self._iter_container_objects():
+            for data, pos, header in objects:
+                obj_type = header[4]
+                timestamp = header[7] / 1000000000.0 + start_timestamp
+                if obj_type == CAN_MESSAGE:
+                    (channel, flags, dlc,
+                     can_id) = CAN_MSG_HEAD_STRUCT.unpack_from(
+                        data, pos + OBJ_HEADER_STRUCT.size)
+                    bits = dlc & 0xF
+                    if can_id & CAN_MSG_EXT:
+                        bits |= FRAME_EXTENDED
+                    if flags & REMOTE_FLAG:
+                        bits |= FRAME_REMOTE
+                    can_id &= 0x1FFFFFFF
+                    can_id = ids.setdefault(can_id, can_id)
+                    pos += CAN_DATA_OFFSET
+                    if lazy_data:
+                        bits |= pos << FRAME_POS_SHIFT
+                        yield Frame(timestamp, channel, can_id, bits, data)
+                    else:
+                        payload = data[pos:pos + min(dlc, 8)]
+                        yield Frame(timestamp, channel, can_id, bits, payload)
+                elif obj_type == CAN_ERROR:
+                    channel, length = CAN_ERROR_STRUCT.unpack_from(
+                        data, pos + OBJ_HEADER_STRUCT.size)
+                    yield Frame(timestamp, channel, 0, FRAME_ERROR, b"")
+
+    def iter_batches(self):
+        """
+        Iterate over CAN messages and error frames as NumPy arrays of
+        FRAME_DTYPE, one array per LOG_CONTAINER.
+
+        Objects of a container are located by their size field only, all
+        other fields are gathered and filtered as columns.
+        Payload bytes after dlc are zero, error frames have no id or data.
+        Containers without any frame are skipped.
+        """
+        if np is None:
+            raise Exception("iter_batches", "numpy is not installed")
+        for (_, data, _, split,
+             positions) in self._iter_container_positions():
+            parts = []
+            if split is not None:
+                parts.append(_decode_frames(split, np.zeros(1, np.intp)))
+            if positions:
+                parts.append(_decode_frames(
+                    data, np.frombuffer(positions, dtype=np.int64)))
+            if len(parts) == 1:
+                batch = parts[0]
+            elif parts:
+                batch = np.concatenate(parts)
+            else:
+                continue
+            batch["timestamp"] += self.start_timestamp
+            if self._filtered:
+                batch = batch[self._accept_columns(batch)]
+            if len(batch):
+                yield batch
+
+    def _accept_columns(self, batch):
+        """Reader filters as a bool mask over a FRAME_DTYPE array"""
+        keep = np.ones(len(batch), dtype=bool)
+        is_msg = ~batch["is_error_frame"]
+        can_id = batch["arbitration_id"]
+        if self.ids is not None:
+            keep &= ~is_msg | np.isin(can_id, list(self.ids))
+        if self.id_mask is not None:
+            keep &= ~is_msg | (can_id & self.id_mask[0] == self.id_mask[1])
+        if self.id_range is not None:
+            keep &= ~is_msg | ((self.id_range[0] <= can_id) &
+                               (can_id <= self.id_range[1]))
+        if not self.error_frames:
+            keep &= is_msg
+        if self.channels is not None:
+            keep &= np.isin(batch["channel"], list(self.channels))
+        if self.start is not None:
+            keep &= batch["timestamp"] >= self.start
+        if self.end is not None:
+            keep &= batch["timestamp"] <= self.end
+        return keep
+
+    def read_columns(self):
+        """
+        Read the whole file into a single FRAME_DTYPE array.
+
+        Fields are reachable as columns: batch["arbitration_id"], ...
+        """
+        batches = list(self.iter_batches())
+        if not batches:
+            return np.zeros(0, dtype=FRAME_DTYPE)
+        return np.concatenate(batches)
+
+
+def _complete_split(tail, data):
+    """
+    Complete an object split at the edge of the previous container,
+    tail is its start. Return (object, position of its end in data) or
+    (None, None) when the object continues past data too.
+    """
+    # Only the object split at the container edge is copied,
+    # the rest of the container is parsed in place
+    if len(tail) + len(data) <= OBJ_HEADER_STRUCT.size:
+        return None, None
+    head = tail + data[:OBJ_HEADER_STRUCT.size]
+    obj_size = OBJ_SIZE_STRUCT.unpack_from(head, OBJ_SIZE_OFFSET)[0]
+    pos = obj_size + obj_size % 4 - len(tail)
+    if pos > len(data):
+        return None, None
+    return tail + data[:pos], pos
+
+def _decode_frames(data, positions):
+    """
+    Decode objects at positions of one data buffer into a FRAME_DTYPE
+    array, objects other than frames are dropped. Timestamps are
+    relative to the measurement start.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    heads = buf[positions[:, None] + np.arange(OBJ_HEADER_STRUCT.size)]
+    heads = heads.view(_OBJ_HEADER_DTYPE)[:, 0]
+    assert (heads["signature"] == b"LOBJ").all(), "Parse error"
+    obj_type = heads["type"]
+    is_frame = (obj_type == CAN_MESSAGE) | (obj_type == CAN_ERROR)
+    if not is_frame.all():
+        heads = heads[is_frame]
+        positions = positions[is_frame]
+        obj_type = obj_type[is_frame]
+    is_msg = obj_type == CAN_MESSAGE
+    batch = np.zeros(len(positions), dtype=FRAME_DTYPE)
+    batch["timestamp"] = heads["timestamp"] / 1000000000.0
+    batch["is_error_frame"] = ~is_msg
+    # Error frames carry only the channel, gather it separately
+    if not is_msg.all():
+        err_pos = positions[~is_msg] + OBJ_HEADER_STRUCT.size
+        channel = buf[err_pos[:, None] + np.arange(2)].view("<u2")[:, 0]
+        batch["channel"][~is_msg] = channel
+    if is_msg.any():
+        msg_pos = positions[is_msg]
+        rows = buf[msg_pos[:, None] + np.arange(_CAN_OBJ_DTYPE.itemsize)]
+        rows = rows.view(_CAN_OBJ_DTYPE)[:, 0]
+        can_id = rows["can_id"]
+        flags = rows["flags"]
+        dlc = rows["dlc"]
+        # Bytes after dlc are not part of the frame
+        payload = np.where(np.arange(8) < dlc[:, None], rows["data"], 0)
+        batch["channel"][is_msg] = rows["channel"]
+        batch["arbitration_id"][is_msg] = can_id & 0x1FFFFFFF
+        batch["flags"][is_msg] = flags
+        batch["dlc"][is_msg] = dlc
+        batch["data"][is_msg] = payload
+        batch["is_extended_id"][is_msg] = (can_id & CAN_MSG_EXT) != 0
+        batch["is_remote_frame"][is_msg] = (flags & REMOTE_FLAG) != 0
+    return batch
+
+class MergedReader(object):
+    """
+    Iterator of (filename, frame) over several Binary Logging Files in
+    global timestamp order.
+
+    Files are read in parallel streams and merged with a heap, so memory
+    does not depend on file sizes. Each file is expected to be ordered by
+    timestamp itself, frames with equal timestamps keep the file order.
+    """
+
+    def __init__(self, filenames, **reader_args):
+        """reader_args are passed to BLFReader of every file"""
+        self.filenames = list(filenames)
+        self.readers = [BLFReader(filename, **reader_args)
+                        for filename in self.filenames]
+        self.start_timestamp = min(reader.start_timestamp
+                                   for reader in self.readers)
+
+    def __iter__(self):
+        streams = [self._tag(filename, reader)
+                   for filename, reader in zip(self.filenames, self.readers)]
+        return heapq.merge(*streams, key=lambda pair: pair[1].timestamp)
+
+    @staticmethod
+    def _tag(filename, reader):
+        for frame in reader:
+            yield filename, frame
+
+
+class BLFWriter(object):
+    """
+    Writer of CAN messages to a Binary Logging File.
+
+    Messages are packed into zlib compressed LOG_CONTAINERs as they come,
+    the file header with object count and measurement time is written by
+    stop().
+    """
+
+    # Size of uncompressed data in one log container
+    MAX_CACHE_SIZE = 128 * 1024
+    COMPRESSION_LEVEL = 6
+
+    def __init__(self, filename, channel=1, start_timestamp=None,
+                 container_size=None):
+        """
+        channel is used for messages without one of their own.
+        container_size overrides MAX_CACHE_SIZE.
+
+        start_timestamp is the base for object timestamps, by default the
+        first message timestamp. Pass BLFReader.start_timestamp to keep
+        timestamps of copied frames bit exact.
+        """
+        self.fp = open(filename, "wb")
+        self.channel = channel
+        if container_size is not None:
+            self.MAX_CACHE_SIZE = container_size
+        # Header is written when the log is done
+        self.fp.write(b"\x00" * FILE_HEADER_STRUCT.size)
+        self.cache = []
+        self.cache_size = 0
+        self.count_of_objects = 0
+        self.uncompressed_size = FILE_HEADER_STRUCT.size
+        self.start_timestamp = None
+        self.stop_timestamp = None
+        if start_timestamp is not None:
+            self._set_start(start_timestamp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _set_start(self, timestamp):
+        # SYSTEMTIME keeps milliseconds, round down to stay before timestamp
+        self.start_systemtime = timestamp_to_systemtime(
+            math.floor(timestamp * 1000) / 1000.0)
+        self.start_timestamp = systemtime_to_timestamp(self.start_systemtime)
+
+    def write(self, msg):
+        """Add a Message (or any object with the same fields) to the log"""
+        if self.start_timestamp is None:
+            self._set_start(msg.timestamp)
+        channel = getattr(msg, "channel", None)
+        if channel is None:
+            channel = self.channel
+        if msg.is_error_frame:
+            data = CAN_ERROR_STRUCT.pack(channel, 0)
+            self._add_object(CAN_ERROR, data, msg.timestamp)
+        else:
+            flags = REMOTE_FLAG if msg.is_remote_frame else 0
+            can_id = msg.arbitration_id
+            if msg.is_extended_id:
+                can_id |= CAN_MSG_EXT
+            data = CAN_MSG_STRUCT.pack(channel, flags, msg.dlc, can_id,
+                                       bytes(msg.data))
+            self._add_object(CAN_MESSAGE, data, msg.timestamp)
+
+    def _add_object(self, obj_type, data, timestamp):
+        raw = max(int(round((timestamp - self.start_timestamp) * 1e9)), 0)
+        obj_size = OBJ_HEADER_STRUCT.size + len(data)
+        # flags 2: timestamps in nanoseconds
+        header = OBJ_HEADER_STRUCT.pack(b"LOBJ", OBJ_HEADER_STRUCT.size, 1,
+                                        obj_size, obj_type, 2, 0, raw)
+        self.cache.append(header)
+        self.cache.append(data)
+        padding = obj_size % 4
+        if padding:
+            self.cache.append(b"\x00" * padding)
+        self.cache_size += obj_size + padding
+        self.count_of_objects += 1
+        if self.stop_timestamp is None or timestamp > self.stop_timestamp:
+            self.stop_timestamp = timestamp
+        if self.cache_size >= self.MAX_CACHE_SIZE:
+            self._flush(final=False)
+
+    def _flush(self, final):
+        """Compress cached objects into log containers"""
+        data = b"".join(self.cache)
+        pos = 0
+        while (len(data) - pos >= self.MAX_CACHE_SIZE or
+               (final and pos < len(data))):
+            chunk = data[pos:pos + self.MAX_CACHE_SIZE]
+            pos += len(chunk)
+            compressed = zlib.compress(chunk, self.COMPRESSION_LEVEL)
+            obj_size = OBJ_HEADER_STRUCT.size + len(compressed)
+            # flags 2: zlib deflate
+            self.fp.write(OBJ_HEADER_STRUCT.pack(
+                b"LOBJ", OBJ_HEADER_STRUCT.size, 1, obj_size,
+                LOG_CONTAINER, 2, 0, len(chunk)))
+            self.fp.write(compressed)
+            # Padding bytes, as the reader expects them
+            self.fp.write(b"\x00" * (len(compressed) % 4))
+            self.uncompressed_size += OBJ_HEADER_STRUCT.size + len(chunk)
+        # Objects split at the last container edge wait for the next one
+        self.cache = [data[pos:]] if pos < len(data) else []
+        self.cache_size = len(data) - pos
+
+    def stop(self):
+        """Flush cached objects, write the file header and close the file"""
+        if self.fp.closed:
+            return
+        self._flush(final=True)
+        filesize = self.fp.tell()
+        if self.start_timestamp is None:
+            start = stop = timestamp_to_systemtime(None)
+        else:
+            start = self.start_systemtime
+            stop = timestamp_to_systemtime(self.stop_timestamp)
+        header = [b"LOGG", FILE_HEADER_STRUCT.size, APPLICATION_ID,
+                  0, 0, 0, 2, 6, 8, 1,
+                  filesize, self.uncompressed_size,
+                  self.count_of_objects, 0]
+        header.extend(start)
+        header.extend(stop)
+        self.fp.seek(0)
+        self.fp.write(FILE_HEADER_STRUCT.pack(*header))
         self.fp.close()
 
 
-def int2s(cnt):
-    def foo(val):
-        val = hex(val)[2:]
-        if len(val) < cnt:
-            for _ in range(cnt - len(val)):
-                val = '0' + val
-        return val
-    return foo
+# signature ("BLFI"), version, size and mtime of the indexed file,
+# count of entries
+INDEX_HEADER_STRUCT = struct.Struct("<4sLQQL")
+
+# container offset, bytes of a split object at the start of the container,
+# earliest and latest raw timestamp of objects starting in the container
+INDEX_ENTRY_STRUCT = struct.Struct("<QLQQ")
+
+INDEX_VERSION = 1
+
 
-head = ['timestamp', 'is_remote_frame', 'extended_id', 'is_error_frame', 'dlc', 'arbitration_id', 'data']
-head = reduce(lambda a,b: '%s\t%s' % (a,b), head)
+def index_path(filename):
+    return filename + ".idx"
 
-def to8(mess):
-    mess = list(mess)[:]
-    if len(mess) < 8:
-        for _ in range(8 - len(mess)):
-            mess.append(0)
-    return mess
+
+def build_index(filename):
+    """
+    Scan a BLF file and return [(offset, skip, first, last)] for every
+    LOG_CONTAINER where an object starts. Timestamps are raw object
+    timestamps, see BLFReader._to_timestamp.
+    """
+    index = []
+    reader = BLFReader(filename)
+    for offset, data, skip, objects in reader._iter_container_objects():
+        entry = [offset, skip, None, None]
+        for buf, pos, header in objects:
+            if buf is data:
+                _widen_entry(entry, header[7])
+            elif index:
+                # Split object belongs to the container it started in
+                _widen_entry(index[-1], header[7])
+        if skip < len(data):
+            index.append(entry)
+    return [tuple(entry) for entry in index if entry[2] is not None]
+
+
+def _widen_entry(entry, timestamp):
+    if entry[2] is None or timestamp < entry[2]:
+        entry[2] = timestamp
+    if entry[3] is None or timestamp > entry[3]:
+        entry[3] = timestamp
+
+
+def _file_stamp(filename):
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def save_index(filename, index):
+    size, mtime = _file_stamp(filename)
+    with open(index_path(filename), "wb") as fp:
+        fp.write(INDEX_HEADER_STRUCT.pack(b"BLFI", INDEX_VERSION,
+                                          size, mtime, len(index)))
+        for entry in index:
+            fp.write(INDEX_ENTRY_STRUCT.pack(*entry))
+
+
+def load_index(filename):
+    """Return the stored index or None if it is missing or out of date"""
+    try:
+        with open(index_path(filename), "rb") as fp:
+            data = fp.read()
+    except OSError:
+        return None
+    if len(data) < INDEX_HEADER_STRUCT.size:
+        return None
+    magic, version, size, mtime, count = INDEX_HEADER_STRUCT.unpack_from(data)
+    if (magic != b"BLFI" or version != INDEX_VERSION or
+            (size, mtime) != _file_stamp(filename) or
+            len(data) != (INDEX_HEADER_STRUCT.size +
+                          count * INDEX_ENTRY_STRUCT.size)):
+        return None
+    return list(INDEX_ENTRY_STRUCT.iter_unpack(
+        data[INDEX_HEADER_STRUCT.size:]))
+
+
+def get_index(filename):
+    """Load the sidecar index, rebuild and store it when it is out of date"""
+    index = load_index(filename)
+    if index is None:
+        index = build_index(filename)
+        try:
+            save_index(filename, index)
+        except OSError:
+            # Read-only location, the index serves just this run
+            pass
+    return index
+
+head = '\t'.join(['timestamp', 'is_remote_frame', 'extended_id',
+                  'is_error_frame', 'dlc', 'arbitration_id', 'data'])
+
+# timestamp, is_remote_frame, extended_id, dlc, arbitration_id, data
+CAN_LINE_FORMAT = '%s\t%s\t%s\tFalse\t%d\t%03x %s'
+# timestamp
+ERROR_LINE_FORMAT = '%s\tFalse\tFalse\tTrue\t0\t000 00 00 00 00 00 00 00 00'
 
 def mess2s(mess):
-    numsshow = int2s(3)(mess.arbitration_id) + ' ' + reduce(lambda a,b: a + ' ' + b, map(int2s(2), to8(mess.data)))
-    vals = [mess.timestamp, mess.is_remote_frame, mess.is_extended_id, mess.is_error_frame, mess.dlc, numsshow]
-    return reduce(lambda a,b: '%s\t%s' % (a, b), vals)
+    data = bytes(mess.data).ljust(8, b'\0')
+    return '%s\t%s\t%s\t%s\t%s\t%03x %s' % (
+        mess.timestamp, mess.is_remote_frame, mess.is_extended_id,
+        mess.is_error_frame, mess.dlc, mess.arbitration_id, data.hex(' '))
 
-def totxt(ipath,opath):
-    reader = BLFReader(ipath)
-    with open(opath, 'wt') as header:
+def format_objects(objects, start_timestamp):
+    """
+    Format (data, pos, header) objects of one container as text lines,
+    the layout is the same as of mess2s.
+    """
+    lines = []
+    append = lines.append
+    for data, pos, header in objects:
+        obj_type = header[4]
+        if obj_type == CAN_MESSAGE:
+            (channel, flags, dlc, can_id,
+             can_data) = CAN_MSG_STRUCT.unpack_from(
+                data, pos + OBJ_HEADER_STRUCT.size)
+            if dlc < 8:
+                can_data = can_data[:dlc].ljust(8, b'\0')
+            append(CAN_LINE_FORMAT % (
+                header[7] / 1000000000.0 + start_timestamp,
+                bool(flags & REMOTE_FLAG), bool(can_id & CAN_MSG_EXT),
+                dlc, can_id & 0x1FFFFFFF, can_data.hex(' ')))
+        elif obj_type == CAN_ERROR:
+            append(ERROR_LINE_FORMAT % (
+                header[7] / 1000000000.0 + start_timestamp))
+    return lines
+
+def open_reader(ipath, **reader_args):
+    """
+    BLFReader of a file or, for a list of several files, their
+    MergedReader. Both give frames, the source file tag is dropped.
+    """
+    if isinstance(ipath, (list, tuple)):
+        if len(ipath) > 1:
+            reader = MergedReader(ipath, **reader_args)
+            return reader, (mess for _, mess in reader)
+        ipath = ipath[0]
+    reader = BLFReader(ipath, **reader_args)
+    return reader, reader
+
+def totxt(ipath, opath, **reader_args):
+    """
+    Convert .blf (or time merged list of .blf) to .txt,
+    return count of written frames. reader_args are passed to BLFReader.
+    """
+    reader, frames = open_reader(ipath, **reader_args)
+    count = 0
+    with open(opath, 'wt', buffering=1 << 20) as header:
         header.write(head)
         header.write('\n')
-        for mess in reader:
-            header.write(mess2s(mess))
-            header.write('\n')
+        if isinstance(reader, BLFReader):
+            batches = (format_objects(objects, reader.start_timestamp)
+                       for _, _, _, objects in reader._iter_container_objects())
+        else:
+            batches = iter(lambda: [mess2s(mess)
+                                    for mess in islice(frames, 4096)], [])
+        for lines in batches:
+            if lines:
+                lines.append('')
+                header.write('\n'.join(lines))
+                count += len(lines) - 1
+                if reader_args.get('follow'):
+                    header.flush()
+    return count
 
-parser = argparse.ArgumentParser(description='convert .blf to .txt')
-parser.add_argument('blf', help='binary blf file, input')
-parser.add_argument('txt', help='output')
+def toblf(ipath, opath, **reader_args):
+    """
+    Copy frames of .blf (or time merged list of .blf) to another .blf,
+    return count of written frames. reader_args are passed to BLFReader.
+    """
+    reader, frames = open_reader(ipath, **reader_args)
+    count = 0
+    with BLFWriter(opath, start_timestamp=reader.start_timestamp) as writer:
+        for mess in frames:
+            writer.write(mess)
+            count += 1
+    return count
 
-args = vars(parser.parse_args())
+def main():
+    parser = argparse.ArgumentParser(
+        description='convert .blf to .txt or cut a smaller .blf')
+    parser.add_argument('blf', nargs='+',
+                        help='binary blf file, input. Several files are '
+                             'merged by timestamp')
+    parser.add_argument('txt', help='output, .blf output keeps binary format')
+    parser.add_argument('-j', help='threads for container decompression',
+                        type=int, default=1)
+    parser.add_argument('-f', help='timestamp from', type=float, default=None)
+    parser.add_argument('-t', help='timestamp to', type=float, default=None)
+    parser.add_argument('--ids', help='hex arbitration ids: 3f,7ff',
+                        default=None)
+    parser.add_argument('--channels', help='channels: 1,2', default=None)
+    parser.add_argument('--no-errors', help='drop error frames',
+                        action='store_true')
+    parser.add_argument('--follow', help='wait for new data of a file '
+                        'which is still being written, stop with Ctrl+C',
+                        action='store_true')
+    args = vars(parser.parse_args())
+    reader_args = {
+        'workers': args['j'],
+        'start': args['f'],
+        'end': args['t'],
+        'error_frames': not args['no_errors'],
+        'follow': args['follow'],
+    }
+    if args['ids']:
+        reader_args['ids'] = [int(id, 16) for id in args['ids'].split(',')]
+    if args['channels']:
+        reader_args['channels'] = [int(c) for c in args['channels'].split(',')]
+    started = time.time()
+    convert = toblf if args['txt'].lower().endswith('.blf') else totxt
+    try:
+        count = convert(args['blf'], args['txt'], **reader_args)
+    except KeyboardInterrupt:
+        # Normal end of --follow, output is flushed by the writers
+        return
+    elapsed = max(time.time() - started, 1e-9)
+    print('%d frames in %.2f s, %d frames/s' % (count, elapsed, count / elapsed))
 
-totxt(args['blf'], args['txt'])
\ No newline at end of file
+if __name__ == '__main__':
+    main()
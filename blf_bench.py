@@ -0,0 +1,275 @@
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # Not on Windows, peak memory is not reported there
+    resource = None
+
+import blf
+from blf import BLFReader, BLFWriter, Message
+
+
+def generate(path, frames, ids=64, skew=1.0, extended=0.1, errors=0.001,
+             container_size=BLFWriter.MAX_CACHE_SIZE, seed=0):
+    """
+    Write a synthetic .blf of frames CAN frames.
+        ids            - count of distinct arbitration ids
+        skew           - zipf exponent of id frequencies, 0 is uniform
+        extended       - ratio of ids which are 29 bit
+        errors         - ratio of error frames
+        container_size - uncompressed LOG_CONTAINER size. Sizes which are
+                         not a multiple of 48 split CAN objects across
+                         containers.
+    """
+    rnd = random.Random(seed)
+    id_list = []
+    for _ in range(ids):
+        if rnd.random() < extended:
+            id_list.append((rnd.randrange(0x800, 0x20000000), True))
+        else:
+            id_list.append((rnd.randrange(0x800), False))
+    weights = [1.0 / (rank + 1) ** skew for rank in range(ids)]
+    # constant payload per id changed now and then, like cyclic traffic
+    payloads = [bytes(rnd.randrange(256) for _ in range(8)) for _ in id_list]
+    timestamp = 1577880000.0
+    with BLFWriter(path, container_size=container_size) as writer:
+        chosen = rnd.choices(range(ids), weights, k=frames)
+        for i in chosen:
+            timestamp += rnd.expovariate(5000.0)
+            channel = 1 + i % 2
+            if rnd.random() < errors:
+                writer.write(Message(timestamp=timestamp, is_error_frame=True,
+                                     channel=channel))
+                continue
+            if rnd.random() < 0.05:
+                payloads[i] = bytes(rnd.randrange(256) for _ in range(8))
+            can_id, is_extended = id_list[i]
+            writer.write(Message(timestamp=timestamp, arbitration_id=can_id,
+                                 extended_id=is_extended, dlc=8,
+                                 data=payloads[i], channel=channel))
+
+
+def run_iter(path):
+    count = 0
+    for _ in BLFReader(path):
+        count += 1
+    return count
+
+
+def run_batches(path):
+    return sum(len(batch) for batch in BLFReader(path).iter_batches())
+
+
+def run_export(path):
+    fd, out = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        return blf.totxt(path, out)
+    finally:
+        os.remove(out)
+
+
+def run_kept(path):
+    frames = list(BLFReader(path))
+    return len(frames)
+
+
+PATHS = {
+    'iter': run_iter,
+    'batches': run_batches,
+    'export': run_export,
+    'kept': run_kept,
+}
+
+
+def _child(name, path, results):
+    try:
+        started = time.time()
+        count = PATHS[name](path)
+        elapsed = time.time() - started
+    except Exception as e:
+        results.put((None, '%s: %s' % (type(e).__name__, e)))
+        return
+    peak = None
+    if resource is not None:
+        # bytes on macOS, kilobytes on Linux and other systems
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak *= 1024
+    results.put((count, (elapsed, peak)))
+
+
+def measure(name, path):
+    """
+    Run one path in a fresh process, so peak memory belongs to it alone.
+    Return {frames, seconds, mb_s, frames_s, peak_mb}, raise if the
+    path failed or its process died.
+    """
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_child,
+                                      args=(name, path, results))
+    process.start()
+    while True:
+        try:
+            count, result = results.get(timeout=1.0)
+            break
+        except queue.Empty:
+            if not process.is_alive() and results.empty():
+                process.join()
+                raise Exception(name, 'process exited with code %s' %
+                                process.exitcode)
+    process.join()
+    if count is None:
+        raise Exception(name, result)
+    elapsed, peak = result
+    elapsed = max(elapsed, 1e-9)
+    return {
+        'frames': count,
+        'seconds': elapsed,
+        'mb_s': os.path.getsize(path) / elapsed / 1e6,
+        'frames_s': count / elapsed,
+        'peak_mb': None if peak is None else peak / 1e6,
+    }
+
+
+def run_suite(path, names):
+    results = {}
+    for name in names:
+        if name == 'batches' and blf.np is None:
+            print('%-8s skipped, numpy is not installed' % name)
+            continue
+        try:
+            results[name] = measure(name, path)
+        except Exception as e:
+            print('%-8s failed, %s' % (name, e.args[-1]))
+    return results
+
+
+def report(results, baseline=None):
+    print('%-8s %10s %8s %8s %12s %9s' % (
+        'path', 'frames', 'sec', 'MB/s', 'frames/s', 'peak MB'))
+    for name, res in results.items():
+        peak = '-' if res['peak_mb'] is None else '%.1f' % res['peak_mb']
+        line = '%-8s %10d %8.2f %8.1f %12.0f %9s' % (
+            name, res['frames'], res['seconds'], res['mb_s'],
+            res['frames_s'], peak)
+        if baseline and name in baseline:
+            base = baseline[name]
+            line += '  frames/s %+.1f%%' % (
+                (res['frames_s'] / base['frames_s'] - 1) * 100)
+            if res['peak_mb'] and base.get('peak_mb'):
+                line += ', peak %+.1f%%' % (
+                    (res['peak_mb'] / base['peak_mb'] - 1) * 100)
+        print(line)
+
+
+class DictMessage(object):
+    """Message record as BLFReader used to yield it, with a __dict__"""
+    def __init__(self, **args):
+        self.timestamp       = args['timestamp']
+        self.arbitration_id  = args.get('arbitration_id', 0)
+        self.is_extended_id  = args.get('extended_id', False)
+        self.is_remote_frame = args.get('is_remote_frame', False)
+        self.dlc             = args.get('dlc', 0)
+        self.data            = args.get('data', [])
+        self.is_error_frame  = args.get('is_error_frame', False)
+
+
+def to_dict_message(frame):
+    msg = DictMessage(timestamp=frame.timestamp,
+                      # own int per frame, as unpacked by the old reader
+                      arbitration_id=frame.arbitration_id + 0,
+                      extended_id=frame.is_extended_id,
+                      is_remote_frame=frame.is_remote_frame,
+                      dlc=frame.dlc,
+                      data=bytes(frame.data),
+                      is_error_frame=frame.is_error_frame)
+    msg.channel = frame.channel
+    return msg
+
+
+def measure_frames(path, convert=None, **reader_args):
+    """
+    Load every frame of path into a list and return
+    (count of frames, allocated bytes, seconds).
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.time()
+    reader = BLFReader(path, **reader_args)
+    if convert is None:
+        frames = list(reader)
+    else:
+        frames = [convert(frame) for frame in reader]
+    elapsed = time.time() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(frames), size, elapsed
+
+
+def bench_memory(path):
+    """Memory per kept frame: old Message objects against Frame records"""
+    cases = [
+        ('Message', to_dict_message, {}),
+        ('Frame', None, {}),
+        ('lazy', None, {'lazy_data': True}),
+    ]
+    for name, convert, reader_args in cases:
+        count, size, elapsed = measure_frames(path, convert, **reader_args)
+        print('%-8s %d frames, %.1f bytes/frame, %.2f s' % (
+            name, count, float(size) / max(count, 1), elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='benchmarks of blf.py reader and exporter')
+    parser.add_argument('blf', help='binary blf file, generated with -g')
+    parser.add_argument('-g', help='generate the file with that many frames',
+                        type=int, default=None)
+    parser.add_argument('--ids', help='distinct ids of generated frames',
+                        type=int, default=64)
+    parser.add_argument('--skew', help='zipf exponent of id frequencies',
+                        type=float, default=1.0)
+    parser.add_argument('--errors', help='ratio of error frames',
+                        type=float, default=0.001)
+    parser.add_argument('--container', help='uncompressed container size',
+                        type=int, default=BLFWriter.MAX_CACHE_SIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-p', help='paths to run: ' + ','.join(PATHS),
+                        default=','.join(PATHS))
+    parser.add_argument('--save', help='store results as baseline json')
+    parser.add_argument('--baseline', help='compare with baseline json')
+    parser.add_argument('--memory', help='bytes per kept frame by record type',
+                        action='store_true')
+    args = vars(parser.parse_args())
+    if args['g']:
+        generate(args['blf'], args['g'], ids=args['ids'], skew=args['skew'],
+                 errors=args['errors'], container_size=args['container'],
+                 seed=args['seed'])
+    if args['memory']:
+        bench_memory(args['blf'])
+        return
+    baseline = None
+    if args['baseline']:
+        with open(args['baseline']) as fp:
+            baseline = json.load(fp)
+    results = run_suite(args['blf'], args['p'].split(','))
+    report(results, baseline)
+    if args['save']:
+        with open(args['save'], 'wt') as fp:
+            json.dump(results, fp, indent=1)
+
+
+if __name__ == '__main__':
+    main()
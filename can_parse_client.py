@@ -0,0 +1,53 @@
+'''
+	thin client of can_parse_util --serve daemon, sends command line to the
+	daemon and prints its answer
+	it has no bases and imports nothing heavy, so it starts as fast as the
+	interpreter, can_parse_util --connect runs it before its own imports
+'''
+import os
+import socket
+import sys
+
+def socket_path(argv):
+	''' value of --connect in argv, None if there is no --connect '''
+	for i, arg in enumerate(argv):
+		if arg == '--connect':
+			return argv[i + 1] if i + 1 < len(argv) else None
+		if arg.startswith('--connect='):
+			return arg[len('--connect='):]
+	return None
+
+def encode_request(cwd, argv):
+	''' cwd and argv joined by NUL, which no path or argument can hold '''
+	return b'\0'.join(os.fsencode(arg) for arg in [cwd] + list(argv))
+
+def decode_request(data):
+	''' (cwd, argv) of encode_request '''
+	fields = [os.fsdecode(field) for field in data.split(b'\0')]
+	return fields[0], fields[1:]
+
+def connect(path, argv):
+	''' send argv to daemon at unix socket path and print its answer '''
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+		sock.connect(path)
+		sock.sendall(encode_request(os.getcwd(), argv))
+		sock.shutdown(socket.SHUT_WR)
+		while True:
+			chunk = sock.recv(1 << 16)
+			if not chunk:
+				break
+			sys.stdout.buffer.write(chunk)
+	sys.stdout.flush()
+
+def main(argv=None):
+	if argv is None:
+		argv = sys.argv[1:]
+	path = socket_path(argv)
+	if not path:
+		print('--connect needs socket path', file=sys.stderr)
+		return 2
+	connect(path, argv)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
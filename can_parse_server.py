@@ -0,0 +1,118 @@
+'''
+	daemon of can_parse_util --serve, keeps bases loaded and answers
+	command lines sent by can_parse_client
+	imported only by --serve, so other runs do not load socket and
+	threading modules
+'''
+import io
+import os
+import signal
+import socket
+import socketserver
+import stat
+import threading
+from can_parse_client import decode_request
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+	''' request is encode_request up to EOF, answer is output text '''
+	def handle(self):
+		out = io.TextIOWrapper(self.wfile, encoding='utf-8')
+		try:
+			data = self.rfile.read()
+			if not data:
+				# connect without request, e.g. liveness check of new daemon
+				return
+			try:
+				cwd, argv = decode_request(data)
+				self.server.answer(cwd, argv, out)
+			except Exception as e:
+				print('error: %s' % (e,), file=out)
+			out.flush()
+		except (BrokenPipeError, ConnectionResetError):
+			# client has gone
+			pass
+		finally:
+			out.detach()
+
+class UtilsServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+	'''
+		daemon of --serve, Utils of every architect is loaded once and
+		shared by request threads
+	'''
+	daemon_threads = True
+
+	def __init__(self, path, app, utils, cache_size=4096):
+		# app is can_parse_util module, it may run as __main__
+		self.app = app
+		self.utils = {utils.arch : utils}
+		self.default_arch = utils.arch
+		self.cache_size = cache_size
+		self._lock = threading.Lock()
+		# socket of dead daemon is stale, anything else is not ours
+		try:
+			if not stat.S_ISSOCK(os.lstat(path).st_mode):
+				raise FileExistsError('not a socket: %s' % path)
+			with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+				sock.connect(path)
+			raise FileExistsError('daemon is running: %s' % path)
+		except ConnectionRefusedError:
+			os.unlink(path)
+		except FileNotFoundError:
+			pass
+		super().__init__(path, _RequestHandler)
+		self.inode = os.stat(path).st_ino
+
+	def get_utils(self, arch):
+		with self._lock:
+			utils = self.utils.get(arch)
+			if utils is None:
+				utils = self.utils[arch] = self.app.Utils(arch,
+					self.cache_size, threading.Lock())
+				utils.index
+			return utils
+
+	def answer(self, cwd, argv, out):
+		try:
+			args = vars(self.app.build_parser().parse_args(argv))
+		except SystemExit:
+			print('incorrect arguments', file=out)
+			return
+		# paths of client are relative to its directory
+		if args['l']:
+			args['l'] = os.path.join(cwd, args['l'])
+		if args['o']:
+			args['o'] = [os.path.join(cwd, path) for path in args['o']]
+		if args['index']:
+			self.app.run_index(args, out)
+			return
+		# statistics of shared cache mean nothing to one client
+		self.app.run(self.get_utils(args['a'] or self.default_arch), args, out, None)
+
+def _terminate(signum, frame):
+	raise SystemExit(0)
+
+def serve(path, app, arch, cache_size=4096):
+	''' answer requests on unix socket path until Ctrl+C or kill '''
+	# decode cache is shared by request threads
+	utils = app.Utils(arch, cache_size, threading.Lock())
+	# lazy tables are built before threads share them
+	utils.index
+	try:
+		server = UtilsServer(path, app, utils, cache_size)
+	except FileExistsError as e:
+		print(e)
+		return
+	# socket is removed on kill as on Ctrl+C
+	signal.signal(signal.SIGTERM, _terminate)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+		# path may be taken by another daemon since
+		try:
+			if os.stat(path).st_ino == server.inode:
+				os.unlink(path)
+		except FileNotFoundError:
+			pass
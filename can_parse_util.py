@@ -1,11 +1,30 @@
 
-import bz2
+import sys
+if __name__ == '__main__' and any(arg == '--connect' or arg.startswith('--connect=')
+		for arg in sys.argv[1:]):
+	# client of --serve daemon does not need bases, skip imports below
+	import can_parse_client
+	sys.exit(can_parse_client.main())
+
 import binascii
-import json
+import marshal
+import zlib
 import argparse
 from bitarray import bitarray
 import struct
 import re
+import os
+import bisect
+from fnmatch import fnmatchcase
+import heapq
+from array import array
+from collections import OrderedDict
+import can_bases
+
+def _numpy():
+	''' numpy is needed only for payload columns, import it on demand '''
+	import numpy
+	return numpy
 
 INT1 = struct.Struct('>B')
 INT2 = struct.Struct('>H')
@@ -18,6 +37,45 @@ def bits_to_int(bits):
 		acc = (acc << 1) | b
 	return acc
 
+# every byte with reversed bit order
+BIT_REVERSE = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+def payload_to_ints(payload):
+	'''
+		8 payload bytes to (msb_first, lsb_first) integers
+		msb_first - bit i of the message is bit 63 - i
+		lsb_first - bit i of the message is bit i
+	'''
+	payload = bytes(payload).ljust(8, b'\0')
+	return (int.from_bytes(payload, 'big'),
+		int.from_bytes(payload.translate(BIT_REVERSE), 'little'))
+
+def payload_column(payloads):
+	'''
+		payloads as numpy uint64 array, same integers as msb_first of
+		payload_to_ints. payloads is (n, 8) uint8 array, like "data"
+		column of blf.FRAME_DTYPE, or list of bytes
+	'''
+	np = _numpy()
+	if not isinstance(payloads, np.ndarray):
+		payloads = b''.join(bytes(p).ljust(8, b'\0') for p in payloads)
+		payloads = np.frombuffer(payloads, dtype=np.uint8)
+	payloads = np.ascontiguousarray(payloads, dtype=np.uint8).reshape(-1, 8)
+	return payloads.view('>u8')[:, 0].astype(np.uint64)
+
+def compile_signal(b_start, b_len, is_big):
+	'''
+		(index in payload_to_ints, shift, mask) to get signal value
+		same as slicing bitarray of message, reversing it for big endian
+		and folding bits with bits_to_int
+	'''
+	end = min(b_start + b_len, 64)
+	mask = (1 << max(end - b_start, 0)) - 1
+	if is_big:
+		# reversed slice: first bit of the slice becomes the lowest one
+		return (1, b_start, mask)
+	return (0, 64 - end, mask)
+
 class CanTemplate(object):
 	"""
 		docstring for CanTemplate
@@ -28,28 +86,57 @@ class CanTemplate(object):
 		self.name    = name
 		self.id      = id
 		self.signals = {sig['N'] : (sig['SB'], sig['BL'], sig['BE']) for sig in signals}
+		# signame : (index in payload_to_ints, shift, mask)
+		self.compiled = {name : compile_signal(*sig) for name, sig in self.signals.items()}
 	def get_val(self, signame, can):
-		signal = self.signals[signame]
-		b_start = signal[0]
-		b_len   = signal[1]
-		is_big  = signal[2]
-		val = can[1][b_start:b_start + b_len]
-		if is_big:
-			val.reverse()
-		return bits_to_int(val)
+		return self.extract(signame, payload_to_ints(can[1].tobytes()))
+	def extract(self, signame, ints):
+		''' value of signal from payload_to_ints result '''
+		index, shift, mask = self.compiled[signame]
+		return (ints[index] >> shift) & mask
+	def decode(self, can):
+		''' all signals of message as {signame : value} '''
+		return self.decode_payload(can[1].tobytes())
+	def decode_payload(self, payload):
+		''' same as decode for raw payload bytes '''
+		ints = payload_to_ints(payload)
+		return {name : (ints[index] >> shift) & mask
+			for name, (index, shift, mask) in self.compiled.items()}
+	def decode_column(self, payloads, signals=None):
+		'''
+			decode signals of all frames at once
+			payloads - uint64 numpy array, see payload_column
+			returns {signame : uint64 array}
+		'''
+		np = _numpy()
+		if signals is None:
+			signals = self.compiled.keys()
+		payloads = np.asarray(payloads, dtype=np.uint64)
+		ints = [payloads, None]
+		result = {}
+		for name in signals:
+			index, shift, mask = self.compiled[name]
+			if index == 1 and ints[1] is None:
+				# lsb_first: reverse bits of every byte, read as little endian
+				rows = payloads.astype('>u8').view(np.uint8).reshape(-1, 8)
+				bit_reverse = np.frombuffer(BIT_REVERSE, dtype=np.uint8)
+				ints[1] = bit_reverse[rows].view('<u8')[:, 0].astype(np.uint64)
+			result[name] = (ints[index] >> np.uint64(shift)) & np.uint64(mask)
+		return result
 	def compare(self, can1, can2, signals=None):
 		if signals is None:
 			signals = self.signals.keys()
 		if can1[0] != can2[0]:
 			return False
+		ints1 = payload_to_ints(can1[1].tobytes())
+		ints2 = payload_to_ints(can2[1].tobytes())
 		for name in signals:
-			if self.get_val(name, can1) != self.get_val(name, can2):
+			if self.extract(name, ints1) != self.extract(name, ints2):
 				return False
 		return True
 	# exclude zeroes
 	def split_to_signals(self, can):
-		for name in self.signals.keys():
-			val = self.get_val(can, name)
+		for name, val in self.decode(can).items():
 			if val != 0:
 				yield (name, val)
 	def contain_signal(self, signame):
@@ -65,20 +152,14 @@ class CANBase(object):
 			where 
 				signals = [{'N' : name, 'SB' : start big, 'BL' : bit len, 'BE' : is big endian, 'O' : offset}]
 	"""
-	zip_base = {
-			"Atlantis" : {
- 				"BHCAN": b'425a68393141592653597073cace00895a5f80100050077ff03ffffffabfeffffa6023be40000fb0bde779d703476d7ca444e6eedd9e77cab73acedae3bb95aad68e17b9c501eada4236f82d03aa02da0da407b9e8000701e2faf5c814090505090fb339322bdbca5069a2020010640694c053d0a7a9eca689e88c87a806a7a0c8aa9ea6a69a032620680d18021a340001298888946349341a06800000000001269224108d29e6a9fa8c04d1911a03400d00004d4a5144f53468d0d000d000000680000449082010641323113025309ea646d4c991a1a3b7758a5de05a5419452ca54ac52d2a0d44d2a0caaa9562220085110041f8e5fbff3a755fb3bf970fb441247121dfc11fc11ea473abe4c3b751e958fdcfc89282e8f1627fc7cdc12f6eb47de22982d9956c4a7dcecaa249c9599155779fe0d56cf07016d296d2b6db6b129332fe29f7649d6b6dd64d2c8ad9658c4a5869fe69a2a790cfa3e3ea231159a49282cf20b4c14426b6db36252d32cc8d87ad7c5a9650302966340b62b6db6b1296998e0771aa6a2db38b9dc20fe127e068a7d062a3037125072c85529fe0a92f5fcaf5b32bc4ed5a617495d0f5faa87e1f28c5ea11ee739c34b662580c8e4494118c9472a16fdcb9c1528d5ed73fcd98ddabc6d76d7e73b88c70161c49282063f0a352369e677910af7b23612bb0788d6bc45f68bcde49412a163b20f6f02371ea7c5fcfa70ba039979a2c5c22ad360d9b6f7d3f3ef94b75760dbb06476925038f2b79d34f1ff7d69e34ce56033dd571686fe5d1dd33abf194c386d6179da4940e32949d4ba8e565b173be00e4ebdece54e245e494498bed179bc9283b5ebb25c5b2dd5118bbaf2baeaa9c7c6a5ab47be2b0d5d745f98a2cddd21b2de8e7f2a29d6cd8e1891cfc3164aed5deaa48e7534f37a39d06a22e8b9dfd793f47ffadebb8beeac32f87d979bdd0dd1bca62408982ac145d6b39e66504a0a19eaeab5e22715f4f283129e65f471137099892506876dd6696aed24a6050532f0d8a31ad49c48aa428b28b608d252505768c3b968fec8889446eb145b4a92c44775d5ee7283b77db5cc617a8b2bb1891bc8f85758af650c05716f47732c7c4d87121c43643d776cb9f1e7a4f2b7ace5f6dbfe62887f8801f141010fd45bbe2ad250c5e0a22e7038ac196299955b51b52655aadaaaca4b51ab52ad81834a6b44695193988b89a45b430c588d1a40560ab0481e0a827b080abb7edbbf1f7ab7e2f624bf3fdcdfbc5f17b6b06f70ddcf87324713659128edab690d51398b02daa0b209cb32a0883171228de2869dceee11b8a353928d999a8306a225c9d3b896cca61c10d0512afa74ebd3bc0bca95064a41852d48807dedfdf8512a96fcaf855e05e3bfcdfb3bf755074a6e845cdbecafc9a709b5b64ded47f583b0df962eae8a6feea9a16326445c5f18b3181481102d27bdc9382c22bc6dddcddd6d6d1b4b1d21068b19b2cd8a56846fc6fa46239adb1abc658c6bffc110041c1fc5f2c1e8009372cdcc22e7b0823416306aaaaa8e2468654fbdb82225eb77776b880031854a117a1878a7800b0e64c61a3cd8ca7a1ee1e003444c8dc7b992de39aa21b7466b2499791590aa49a8114e54286af1eeddddea59895dddeb3bbbb77555351356964c68cd98983394f1a72aa526e44bdb930ece5ec59c899a5422b77798758420eccadc7b77777630c72d290d84ac3ade54ccced952e242e39d444e2ddf0f966165eeb504b76dbb6ddb6f6a80168d20098a6f9aa8892210422ae652bb12288d16d89892e678848ac430ab2cae5c3455c13408aa7b4b8007b702d33c70e582093c81b1a206352d2695c12d50d3d9dae576ee0ec1c1c1d8383a8e0ea383a958ac50bd6ecb2d8d8d180c969a13e1f068661be74a26deb520c0dd88e2a260920739cc3465c8139028994ee12e09454e1b773235136f0a0e6290dc0e51afdd2555555555555e739f3dc81c11e0dd09ccd9d4c9cc3658f1616d8f5cc055d043475b9d3a998a1b38ab25519001a6724aa0e775554cad6d8f74040e9bc90810eb4cd661b79a1c735515551555555b00a98972eb6d34d395a752e1ca9a8a6ed58a5aeba0ead45d34d1cd8ac1406390da5b86a80b4ca45a325ca20a25ceb77c5bce0c8449289a10c11c2c596db7c57477c82cae15ea0d1c30483238218a848b69d338d58d0e10c3700b24964035696665c931aa47909cc4e6e89abbe39d335c50521c735a495c1a22aab61ac272345e2839acd37404c5c04d3444858c78db6e80c030984daace37aa164bbaaad4e04885a464e34192967071a79794a190a9806a80fbca283df950774853d78bc7a2ecd495b4a9b14bc3a973126d49b2777554e6a9005081310a30207620f667da9d2f7f1dfd2e3732df66b68762a4f61da331d3a700088c23a890e751536af9020935acd255ad69694bb582a7346489dbac574020a10da19add862a04c869454b2487442121a481144bb34a1b5576b13a60975d295cbadb5c6f7942661d2aabf81b32aaa004df830ab00b6c01d804801a1005dd00c02c4009b00ce9a8552089fb222220444f4b3d3cab511fa96b0470a2703833888c6b6bafba0a1e55b87770f1d7af6f0aeea4521828b15c4041a165b15cf71657b8b329300a6f0e38d4b7439081a6000a40052414020482b904bd1fccebed30026573dedc5c7f1a39e608603702cb8b96596428e33d4a935a376baf968206594cca0cb2c23303489059b091a86fc8071ae211dc588ef5a016d72435aa2674ae37e485803a6ec5c1a76e814b190d6a064c9cfebc2fd92d55ff45abe05aaabeaf6fb359d9bc7915793f9c06387b424289d2ea24ea02cf789ee518ea59f257c1fb5d076d869cbaf7f8f9e7bde4f61f97bbbfd5f0b1c65077c1f6e677b2f52d177a4e0dd312705a85cbc6d966622f09554803124322115404220d4910427ba800edb7bff6633cfa6886758cba5b08de1428e8a0d1cd0177bc09279dbcaa998e50a464aa2a30f641dc19fd4e2992a752a081b0f1a57a74734418f3db2e81e1cb5cbaf5861bb48e9bc6e76fe9d3d31e744f89500055551b050aeadca1e1ccce2ce66534e8a94b5a4ddccb6005cf0a604ac95801c7c0ea4a0b41479712ee56594577c9df6048e8321e2bba082b04b42109b08b08da1f66d86e1546aa6fb9eb687d6e8c602184b2cadc03dbf06d912b6d3be451e5d4c584522a02d290c326616c5ef8a200456cade38858bd10c62e06a2e141482c2f146956016825a23da48657206fc61303b443104ed55c610bd53966858b20d2ef56615ad6f64ba796b5264d0525b2086792e8066249288704a024a21417111224ec70c6773ea88368a172c2c090c144e615084946c77b49ab76d42284992251ac94571d7c1dd37cf1ba2577801b7bb0b0aa99ad8f28e9d97a57558850614050ccd1786601487cdc50560825012454a1aebaeaed15d94b0ae96ed9bde54bebec3eb9aa92a9cedbb570b76468e2a05c909186dcdddef2d2c919225db919092ef086d118082495520b47103be6fa665786f9d162c632292a8aa7d76db00ebc66baa431558ec9347978df97bf839f5e0bd872bd7b34574d02b63c9715d92e09365ab49d9105cbbaaa65026271ad0017d81c52168572ab888b0667b80024b659285961a5a8b5ce58fb2de6975c3c0771a51c43519042751bdaad5d97ab470c08659259265a239aa8d645da49274ce2f9e55d88ec9a8155dbee6baa884ab5898723dcae104180759d9d737e1b7cf1cdf6ae5f69b10ad52b84b8496a3156ee9b61cbd9d84e9d6f2f7d119311da6c7bf0c33b86708123b35bdd989a10caaa692a18162aa2227cfc4a3fafc3f313f4fdc666716e39903dd0b90fd74a95f4cf62ae8e407f5730f3f857d8da2b9941e971a2d71602c173f3e1ebd5f074df359bb881edfb803e524825822871a003338848f57effcc2d8578699ff0fe527dcf12578a83dfd501d2f47dcfe5e37e8f18bec115caa979f24bc17da8a3c66e9abc3764a83a5cba5cab0a0f5ae2e4a891f38137fa747bbddeef1f09efe0ea4f9fd2aaaaaaaaaaaaaaaaaaa22a2b13092df778fb6ce9c4f03f8bd0eef9cc5b9d1e30840e3b178e254fe71a8c99fa4e244c86f678dc6a0b2d406a010e972968285b8584bc84527aa90240970b205a2521548a63d6e16be602f7ff00dd9e67524067825d23c1eceff713dfdbdcaaaaaabe3a06c932ba3fd258bc90a2019ecc77f917f39b3c35409f05f77aa5c90f8fa3eeb1a86d81c6c21d5d9d3598b785085b9205ccd57bf89903b85b855405a9a440a1ee55cc1f4481a9a1fa648128eef756a908b80eb9cbb4fa7fe17011328f39e5dd4fb04d3a13bcb0ff7e7f6953d7d840558877426bc1d01608f8631f60f743c8ba079204f30fe46ba1a21f0da89b81345313e667830013c902c81cb34dc62a10371135f9b62d42db0165c5e9c4196ef49d9bfe14ce2231846119090d050134154c3206f308143813aced4085293a29f7b6510bc0edf8ef78e21320a39b415cac75b717cdcdd9d694dece7fa6fcb2a2753bfbca7bcbe1bada5e243b0a19892aaaafa4b5555557adbda0527bbc2f5f31bdbe83afc73cae9383cb3c19c39d9b7530a7efb31f8e7834b78f508ca55baa744d73923eca5d760a796c84f444399bf53dc5a269aa2bf00d4d66844c5b4628aaae43b887d59a151ec360388734ced1f0be5729cac4fc16ef0c343c6137faaaf4ec12be5e816413c4ea366942dcc3b2d9e4967b2058c8d4c27be061e4dd4eef02e7227cffaf327d4873dbf09bf40e9358173a145778bc9f5b21966f73cc81e2202ad67957c8294760d9028d81b2f252f109303817dab42c52ad3824780f46788b15545145141453aec0f98fb587bee438e564ea6bb3b5a305188b249ed8529db2d3d65a294f5e604831800ac1934c2864429b832818762edaf7716787bb31dcf1d4a34af59e4e0a8952e7e6e8589ee3440dbf3d9b8ecdd7be38079943dce6a3bfdaeedf7818edb6ddb1dc6db6d86db6db158a1256816db6d8492490612495a052495a052495a042492b4084925681b2a1256810924ad0384666666606924ad02db6d057776ed06db763124963159dc9a70f29dde28492a506a55dddea6da0c48a17608e2e7740e7c239c20f367bb7f10c2677cdf8e2f8f7682be79bb2df586dd28ae2962650caa8dd0bd583c9902b000826124dae15f4212234100c0186f7679f7f61d61944d73dd7be9b2f320bc3b2208087338f58113c73ec317229d5e3a9157e148162654878ed40cf1094abf91140e47ea787af69810157c01f2e68191bfe5102deb0e1d003995628eaea260061d4ab0264657f5c78ba9af1f1fcfcade780eb14ef6010aba427bafd61c91c001fabf1e21605d3a805b0501002c035a80bda73b9dbe629de66678376b08f00926ed5034640f32fd25410cf4d39fa5557e016aaefe8daf0736e7dafe80743d81821c9dec920d76e80b9ca25cf95081a22445ed1a0c5288644f25f18f5213a72221e115a431dd64b5bb4997c26e0ee4cb84cb8f81c7338e5a058b83d67985070ed8733b6f237efb96317b964c8afadc2d816440d917ce03634a3dd970b6c4db24a0891fb93d0ee05e7e5d960735412f47ba03ed67a450d7cbdfa080abc260c8da58034d02a252b9f684eab9bccdf109009009075d0d4f30edf70583400f212d0361b051e38a5adb484bdcc21409980f2e4ab84bc12e6c519e4de1d78cfcea8491913c86c11330da5ab26c8dcef241b95037c0a5a1ee78248311200a6601cc379305f8791811aa82393751c8749be634da5fb421619f500c06d96c92881a9e9b8870c1d0432b08623b1414812920462057304a44896b5565ff29bc61e8f1457589b845bd95c1c5ef45fe85cd69634afdd87b910cee61f9f45851afeb3f0c07da9b681f99b831b87eb5f07d51e525d95dec30faf0f593cdea29f3c69671f8a814b862277d1ab473c558c4e028a037c8fbd3e4d47d699783ef72d60ab2835516bac76bfa41e3e5407ce89d943a4af7cc3dd639f6464ce634b7d35d2baa44de5102908482282f6650cec0e99e63d87e241e3b6803fa26cfcf4553d494876405295da03dd02503fb2c86a04fcbfbc433c8ca21c4181c9935248cce57eeb243cff72aaaaaaaaaaaaaaaaaac5628ac9b0ee3eee4071213ed4a01fc2a59d9c7c77d8b5a8aaafd25e75cc629aaa0e8e626f0f0e3d9573bebbf36d56cc30cf31a02ef8646106f41594fd0973b40d68cc205deb55a30597b10f440fef73b0f3f04ecd39d807cecf88ac20c2027e871f585e543b3b0d6b540de83cb5ea1d903c8f1b3aadcaf60a50292fa9a70ab18a2a5602777e9c46da75f61dd99651f7206e0e1698429f7d040950864506edbe37dc17b9413905deabf0743936b685403e0440fe8a92fd452f16ee61b0d86c361b0d86c888484009444250210081ad97d43dbabb15f1c17c4fd7e3ebf4fcbda1edeafaa9d38363e316bd4044954483da2f77b8e9d1ef9db655de8f4cc97790825e1ca3b3d907bfa38cf4eb48532df4bb26abaf77763eeef783862fa5eeedea1672e5cb972e5c34e5c9acd0908968f9fdb4b74c31c347638e38dd8e31c6f7d54d7bb76edb28e14c9b0a1d8618616e1847074edf70079711a8da2630c26c0b09104a025ff0df42226f158df7912e29451efdd0d2d95da5eed34d34befd23a707d54e1b2fe11833e77ba4c20cccf946518afd80b424f6bd022532d8800ba1bd9df4eef8f31d01044b3f6d8c3da51b41241276ba56c84b29768fdf28e554d819f93082727fd41249ab585146b075daf0a7a63ac75eafaa9af76bcf6ca3d072979f9f31533306df280c510a09b72563dd7d8931ee3eee8849f96134da2741f294768eff701cf0f4444f0d687d7ad2ed75d7763aeb1d7abeaa72d77ee8c3da3cf9641103c7777fc06d87c84b3c68a33a9d3cf3cf6e79c73d8faa9af3cf3ce515ecfe247200025113be8d3bfbc58ca19b98950182fa851c32a2de0f770e1c386fe1c23c337d54f0bf8708c2f78442839c867bfc58371ee63f383dc3bd7b41de25f11e5f3ecf93d44dcb37cdbf4f4756e9765b182e9dca2d0f77e825bfc48dc83cfc790f9f10eed3e571090040e9855a6cbc6426365df80793efb23f9036f08c77d78742dd47c7e9eb88aaef5a9debebebebe9cfd63eae9d5dbe1db541eb7c21084210e9bf2a72b972cb26c9ea08c8b8e2e0f9e58d9564eaebaa74555c6bb9f553965965185fb84290ce9b00790f8a7600650eb005e0f94aec49fd9fa006fa141241d256bb4add669a696dba474defaa9cdda677431e17f09e21e0743e8703d249084891035f63fc87e301fa8865d86621aa163a6865fe0b58dcaa1f8a00cddcd26d3e70d624ff05ec1f281deeef630721e21458c9d48467cd03b0b3de694e63a08d8fe904e607403202c62e5e16337b40ebacdf1251036ee03b66b5f492ce0b58a2bef2c5c4de9bcd6ca771dcfff75963edbc29c5ca0258edfdad9db00e2a1d80f41c8fdba0064b5fc0e8dfad23233de2752799e7b1f7fed50fd3c3bc8427f30039801ae564efa6edc86832e2c9e20f87844eb03c88aa28249cb907c6723ef3901d480299df8aaacbd3295ab5aac179250d1986940345431280c93ca96be00c776d05311432184f6cd0b85a8fe2fd3d7e381f88755792bd0f19e583b49349d9e738e48d23c56e5fd5a2cb6f6f45fe7d4202ae4620924824886aa48eb5ed99d00c8d865c8e981840216b8f155f001d060dce40c2066092faa0190352b64c6e2cecd1ced9ff0a75c269b776e0944850df7183564922aaa6b8edc348716cc657c6d9c05a6bb67086e9dc9b36ddbc62af05a13cd3e90f5cfa2027c9056274dc3d593c1bf54ea8727e9c687d590870aa0a0efd3add8110d12c7b068588788760cf11a21b52ab794f134926d7eaa7786069b9c5f914d205268a6545c3081c7e59baf4108d105f0eb40f421d1d8bba0abfe9a4812070e312bf88f0bdc4b5c63b4b85ae18068b06a09407f640b0610de5dd89d46f5ec4d4f40dcf337aec7b81d81d0f1ee4fe47b1c09b1eef8bc53011d06a32cac119f1458a2a8053e30376490c2444123f429094f34f77cdae6d8fbf6fe69d59741e21872458ea0a60d4826f10ee775bd86fcc3c8b05bc61b340f81eec9b867f93e460fc415a227c0f7a2099a1e2794154da6053b9dc046225db3de1cc7b3b0eb3b6c7d86a517b198c2d0e2799b1f45cc4c851cf50dbf73ccecf4d694f9f0fed358f522090b43ebf3e0fc2f49cadca9aab205114353ed7e221df034c342c450a30f3c2c9f02fc78cc4a9ef26b5cf527898553540a0fd06f466ec28d42a561f938b6d862109ac3197a81a498c7781bcfb1d9e01a1e8013e610ef7689b89d2bb03f5b8190757514a720081c90d4fa0a7f9371cb236f64bb1d7e205bbc346565af5860fa81be038ae943cc433ac7009e1415c0b0c0db0aa59002883de81c85294c3b4d502ae2c32214a1218b1ab1b8685902e0f12f4a61404f5a6d29693d428b14043e2c724b223d6bb1ab0c1d3ed5e11b902a29cdc416c170bd0533bdc36fde64ef307102ac51a1f50ebc06d030aee6936dac19d50efa6e21b8b18c9664c222ec1d5f4d5d00de870dda492c9a89a7e00addbd437b602a24409090d0ab4dad9b1aa102e9a45de617c7ae43cd8d42dcc28a0844e481f5903c927a86fa5518a28afcbd2445fc600321503719a7a9aaf865f35f1f56ca1bf8006c80c8231b6f601ea72a036a1c1297e80ec7027565b8e617a12a5a14c8fe0342bd8f8e933e85c3abf20d10d50af7bf97236875f224378163f0f3dfca427c2c15609ba8683e4b607f2c4ba9c17d87987ccd1ed8c36cf9a900f624520891564ee3baf431a472e62aac3305a7cae4312216142dbaa4521842c54594ee2ac592a01e001e4956369f41b00617334a8f530916312d96479287a1d1351d90438e4d1b43cbde64e645db00f537af2083f7360163005206e5e28713e3a287cb6eba06a118c18ea202af17c4b96982503a5aaada3990e6a5ac6b54f570ae578ddfbd03a2ea5c3d2589861f0c21734028a28b1459caca0a311451e89545148a6cfabd1ee03b0380ce1c7784771786a698ab0b3907807b0e8432288045206983f22268f204cb6dee06c4df8979442897adf63d6fd20655408658248a0fdceaca7abad12258bc205f00079c2fe5f8aa683f003270680104088d10215750aeb91670c0221c6316641960c131b76ef54036e375856d569a06c21a645553cf6086fea334c98dd50c8e0bc4840c8a615c8b418c8c6088a08201c04394161df2e180b3b459d7b0e7a83d7b4e521bee3a97e471b8b5bf342f3432081ad544900ab56b9add02c440ed573479097abe4bff0202ac30008ed2462a993a315723502fec72e9c44055f343fdd3afc40da0fa0d87ea1fdb601a1e09b188774124d20b155f7c27d5207434206e2591111044368d78741fb4eabc47ed9ee346bb4c731436926003b8644854761c030e0cf58ad871ecb42a76264450d568e729fb43061d98f46c897ecdeb5a28b8e627d73a1e72464da12f02aee7ebe01ff616cd96d53632ac5b555b14b5a4daab6936a36ab6ab5a64440140504611405920b0520a40b6b64dab6a9b4ab6a6d3645b4ab6b6da5b56d2b0c6b0b6b2d6cb692c5208c450922105563160b15444d696d16c4d95b292fde297e05555f8efcf2b6948edf5ffc5dc914e14241c1cf2b380',
- 				"C1CAN": b'425a6839314159265359b85a0f2e007b751f8050077ff03ffffffabfffffea60237f7cc0002fa77c5ef8e84a07d4142fbeb82b7d98b7b79ccbb7bdf7df62fb216defaf46de6f7d66be9abebb876f7a3deede868bb3dedbda79bded6de9ec005cea87aea774575ad5b226b7674a3820a3ef371ed4cd041a08134d09a6344c29e814c9ea6a69ea6847a99330a1a034d0053421268d51fa6a7aa7a43c28c8c0004d00069844d4a1464d0f501a001a0000000024d244414c093d14c14f1a53d3d41341a188c400611244d048d4cd27a4d194d93523329e91e99478a7b4091a1a0894111a6813464680136a194d4d268001ea00a22a1b41020aaa30040480a80110420aaa314120aaa30441158002a41543da7ebe1dbeefdbc31f587f4cdccfb5fb34a2ffbcaf5d7fae4b872db8eec3131f758386e6ddcc9e61ff0de2f0d0e31b2fa612b38b4171faa298b610561c8ccc84d88ec2af24f66d71f8fda9f16bc4e48be6a58186e363e55238cb8c7bfc29fa38341e1163369c9ec83d7030129e13b0ef0d770f47144c42e70fcba39606759c1869b52ef932bfbb38588f230da7d55f140ea292918e17c7f08257d6b60661f54755adb515662b9d2fdffa5a61bb97cda25c90567d8df427b1f97c8ff2706144e4d9a8d9d3631a639d732acc4e68ed615573a55cc434c8eab0a19b206d063ec9c95c167b7733939b520ded2bcc5f7c219429353f7995ccd29aaff2cac2698b20c8ddbb6b766e16f08ab1d1c2bbf8d32a1f12b0c32f566d5707fe6ad3a3265cb4390aa92db8b494ef372eaf636a2a0c33835a78a4a5dae412a2de715ab1f466b9217f6313d9b5fbdb761670b5a63b72715a638e38b1582050a191e2191761f3a6bf8b74343a8fed5ddc5903a356d8d0d33e2f36adad4df14f3779ae1385a7b9b7435f0d5f81b87ed6b4f0654e44f72fa632bdea6d1036e74b59618ede8971f5a2f8261a3875e1656fecea4da24d5e1d19533c1ec6e8404b4abc8ded303252618bbbb68925f5efe3b68cac23fc674ab2b02c31f9597bad3918c8c0ec726038c59242531089abf2fd81100fac400718ae888e96d497dadf1e726b5bcff1b2d8ffcabb41b6834085c4c6107b7b9970cbeffa396545f4d003bfa97bb4f575adf9822221ff4c8888b502a007c010f7a8304111809eb440482c029402c0102308803230110246411122a0c0591150800550120a1500160a89548c8a83490a8803514221543402c4483100808b108bee2a8721554afafc83eaf4d7bfe41eb8f9e7bb772f8c9f91eb4a3e9dec686ab18b9c6a1b7ce140e0eaf79b0a6333663c199a359ceb7597042a26e48575d6e8e8e14e4e5e5f392663dbe235a3833754dcce5ad8635b566e500de2aa8c0550160aa11408800258c3eb454b75560af4ae0aacfa18f9dac9b90cdb1ba71ab9d0f9a5c17d5bbef475c785fa21fa1d1e5b72839bf6fde5fa9125078f4892f24c333b577edea3bf31a6c1b9ee2379960c441d10c840a2e402491b52d2f63e1db1bb7fe40888060633447a3c3b447a48512afddd7161e66272833475bd8831c846da809a0336c9c177cdb331a4b401cabb675c3939376a1699f0c545858ab8922e6615ecc4380294855a9b37943165a5669a14dd2ad2e4d645d180d8ef0d0c6430889978cb8888c99bb998888ca39999114e5a8b4409a88b710c444513575732f34cb0f8b25995d731a6a42cd19b8ca1d709d324788f50cd39c7596ef9d348e4b6f3731adbc81ee1d455ad6d4eaf8e340f3ad8868b066a5c7c721d0032bddce2c565328a1399462b1e5ed6a309b7bbbaa7a171705a06f82f265a4f9c633488f03ce89e44b55a759aa1bbeb799cc1d62cbbc976c1d9d4a01d00a805404a015012805404a01501280eadf447163e970337a88e6a158d55024222564d92591d6c5cb779170f1b332f831d802a95dd03cb6a74f4f2ac801240024040713e49172204f43774b2af703d32e436aee469251b294cdd3aaf3801ad41674e8749d78e91719504eb73fece8aaaaaaaae66cba4b41408b200354030947d6ecce62aa5d810608d16875902a3ae24250d737499657416495dae49805240c11edc959008c5b74b936f3cd9cbc555555555a7160502a23979dea4d3add0bcddb5273ae99b1e5342708de2e60a6f322cdeadc0cc7b5c64e89475bb590b07843114d70366b6536cd6f3a5346b4a41851244b5c195448e590154c585c29b92536dd650d1172d14e1bc5d13614e535211e0e2e050ab4902d0038e34ef37b9bd50e44351360cde0b79cea740d7339e7266664942d3a24af36bbb62db5578149359119c3c3bd706293b32a6b499ce9254a675de64a46de9243352d0d26d586506459a878aefb372110606053a85395b2d0255cb40fa8aaa3de2aa8f2800a9e2086b0043644114d910529140d1035400da22994517682abbf2a49c98375f5643499f299eb838ed7a9dd4cb54823df1e5743a689a4d271ac4d695dedecef5b90c80f1712e5cd66b50a9a414da62623b0332728420b2405d2438618c8122869812699202c213120a482db4808c200b090460a0a05610e184310020a420a2e0ba4b5edb519c2f0ca0999b227fcb5b6dd9a9881843149c73a81acdb9035a355b03ae06a0263a4c8190910ac42442f00b01fc222a3dbf8e5c67f2efd3e3976cff096cb752f9b255a73f13a5179ff8750b05fe32cb21c0ccf34e4ccd79ff9bbe3a8e263a9d8decf3e7ebe6fe07d36fd88170c316fbdcc74570d50aeb6e9cd996e57770def66cba936c20456288221088c008c1009046416404fe3b7bf32c03f6be5452e0612e805842f72c05ee88578f6f75f460a9815a29aea06a10b5902a531a883919ab6b6352e0454e415897b10cc390135a874c89a3f6fac87f87fa1f9b9e555557e56afe5976ebdd7ddeee5c45cda6529532753144f74a9a70c82f7d3660ee7cf9cfbf4e1d7537f7cbd807c2aa877163cbf32d1844a612f05a19992e299651382437606406b45dd8b0d862881149051418550a9475f3d91787777e38bdff2d7446f942d7dd929a5e80316b6da69844323664863af7e2600e4c483be19dd4a2b2dae05d8840858e56b080d455782ebf8d45e60dc63a98ebcb0cf6d783dddbae42d855444af2d72cf4ca2d2b1d673de4b248662f430691306894192b11515586a96e7d6e81d01ac07cb8bc6ebbdb9b435310590441180a6fda81f6b590f142478f3b810fb674eb841a94200cc10719004d004971557638d2737580e9b1429ce68da88d0d6fefeff43c23c23c5de0f691d8e4edb0ec8b16e16241140e1122709ac11737ac3206a0580aaa55a4cd6615878c0b828c42184124102828444ac478922f66eb0d2b9694a97b8e9e296d2e16a71b736ebe01269a217d26882402d0d20381ea61930812c3a06a57442061aa9801132e9882016873e8a280ea40bde0069ca3346ce6b2b12c392d6877719707a202492024159e99914064269b7c6c962d0b4aec5d0e93d8ac475911dbb9111964c908382813577b5a4c840220c6daa4142ea5c4cc508990364459618f600ab5a9080203839557c8da36180053aeddbb73c8e299816d988b2fd46f1c2ee45125c8554480648d124b2134422c88d28d3822904668030141d718c248b005181a5180c16b7c7587318c3622a5400898f7d2f7030802355b220284942e007f8100f4de7bfb1abb33b7077188af0f31d7d27a89283a10149b62cc4a6671abac6b353151535a9744e7ae121b07be8f7fa0535ea0a94e6e386597ab7c481d00f577af4e3bc47cfaf7ed7c77b3c9f2eddf85111aaa5ccca0e185323c610c216106b4622b22e90849e5bdefbe665cf0a678f193c0029c548401582b0a401af989239b685715c0c1c8e3936aa490bb9a2db4b6385b5214c80e8aaa79e0384774aed75dc805bb0d9778679435bc86951cf76b34ae7198a956f801d4011143abae0712258a08120921e5f6a1eef1dfbfa8f88a1ec58807804e8fc6415e87aeeafd455dc0642104b7b22dbfcd026f4e816fb52147efeaf94952a4b6c3eae3f1c7c79edcc6f8eb9f978f577c95e0695b7474363dceaa55dccfe62830d7a02eda0466d9f20aaa3d347d18487311d7af22cad9feac491a49f17d7285551ca6b05551cad784b25d02213fb1a6102e148b960b933d7705ccd3dbfafb7e78327c9ad2f6cd26b0eb837e0f9ec0db8d38c6478429ca8ca56ac89d5211297c8f5854f1388472eebfb4a27810e434c1da100229f86e259261ad86d03bab9666d86d249249248a29249249249b64b6db4936db6db29329b6db49b6d86984981d110d608a849751a4a60018996851ae7aaf5f62186ad576d07502199ec1ee7a74e9fc303ae37b3e99474165ef930c19bb99e2480e194a848410c2273e0267a02fd7befab4660c1d081a0d2c411eef016b17f9af5e7eab87726b5e5d7608774eff3b0a81e082a2304fbe7f1a62743ea89ff8dcd750386dcab9791fdded271efa5871c600c631609e3ea079d8088ff03cf4fdb199693400994293da8a34b8a04483bbb7b79bc2d3d56ed3170611000b3edc930d9d8c50b7a2f319901dc799f36712015ded0dd1c7861dfd391ce770aaa36f7a9ef89cffd24944aa2aa49249393b3e5908fe3704a10ee7d095bdec3c9e19999fada682c24f5df502b108cd0095532ad0b53ca140baa50e4474a871029993ab3204eb885c24022d652c9dbebbcb86cd5dc07d06083be363984860874ee803074da2a4c20799601564536fc5dd884002d853487c96b58e7530a7701f56c0f139308ea0808c6c680c2b05e12dbbcaf757cb9430f4d6549c522fddb4c1f97792cac864e35db5c721d77e6db5d759c75e0b58a3bfeb6a2b7fd49249249249f9bd2b0326d86475d6b48739a0ee6ca505e507e2388489194698a82123299d6451b1eca0ddf9c38d15bfcbdb8fc2909814379406c85f21ce6ad7436400af907035b613c7e4f5f52492124b75013602c712f94c084248c24b7e6b59300cb9fa9ed7bcebd2f6e66673b06db7b72df4b52b5142d7159cbd850f034cfc7103b31530d0a7e3c0ed42e1a714b9b143442e2fa44f18873c72348267d477efe464927cbdbdc3cfa02bf18ea9fce94f82f95d01ad51641efa5027bc50a7a4bf40151321e52d5ea35cda0efca0aaa3e47857a0ba6ce6d0ac118b0e3e5f2f09a3e2691450874b4e968a196834959d3de555004c239a661c7c54825d33a14c8d5a544fe0121950d610fa043e89e5ef6d9f63595b7e19833330c9956cb6cb6cad65b65ccc994b2d2cbf4531fbafb3b752b5969656b2adb2a512b6da9f06e5a98263832b456a1215f32d8c4a11e7a6d8391aa95d1efa2965c9d78dd42a5f22c31bd0b0c0381031d00f448d5569c16094bbba2052155084556e41d35cbe09c8ef25d1488131a9370404e569f9fa5022c4a3d74a4a90661e28c0540089d921d57b7a5e743bb0314290272129d308284be6a915718b675e2d12f09aaa0773c0ae9f1fec703cf715547b435784ad5e7d7601b52be3e08e699597e21e9c00f4c7ad43a7aaa5765a3b32143226b5c2d42796b640f2f337976d32b61e75bdfeb4d0d66eaa1806f12c2bb8aaa1b99f93ee632b7043cfb8c68454de7a021accdc09fca9f836684ce944cc343d749a170077ee0cc5e052390679ce8eecca0887124a9020cce086dacde1c189f7d95d5f4d1e71370641aa7bff56a3ac7b9428c86ea01e30f55241e6443db0aaae2733c7a3920482781bf4229180b04841844ccd26724027a14fabfce2069f5dda8ae5736d81048600c0d80f7e9b306480c83d49daab73c5ab5eb4b11c8dd2033f55a23370329d4d94f67a98eedf0f7fbf88a49d743bf7886fa07c64900820115cf61fbd7a10695ad43a46d03945b84db35fdfd7c69f14da2a85bddf9927dedebef415547a440f6d67dab32a503d6cf910889b3eb3b79f857803f61e92053b4773a08aa915588b1492491d5912450a6a9ab29ce47930a9eb9165876d0a9f0a10d925e8e22fe8eaf91438dc0313136edd7a40db8d2b4bb74188d2ca9eed164338cde8349f0f7fcf3f67dbe2a3f98b9854430aa0ec3f2dd802b55bb18f18c0ddc908b7711144643c3035a0d73cbf1a1ced2935570655c43ffbdf50cc52842f40dba128eab7c74e9623fe2a05d58a8e9a83fd457eaa2bc109ca8c83aeb8ea40682462c3eb4a00d31f03d0ca061fc91d7f6c256b9e6247ad24d0a047062c0d1e82061cc50c50763c545e2c29f5157503680bdcdf16b784926da55c5672c23d7758440f15c60389f26f92b8d3c9d1e1fc4b4059dc1747434ffb25c54884892396ba15e76343a6f797207653b0b7c6ba67f9f9fdfa7de952ae9aeb2571aab156944af50990b10c7e7ea73d091527218ddd8293a9ffbdb8c92079f6ea18e7dc7eaf033428a10439a5119bff54d8da007d615c8a449b6850923ae1ab78534bd73bf9432fc3e9cd7d4e27103fa9397e2d3aa9c18159f8701bc8cf9343aa79f751ecd1db39293103183a432a5c14051d8285c397dc090eaf33b05a76f2102d0ddae9ab857ed4ac765e18cf22ef3ae47b14091dc0589743215504593745095fb00140d86ffba87060a1e14714d1ca77c75fefa346cbe1e862dc39fe24e2693edc59e69d0c344cc0ff51543f815434a0265d47f3a885694eeac90b6bdbd3e6f3dff0218ff4f768b0f0cf2f80ce249257dbb33d1f977fdcfaeedbc726bdc83f8f7e0db5bb363ab136949c1b98ecd65def654880041bd89d1e1f48323306654f6b4105e177f1f4fe5bfc7d7c639fe7fcfd36654e8e777b60e864ff97b1010ca141a0a30c308e18616f1c30ed3c1b5be775d73ddf8f9f23ec6e253189999bb1c71c71c68c78dd8e2d9dcdadf4ce73ba0f2203ca0c80843b4bb2ab3c9bfde0204d6f24f43eced7b783158a8543d1fbc23c1fed7700db6a60efa21994a4f59fee7d6debd78d7d74ebd539dbd6debd1bc1f767d661afb0465d34d3bc7bd4e20d1a1897e8143ccbd2560333f5f099b28f2db6bf6db6cf4e5b6dab2a74796d8db07cdceeaea18c650e04406fbc3601be41fd2288c1ad3b1d04003060886b6695e9a6b4ebaeb3e5aeb5eba3783c5b8ddaabddb80d00700dd139eae56061f2cfe3db832f387ebc8c1bb5a8e8a48a02b99c13f66dd7617e1435beb35e24439d0ea017e1494499d3a748f4e9d37db6e9d1599ebe0761ceee560d8b0060e048866b9646539ce739dd39cf3664962555ebc826fe7333f5c07b8c288a589c5f2f204107d8a946bd7a5e9eb256058f3e2fe51723cf07f0fc4fb49eab2424fd3de184e80f0dfcc5af639fd61caec811886555d21c925789513c0860f1b339f20876102964084d3a3ae8c5ad63d92d6b380d8eb0a542af1fda5ee5a88755642c43977aec35682664985719e89b881fc0463fa790cae79de0dc0d380f223a0665f826db81b82e09e5faefeac0a40cb8e26648db807192489c8e60b59e9615e65a430139d0f1e2dca7b483d0070370eb0afb79dd3cc1d9c4b65efcbed837948f760ab749603e16a6046d12c81add2fc41969e206881972ce3ad884315d46bb2fe4d07ce5afa99dd2f5600eaa29795354b6d0cc8f18150e8879674c0d3348721daf7ff1b362621b38ed9d316c8851b03421a57238ce2a387dfa14b8b8756ddd99d5e5d0f8d9dfb1c39ba9f1a78a5035ee63f7f467f4e7973f23a4e6dac8061493bcb062ca20107670d41554733b22920b889781ae52a056e08c0d90314e2dac901eb566a2216d2f71521a430040ca0d6db29d4a2b7458700ca101946aee5f994a3be96f2d83c40d601b2d2101d2ce39e8d28616c8d15c249242e5cc4a793e27b7a040ac3d0d79d087e33eabc6f2fcbe7e3d0f67e197cfdef99c1dd2ef94cc7698ef9b1ecb4a153c10a067876a87a06c0314bdcafc3f8039ee0e1dc509205730a102a50b6d321cb10757b96287534fb8bf9eeb9a28071ed335fb72ed85f1424366f43f234d880e601aef44a69a6495e985fe53e9cc89bbad6b119e723bc856427b8dfbc82904afacf40399da9ffb42c06a320a0bd9eddb9f61c0bca07708f34a00f3299cc8f15bca955c64d75cb77869f8233ee2713ec7a4a0e513efe7d575378e044276dc4942922bf52ce040c7e8a1c0f6d61c66601a12b6689612eec0d1c3082210f6ae38a37148a033eb744ab2a86809df9fabdf24d500a44ef7e93d8067e821d66db2d08e02fb03635c3dbc61c0490d7ec965bdafc297efc04749dc3f364e244f4501bbda1dec5048433ccdf5e92e6fe1b0710ef3224877980ea3a50fca23e3f04dfe344f8aebe06c11cec1dc4dc3ee45058b160c4484640936e67a36ea38a77043386f1226bd75df37a80f4429925e7c6d569c03ca235dab954f12529ca54d340f129930b5b48a1f0248853afc8f56ed6f5c3f0d7ab9302b4ba12e8d50dea7411d6b039d9ce1344308150177943182c8adb00e75490d7442b1dcfa938e747dfd3c7e218a68258bc0ecd09ebe070da6d4fd432fdcd0bb8a8386f7be6cfe4e5a370f04c0dfd94f73c67c9b758b9681d272f6c90fd8a5ee54dc3cf493a3ae056a5495de4ee75ccd02f6ccdb2c1a373d393dc266d3733ef31684ade06dad182605e2fb45300e946f2b1f4c2f7bdc0fdafe93caa67f5f5d71d0bc9a6fb77eb309b444394f46f5a54f320ccb32385f604e82240750a9d7a0a0dd2c73e7d8935a03be40994df7a4ac3487e7506aba50e1153501e46e02eb668110ce324584624bc41dbbd0b61035396fd614c8c8c5b6104b2de2b55442f44ccde951462372e873241a133c0a1d7f0f11f761c7b1f1a07e3447e80091d74060680f631ea171f9c2073fd0d6bf7ef2a9d4226e8a1403687dca6a76940759bc1c8d11df0de75903816ab04aa29a2ab60bff7f87e209abe14f729a0e4972da74e0bca22ee37ed7ab929420f13607599f9f03ce943aac7d5ab5ed85a4952cd6bf36f94ee8500b169ed3c233229861d0a286a3a1743fa625c23a529f72e731bedc83e2fb76543d953ecb5560c588a8d6960b28856c50b6cb28c6d651a15421493defa24e18542ea93c76bb88e21c7cfd47664dcc451fd3c1bd5110e97f3e8aa7eb832141939115a79e10e618958ceddbdd9abb990b8da816d8b534303dd0ebc773f290e64c3bfa89f787b29907d1143cab8e7b2f52a1d923081048403cbdfbf863b2e5abbd4a9b75be2545beb358d04de65a6a9e68170e086825bf9d2c1a1d850b9b928500fd828f0d218899b9873bf5444da09f53519a92a1ca9a9ccce29534545551ba6f0b2158953b252aa1a60af380ea80af28b596e54030801c213495857186e267c3eb2d3d7578bf8e1e41dfede9d73bbd04bc4d5109c9202f56f32b0661b33b5b61e70f80d2cc84aec1a6b13cdacc10ada2497b3a35e24a32d9c61016a26aa205e560e72b60a1fd972f6f63a163af1e0e1a6de57766d164c3825d273d4b63cf585e1af4b8e344d32c55bedf73b3e3783cdb898af1273d1ed00f301ec460b6cc235598e88fb0b0433208da904451263601b8136d4cb2dbc292cf4c265e4688bcb7c1488004e7a5cdb801a64c61afcd7c2e6386dd65204de693000910359be08c39b0dd21d1e138859c9e501515176e75d75e66fd38726e4270fcd8cb607a413ddbefaba623da5b1b7ccc698856887fbe3acf4cd687469a01c7c4ea05f0ec13823ac6ed7104bdced6c263ee2aa8d502298c500e8bcfc2fa52c8c36e1e5ad3b4f8dbe09d920aaa302846424481d4a5034692e1bbb439a90f5856572bbb55e7403845e74f7dc18c9a65212494a516a9c54a85b5cd36d7dbafc8c0791dc87ceec78d3d766c098e7dc67003847405a0628540a043546523ee3389f0191629c8911288d250b013d7cfc26f15587e5e18143d8f066fdca8609f498199e74c0c3f5ebdbc66c66104c587efe7043f81849204840220320a2c1560a0b20b2101411905508b1480290500544058029014914914822028482914841610590504482320a48880a30191482c022c0152122ab1558aaa2221154060c046444810891920a09ea4543c1443eb11064047e71550a82a487d23500911042410433cbff8bb9229c28485c2d07970',
-			},
-			"CUSW" : {
- 				"BHCAN": b'425a68393141592653597717bef1006f385f80100050077ff03ffffffabfffffea601c1e3e9b4f96753c5de7de0ab48149efb81bed93bb6fb9ca73ed2252df355b3db201d6853d6ec28af474ee04ef781dde03e807797b6d80a5b5340352c1bc34d234234d34020434d34143d4d4dea4f34a6cd53400035326c8d5553d1300000000000000034c229a434a4fd28191a7a8000190341a0000935090414f49aa7ea9b406a3d40da8f500d1a00034022501469349e8c9a4d354fc4d47927a8f5348dea0d13d4d94f5000892204689a686868011aa7929e6a8c41e5346803d4602c0026e1408aa20c454020022b10122a88301122a88311040582a0244013f8fa1f421f02bfacf1973e53f8b50aeff3abe5d747ad1d7d1f2b9e73523fb45374bf0e763de1d303da068c3f447fbb3b0e10fc91ad1fef1f047be8688fce8708be11e4fa511a73ca1e3039e1c6a8d1e727fb9e93b20de379b207bf7f355e33abedbd5ca313f3e36a9a48b839381197928991529ca2813470f8e6a2a530352132230d10239c2f8bc36fa72b9f89f130e8adb0b4f485a6d8bbe7298a3245e8b53685e429ec3140849552a0e6a313b11c4814ff4bedbae408e59ecee26e3422305e782ae0a1f828e555e242712e551bed50fe8a83fb11c014f33865472a8a7c7e547ceece7dba26c9cf5d59633ece9509ff1fa211ec87e07d7c5076a528f7256beb0f7bd69a5f2e373daf509cfafdf79f04fb2008666970142f52a4bc0b69575cabf07bbeb9b8488e56bb7a047a3cf4e8b06dedafc4ca0f8e852f09e3a6797f2507f788a3fe6008aec10fd5558a280c00f00104aa05a220c600918a902080446001150600c822c8a2c418854042920824515228318ac1222048a900831418211082ac016090e9401382a883e1e3bfdc79c9e53d9e533d74b61998a5997986c5c461eb44bb9c6771ba985022e428c8b5740eb6329a646d6ea62e2d4e2a96ad664bc76e55b4f2440aa1010a13181b145a056398cc11106a8438678a35a0071b5a5106002a8310048a8aafc7777673bbb7853db5eedf6491f6eb6da4438c26fc2363f2cef0d671b30985f9b4ee681d7e2b6468d891c2bb74f51eb3b0baf1453d4d6adf1e5b60669a52d0a79a285be3576a21825085089b6da139cf3dbe9cbf9bb797aff4fd9ff80083d517e9787c742a49b8f12efcee92486209b42d98f00abcefdb4f19bcd0d3dcd9654977950b435043343744a76c96c26d135391b94b66268e5e55d54992b71576834959cb78492d2cc48925dc36d93465d35304ef1e14985bb9aa3326852b0a8c98baa49b6cb36b27035005d3b56f6d228b6b611dc6ed2b24ab375bc83616f793bcc09e2bcc769baa10e9b1a71c66899b6db6f9563049ba585ad925336d50abb14c98baac96237116ae88b676a5646ef0c1148440d6aaac6cd34b454db7daf65a60e94c2ef5a2488015ba514514a1282604a0981282604a0981282604e1d379ad646620c2693d068cc29da894751acbb989dac4804aa80a3835bee5c1955810dd35a4c38e14594cad9378f36d3a84cca355bed7347f89755baaaaaaaaaaaab5995509955d33a166cc2f6a85554ae954ae41426e296585eb8a9c68934d5005dd142909cd4ab84cd8c64900ba04cb555555555555686e132eb37d5e5d5550d35396c141e66fb9be60ca5d0f00f014558b66cb73508d15332a9cc6514357a55a2c92f48036926e157a832e89d1a088ac48617672dca868ec281136cabba359099025c00b6f59be42c540a4d25919a2aaf5be8cdb35716d92b2a4d990c69b2456982c2a0d4950ba145418f1c48385d8db25635610318a1087a74e8b4051d5616c42c38c6ceab5882d0e5a56319c9aaa5ae453597c0651c7c55441ef5510768a809ea21a80287f42202ed800095091103761dab093773c74ebe31f1b6d9ad6aeef9d6fcaedc103ab39a337ac79bcb528c56ee264bbcca208a1124ba996a6442988e55492cca08a0102d908a05248284a62c801b24008a04a49016480521240a600d03cf3e327086fc1b83a099efff213833025e2139df44bc426e3484d1234c2284adeec269a41b5b65e5af01e49ae6a367c91441f2fb3d3eef4e6d11c6fd34c56a88d53410cb2b7111f11f523ce7d5c81444455021dc1c4b94cd66af73dc5d965db9785e55b3aeb6d66b5abb18002800a1090111e5e3c41e9cdc57e45bac86626601705c08dc4a97df6ba89a3c9831651b3921092485ada670a98c06514cea422526fee81c6e4334c16022c5d66fc6c490da71b81486d805d845cd9f4675df38e00d684ca0a9984818e094059d3ef8d33bba70f77dfb0873c753b3247c3678f8e7368535d6d1ab5aed611573e1189e5c7c86aba3fb36e098528112a49525e305cc329acbbb732b0b0cbab6e942248a24a6e049020da122012540f1e5c78dd06fe53c31cb042b2cbaeae0d7264698cd0d452a0001bc020720eef810d2495abb17768908cccd63008180668b8b4601219821b82af29cf24d79104cb2ac10259c30ac305bb46519eacf18dfba1a502259739c51d37abde49332e656474de65e2ed95714058a009e1a21d2eee4bdaec806ff1059a7b9a25dd4d99454277f22f020f5d578c85084154017483b4b32cf208566f4090c335ad728bb025f7bac8ae74d44710363a73635e998c5ba2aee5425b56da535412825491416ab1989da135084061180302302908d9427581cae12f70d446c837bdd91ec881bd1d88dac94b120dc2961680bb5198cbc3b25ab2de5d0eab22adfa3d39782c23cfa5ce5db81c81236d6f042427bc84821b8830baa20de43d508cc1a21185a6d8795959095554500001dddeecf06c14b0761cbd0c7d4576bba157d907bf6e33acbb939c1da70624a2ed905d424d0601021ab21cb5482240a422b450ac811925c444635757c97cdcf1aab699026b1db7d01c08a8c4f05e6ab5dfbc27abd5dd3befce2d779cb62762b32f0332b114599778d46f2054252d03bf35ddbd0a4ed7274894996d7754dee51ebb98a8517d6f5d0f836e636cd46faeb9e31cfa8736c84465e365da42812190018d284612da10a431174c00a641124ce6e6b0dcbe0593392b4f13c228558062a42a9a141ce58a85716fa6b8a7c749a8211c52b6595a25b4d829865b5900e94e7761dd5e98e17326757a1479ec502aa9c6a805eddb7988a82a07d0294a21f67f9d9edfdb090fb90a43ecd5604abd87569107eec183c3f31da15736eeb6ccb6a0944e406c729a6dc038118ae92e531fd726ad3ebf7ea0dab043425391803b0806076608c3bc86ab0033f69f72a1317f1a7a07beefd0bbff64aafb954419cd1f5d625c2a86aa7426282a884cf03e7be17e9eb5155588b648d7c7c6a7c6fd63ef9eca321b3d778d4d8fc3de4a9c0e37ac09f0dfcb21eadf52b19085c4f6653789bccc394d0c9c55918c20bd791fa62601e25e2caaadacf4c7ed6426229d57781a2c0cb2430e9550ac0a3884275fa8ccf08578a2cdceda546b0e19cc08fa9c7a5d05d501a5224276003fddf747ec15871dd851dfd0480f81287f10fd5f7dcfa2009fcc30d378ff4839e41780fc7a5ced9ce1db6aed28c82ca1d7451881bdd4f74235027c92a908f1b173cfd15454512b7764015ebb7cb5d9baa58cde04db6f71afc5f4e423b9cf4ed599e7ad1b65e8db8d6f34df86c9d0062e85f93beeb093ea45503b0f7876e16e5fdf62d8f6946760f7f755107c6c639215451f354584600cbf039781d6f819f2e59891d3637b585fade8c4a82e264cef93ed80b8e20cef176ebb649a153e3716d0099e85b12d3f671ea973dab389a6fab5ccac58d601540cc6cf71b6d471fa145f681e243d6c6567cced0e27402c38646320605ed742dae098470806fa4d1bc924210cb1367806e07dfaedf3180dbd7c389b8d0dc421f43687598989d85cd6d9cb5b2e2e1c3dfa973ac3e09483428838a62d5e182fbc1cb0542b7d53b60321481ae0fbf519a3d87eee83e5a5609bcefb2173970259c61de4ae68e347b77dd44456cd83a660f82b4686206fc56c88cc15d852f908da93cae521614c3ad07bfd0c28eafa567bb0d376f2b0e3b5691b1db328c8c085146583d0d970df95f813380ea4ffa9dd0c3a3cbe3cc1f50fde7b7fb58aa3d3bb038f51dd1eb8b43562dcd1eef9551070fc4b4f0ca7966058ef3df91966e2c909889eb5df09b9a0a9a1ecce0644ac39853c6f59dfb3cf32beeee5598c0d39b89c21a40af2a0033d850e0c302f41474678997e39f71a9b9399dbf5a67919f3207e31473fcb228d0909e245a7bff2edfa7d2bb2edddabf19026218ee620cb8aeedddc32334c110310539f30aa1743cbc5f1bd2b818fd4cb3c5add809919ecbe91b4c20d9451c8f1271953b7474b19bea829b3f09f3178eb54cf1946bfb5f1a1d3c34aaed810f2e9b8edb5d4115d0e6dfde853d5f861722199d7a1034c4fcf4b842e84f8c72c0bfe6bf28348e186b633b654d6d46b0c32b54aba0d173a6c207b7ee727c37982a883881478af7a3d5bb1f2b1fc380b12d89d04f9870b768399db6f3b1751dc838e13d0cfb8cb81874f13384f8c7dbd68f9f5e1608c9be01c50ac29c5d00de5d00c7d75739e008d10b83851ed447e04e6584f341cd31d0a2ae1992d686da2a4092d557a289236ea95b898cb426daa1c8dd3bcb7d49eedc691e7c7cbfb6f2387b1e04182f444582c5e8c2de0d62551ef10b1dd583dbb371ab25e60560c096088d8903134134d03570e37d036209b22b3b33b1682e7b66edb255aae1b663d381d84d723cd498486038988633935ea68101590b100a119029b74f1dd1efce11163f887cc3dcdc8faefdd0f0bedee2f546d40132b63f7ac090909061f5c107155107c34aede46f20ec293307957b2e05ac6555af799c1cf3c8d32d80ce65a24922468cc02b61461195cd407c78ebcd5f1cf3cd001d0913b74f1027d7bcd242f8dfa409801e651406cdfe3abc7d3d31b01217b9526c5bdf030a5a5c2d84bf5a0e35bfd37133ba162c6867a0ba87a78f770b918058f106a3ec1b75f61db206b301121de60ee8fd56ca35a578e4d35f5a0eea11ce4b07fb0fea6d85a368374b3517be8cff0d5beef5ec8d719eb97c9c3f4bde78674c804cfa615c15b1fb5fa65e71afe9f47ff7e2bf6c3c2bb7ed68edbb0cacdbf37a8b6505a6225ba0d709ada19a5acb1af6fedef7f91165d076eebf7dbb5a55b33f9aee8716ee73f7e57bb6f69cf7f7f3fc7b72f45eca4f761879f6d776fe38f063b6e482af386caf83f1ddaee8efb23c96573f974e19e3efef4c25970c68fb3cb50fa8c99ef586194f5beeeb2e6f01175d32ca7618ad448bc77f79f506b2171ca59586af6557f57e9bb61b1b536579387c2fcba6adcc993abc64f33ef8911fc7f2dfe9dd6f5c8c5fc6f6b003657243ef387edd05290b699dc8631afb72ddc44d1112882950e7beb9033a45da536d6c1cfd4f1c48632281a9b250aa8aa8efc116b9f84251243eda238223aaeadf3f7106739ad4d155a96a2f7aaaf63dbcce7a496b58e839f3bf71772ec0ccc658f041b9d08788bc4b1ff8714fc1c0d765b2b8755e91c261e1b4289c857036d0a6f333f59f4479628e770f2d38daa1e58166bbd0aba5e1506b3ca93585ad54cfa7f1e796613e931e9a9d686e46c6207a17c3909cefd1650e11ce225c8994508b244c2544c481fe5cad96cdec78170e29e9dfaf66e30baeeb015d15728dfbb510fec8027cd004da0f2c064064064064019022847e4a09fc3d79613d556acfa7efdefe1279667c302ec56aa896571cf6e62307907227fcec3073aeddb78d936df48c484087f01a7b7b1388559bdfe1622bff0586c897b53a5f7b559ef80d467021d7941e6f14c17633993e139cf2b5f217b8dc9028485a5b54093ad17b19f19c28ccb4f0364ef4f8bc545c3e479f023695a5ebb008e18b0c71cad6c99a8cb16e1faf074cf05f529b58578a4c43ea257cb0860cccb6407b8ee22a13a52023659cadbae84212042042d156bd02184252933374ca6edbac68d7175a747888f9f6c79104824624048596f1a13bc3c40a07db5b5869144e9faeffca7b52fdefdfb420fe0826f73012ab355c3157c6bd6ba1769db2794b0726b8078a853ffa7766600281c2473728dbb63d1579e1144c6db6912f83e790eb0ada243a4727daa2dec6e377a2c2f6b2d3723787e76788cefff18f2d6b769a3360802471c500478c73f120cc77bd16f179d0fa01cfad24813ee0534cc639be97e906667a6480268347f45e43e954b8592839c28d85455cc0a76055e215c1cb6d3adac2e032cb175d6bdab084600255c80fe3c3e3bb65a5893ebb85d3182e700d6e20d95183983859dbd2e797fd237ca6eeb25385901cd5891bc19803d3acb965d96001620dffbe8d223e7dcea019a73b49f541f97a09e6dca4bc4970bc768a6f5b623cb6173b8896dcbd7e5afd6b0c04c4d1dc498df69a3f219e0f089ee8139a59e23e29da67a0322e7a804f1586effda17cd07b5fc340af31d19f69dd05d0dd981dd3fae66123f4e61b19b4e9031a2fc889ac7c1df175346ffc8ef65c9647689d26e06fb8a3461c8febf264736ca75073c604fd947e681e733b6f62b63de6ee6da6c206b980b71d640e4b0de141a964f8b3108f99e28d99b3495124b826163440300201331f5f2eeefd1de7883ca71e28dafe6a2aee8a0a074978a480b62c0dc294318fe7a91af0cba417f51b74b189941d6ee740961b828f7f9c3df0fc87cae1ed2de1defaf594799fa56a43a87431cbb8391271d4e46cf3b340d27b89af4a3c3021aa39016437f5ea592d3f88d9a7b4b941bd1e143fba389b6ced40ee4729b70ec4dc7c1d3fe2e9f327acfda831352fd9f0d90fa42e5a8fae9646c3154087e6515c5f83abc4eae9eede167f257253d9cf723dbb75b771cc3c1b1b40caef56c39a9c9540c4ec407d4c97ee5a6d21c07a3a3dd8f7fb374cb23edc301d7789c755503adf986d16e6371a79813525103ba21242287b3c2aa17e6b2fd9f305edfa2e11d57a334802da5045b2cfec093afb81f136975dc1d5412c68fd8e1b4dde5577963f7077c1387028ae9a35c4f4a00bd8a0be15d40186b9ae065beac03d9cf2a6cc5a1993abeed67bb83a1b0d1e6279e827516f8a738e0c903f5fd0b1eae474091082e81a41a7223c2c17844ca107a8f1cb50f603573d88131ad2c6d354634f5a8c1b38371248688fd42f69be9084fd000f6a16ecc0f9ebaecf6b086e4f4a37079e8eadc7efe43a3b0e9e89ba4092bcff41f5dfd45f547f83736990f1cdd877cf426eb9c461f037a71c6bcb169b6e9b93830c9f0a3cfe83e0aaa222f350f6b3ab54b3be05ca87c45a2f249e76430b5d259d6f41d9be68363c70478a3e642e6905fcceef03cf05e20bbeba3c3787dcda38044721f275433d073471375b373151078e0d08620c500a88a2784102d150ee39b398530909f5a42fad436a713db78f7a3da7903f7e08f1e1b5de699f706fb93798c3ec1de110b6d0da6900c78a35ae8746573d6c7a46d0ce9aa53b7a74fd761acc0e00fc87415bc1dfbf6b9660685069bd90de53a16ad8560540b51b366f04031c43b69d376b808df823c0a42e8ed245db06aea286e90343356f59b19dc2fd9bc5a65366d29ad47a20fe62a20dc1413477e74810daebd62a20ff87703813bd3dddfc40357311f00e64688f953c77bc53cf1bb94a702ebe760778bd05285073d8b9dcc09020daadf0572944d70b672c557c701d889cd1fdb987ff458c9090901204505222b184451518045802908a482c59046120c4223245202828459014516101408aa1156400580a2c010645228231846450118455055462108c8a02464551628b04488c8b080c491645013e20027d15417e70402405401dff85dc914e14241dc5efbc40',
- 				"CCAN": b'425a68393141592653597994e318009a891f8050077ff03ffffffabfffffea6027fe2000041f70dc3001bed7d0e8007c7bdde8f6f9cddb9f676efbdeeefb9ef7b7bb1f4928e3ef4d77bedafbc2b54ee37dece93793ba29213657b774f46cddcc7b6af4568ba27b5bbbbcdd1ea21e97ac6dee3437b838242f5aa82901c0d34209a002640269a231009914dea314da4061a6402824299237a503d4f507a80d32341a0000353c2529a0340000000000000012692120a3454fc46493f2518cd53d47a8680c8340002244534426c853d0c898d27a4f51e51898991ea6ca340044910100204c2608c91348f44d34f501a1a1a52023b5106282a0415106220224406282a041502282a0440415088022c1047f8f77e5df44b3dff763be15dce7a7c9fd7649a1d99fa7062e54359fe607dbfb1b4ca4a22448a2fd3cd7e67cc8f3444f2eada7f9ad07fa75cbfa8bf9631de3382290c62b0f8728fca4a521c8a8bcafeff4add0d9f7ebc6179b2930d9ae77eef92224e5ec791be6b59561d6d717ef5b8bbb3607a10f4aa0f13b1539574947f9aa49b7c9112993c2cb9435e0acd7c9f067155ead720550be5560f1c3f6a3fd17086737c6eaed59c128421910a5cffc517de6b293a1cdded4445d6c7c2e9def4b922c15d6d0d060a563364326d457b34e2b2ade2ca691f144461f79ead2e2b69ffdb9f85b18be0a1a0c1b1ad54b5f46af82a91fa22256bcffeb0bdc4b3bbfa657f42c684002f226e72fcb8febe7297ca0959f9c169b69cb2444ba0b2e4fbea910e2264dbc8599b16f9c078473000b97b5d5b4ccc8c940e3e9e178dd9c41afab0a0df5d2ee31bbf64445ffcce96e18377937e7c24e3bc24df1e7e9bc97e9b118db4d6db3122f14842aebeb9cc4efa5fdab857674b6ad8bc6306f718d9e107edbbc34ad4c2e21ac555b47b52c95d3e4baf87785df9abf975a5d6b8960b9183a8237d756e3747de5e6b56cad5aee24d46ec5434157685af3dc7e0ca441d63c15279ef9f79ae2283c1edb3f1b7930a9aef4d75807c3141469feea1da11b5a1842c1df1f486df544498e74ad899f0e77f4854b197e142fb59bfc8277eab3bd4909679f75cedc03176b3deb04f23b8226f335fe02201ca50ddedebebcabc906baa8d755240c222e1faef64e3f05f5cbcb0c7386b2b05385dc3e8bbfeb3dd6289fd8dc1904c899242022cc67c658f1f1fbe595b95d876541ef90cbf28050ff600bee44044f7aa1e9510802081117cc2003002291582905088c1089159144202404622ac502451120a154a48a0d454180aac14420553222a150422b1088291062c0008aa044227b0823e6a0a81dbd9d3aedddfa985bb65ad84925a8c6bba8a2e4852a1ca293c7ac078225e629e1ff7bd45329873632ee6c55ed5d5d52b94e3693d29d71af88bc56dadd5baaa9f1393bb596271ceed974f2283bbc3a8878026f745eede4c55c8c195b735b99740cec407c913373abcd8300de8cc03330008019004208230505138bec33268487bb8a8e3e3f8674d7f0d8c2442ee57a7de55c077d9b37f53a378aed5ca32d675ed5f367c5cd56500aca645efb74753ec40d4a48db28c9d4ca59538db6e18b4b07c1ba0b31fc28bcc081862a95f5b96b5d2f77777d7abbd82a402c2816e5b033b20575ab95f969b7df1c6f5dd5e149c2b374671a9bffd00081230276ed8690e4dab87bcb0af48a7855455c54adbd553b64d5d0b3030ce40a666dd72f515bb649890b50005aca99d850ea7336a1ee85666dd3edc54a1ae946ee5e6e60005c28a958c7253c5bad56f1a5ef7749b9524bedee52cb214a6b522f6c5bbd53ccccd4d559c7ad45c5669aa0ae4d0c3616ddb9420288cd988936a701adc788338f30606c159186b6f26b2f4937796564877163643e46bc6a5112b76e4ebec65e961520c9564020dd92f9a26a72a6d6190ab5d3e596774ee1e1dc38876082a0fb394f5185b2d4545c88c879a72f000176f199882bb9c1b325b2252292c15213c518acbc32aa1e71cdb9c27210ad8c93a9f7456c9c7c99a4f93969f6a1157629d4d53c1da881937acce6f456d5a5695c2b4ae15a570ad2b8404eb9bd6b6666716a6570d551605710c4b77dbbe6faa4e2ddd69825e22e84c532c8080b6312a090c1985406cebaceaf35ab6e6512a2e9e91b6a54d2069285b92497a90918648c18844ddeba5c2eac050346490d996e4ccbcd14d375b1b9984c25a5cd76ee6b7c3215348144eb953aff95555555555555555552821978c3866cb80b9ce06b291ef9cca809d8a7421a790d8c910d1869d6a492cee03d90efd146ec285aa49a8a28c185b30286066f58b9d6675522098ac7b5337bab876d59db6aaaaa96d5555555555555555bb601a15a658394989a4a6af594ac85efdbad5ddda150b4b441b51bd5c986b02f419bbadb20611130aa1bd54c2868b0d64d6f3aa68d6951d2b535cbc3844eab96712f39869d6a9a74eddeec29aad6cc6638a4e12ed0e90ea491e8eae0258214902d276e75bd6e6439db4ba663ccaecbc260eb09844a814d166b94351985bdb9aefd06f575d6baed4d3a78ef766d9c78820f64da2e4e5561b2c9d5242ca9d21454e2bbd68c77606998737b5555555d0146baa537a3b6f47136985a4df6bd9e3b32989b75ca6bae73035db48f5a0d5bd1829b22061186a3499621541543feca0a81e0a0a81b90045f5543702a6e80a86e8865115490006d1404d6083a44dd1546a0023845128df7b3b95d9f17d83e0be73af26870a53cf22c7b33ba3da41d024a458005375872aaa830583232f0a046d444a7110d4b819556a2ccad00b245535295a5c495050474ca26a14614bb541b88efc1591006a2a15154b40950800b051600282c5248624085482c92b24ac80a49520564228a10828120280435933822284ce52f7e8480dad2557f5576d64ade375618935cb0ac15cb2bdeeae2645c8adab2b5b6ae1a06dce15cb71594ae6cc18c2b5abfca20408800bbe1f9d61d5e7fb696a22551945a1822274fc9c33c73ca5aab1ba01b11d060a36385a0c0b5766c2e551b1444cdaf562f16218c1c2839a6e665adcd3ad2534e4cadcb2042a002c918a223118422204151164022920a2490575aba1b75e147f739c33a95ce510b40332e5a83cf1394076c4c3a4c552c395ac01b36c00300fae382984ef9810879d0f89037daf384a10f5f42aa06b4428455082a60e83eff51a01fafe478e63af3db8bf3eb7222759cc7384ba6b45ab8edb2ef2e5b9c1f7b2b457a3b75949dcb4deb1f3b37ddd761b0739e422bd2bc57bf109fc7b21c00220bd1a87708962428534642a7914241ad22eb6e6f7b3469ce6ec918065a1b73272ef00d38ede00694482c844480aa0cb40253ef0dff0678021d3eb8c1eafdbc311366cbecedc042f04816cac08db3901249fbfe9de79d86bb24924ea0ecc5854f9406ebcd300d357b66080711a0f012d4785e3a74a222555402f016e18efdd96584606c7973e3764b6837e61e0665f79831534a5034ca288915fa52ebac20aa00090eb92dc9a356e5e3800b22c918f10992442690137f7ce57ba7256219a55ac03a412f6bdf1c143814ae56ddc715d20d1a8628b8e973bc1ee758b2b3c6fc2716cf4c31b43e190b2dd298c299a949345134832d25016a58220369430c2c99745d2b856d591819a2ed4b922ee50c0a8915212098c4428508810080db8d22f501c693977084ca813232c139e396170365ec625c471c55c55dea06cad936689ac02c0c35ae6c00e8dbe0ef680030822b10492445ea444cf767865226d4b56d35dda4e633cf192a855bc9b291256516b06408a29c8c980c22acec088d819075eb6cdfbbdf24cb8201ec4815e6ae6ac00adf7ddf427002dc98b198266ac02e894a8b758e62716acf02705e9aa7176d191133cb215630322b62bbd90a29b1d6f18b48d05d20660a495a0d3329cb353c0eed335529ab8665db1923083b37960482289223055563aa499b028028c11d5efbd790f2bcf0eb20739bf3b86fb1a30bbcc8120d55b38c3485ad5c2ce033514c4b11f360b6f1e58ccdf2f96f1e3beb2f9f2eaba5cd675ec0bdad62fa388a6331ca32d48d715dc17527b3bf7eba2022c3d52dbad78bef77b927bc72b5a2873dc3b431209250d71ac3a9da115003b1b0001ece199bc5ed883ca37b5c494f315ddf2b2b8f131ca7212925dd7301dcdd028989b3358a6b4b663924601600ad63a757340a2a2905ac9201e933c7396f9b99ac3b5d3cb8e188ef15757e218001e043633317e3c447132a2f9c998ede3d7944a2e2994ae5cd236e51d38583aef113c61d64d09e32774c49c1b366188beb9acc82aaa9a30a6088b4a5ea8faad5b45ad84242013e1f3fc1a9e1191c154491eaab211424c72f59881d3ff43cb7cdbddc286f1d9dc3c1daa1358ec82bf8c5773f6cc6b89361b4509088041924564933a6c9a475fb13449bf01a4d6fc827ceea070dd09b65750401c730f68fdeeaf20b187e5b7facabdc7aff7820f810ada7e392db87b7fcd4d58cca5a847f830b103835b11edf65456884c0ff472786da3b71ad12bc0e2a0a8117cacf9e56bdd0eb0cc3a92fe1fc03ce60a0a81960d282a056c4bf6d09b528c21903561175141f20c95c1e3da60d67b7c44bbc77d3c300f4e6890f03c7aec151b93d8f5dcfbc3ae01507b612d4bd50a8f454454456feaf13c1df561f19290dd3d127c53633356472d219b0b02429c9e62999a845ebc58f46f34b75c4188870e26924e492491b6acd38db69370d8dd1ba24924aaaaaaaab0a6fd666b4b98a68e821d30ece7da0e3c533337556a43a6ebb94fdd0334ec1c30007901df03b037bc9d99c79aac4d33864a183dd30cf40f51206a1a838c832f3ebbc1c0686f2008f57a3c4103c4188dcb4984f12311fdc61fc5f7e86d32a76cdc5b89f55e4601b9e7fc8c65b995ed6310fc5201d209f6f5a92886070fce93ff59ae2775595e7957a6a77f993bea8af2ac93280c02045881e74404f1bfe58e0285638e65171f7f69602c7b0a1977ebf8c0599ecd67beb3980e4dbf1f36b4eaefedb9714041c75dfc9e093830560a47828719904855507dede1e664190562e0a4cefc49e1f89dca0a81da6b6fb5e934fdb347b2caf7785081a003f4447e61e07e1f9979cf4fa894ea6a9f5cc00c80c39c4a020e8237d34ad49e9929d2120667b42a4268089f6087a490f1dd433d0fb3b0e1fe66848e243a4a790b4e512c2da6fe56b5df0f135f3dbe57e9d777099065ac1702e529f5f4a2a07765f5c5bc21f48f9db9120cb1dbfd283e9cb1fb1f70b9c55058378cde1a207c9c85555578388619d3841c40150c49047bd2a58091a14da42b009e16a3e5ebbf0abb7b4a90a9bfbf2c1c6c8896d47df4844a483b8e72e5649b0e4c80fcecb388284117a5e312bd4ab684b6b70c540e5313906cac7c45b36aac18da69942b609611fe2c58822c3674efb5fb3fb65e040fb96143412c55b517b60e51c1d36c95f43b38d95360fab6cf442ac4c21cf0db61d1b7a242484cf467446f7212e2e6ce2a8adb545573cdc5e07367e93b79ea683e5f94e8e678e05bd85094204e13b34ee143d2f9fc65cb9757374c11da07c6a9b25187308c2c06075eccad134c349609ddf189e87857b9e4fe52453a792eb5cd268142f080f9d41c657f188ffea857151bc275984c5d7cc59b5c2c15d80e3af858a87bdbdbd141502f5374c6c0b371a4df8a3ab06e95019e31d26b35a21864439ec106f076c352118801856386fc7ddb1ee2c1781b0ff4759a24c0aaa340cc0342ae52f908bb89951322b0541099dc3be5bdd332378209ddd94310411dedd6a866edc6ab6cb96ae5972d5cb06e9dba44201822084422c3dc47dbeb7707429f083cf8f50cd2dd3f1a02703980cf7561c732416143890d3f2f43e04ef6f3f37067c01c59915477bd885d661812590f559622418a9ec0b986edf621a4354ba4a73b7bbbd0fcd33edbf606be98007c74526fa387e3f76a5ccf03c343436c245ee22202243876ca79d6a7e77e9e6341650798f4149583d5a8c9c58ab4bd822006e8b8080a0998c9ea2d635784d450c98bec93dfe90f2ec2fea450540f1361e92d67bbaae05f1b5fd7b0424c4d2ebd90cdcf980717d93d7efb36752d1e20903fa5aae06c1e5b72de286f2714267967d3ec6268e78faf6dfe2c46a761627be68c5205fc6f9d3ce1e77cea011d770a80804674040c8322842121d5e00988163d4a30143987fd7cdbbcd7f126c141f3cdee8d40a86d8099d6d141aafee4378188ea12b502042bfc45f55a4914214836bb25017205431ac70de7261d81dfe87789a073c3bfbbebfa74abe4cfc6faa36a8ad97f65b4640b8f0fadd1d0d4633d73e9bbd9db736f753e41b4f420c3dfaa9333c6918a9293c7e6c5abf187a989f2157a2d09ef8e5490fd2e65c50ee829dbfa0b865ec1d28548c422c659b049409a9f39696e069b1b3c6f95b6ee29f1d9b437886cdbbb0b91801f26b1e0667231b3ce5c3190c3db14886c4a4c85003d436040b513cfaf4773c4f4820640ee39290e821d0166f43565afc66dd16a153cda9ba65c3f9075f8f8fb878d9524f1ace27d7f5fefb2dd4fc9f4a5f83edfb779fb355ade30fc924f22886877d575e9c4f03ed2ad48fa549627d4d44118fc7cd3f9cf8aaa0f898a82a066900ccd5a9bd0aa0a8997d7c8ba410cbe7f4f0fd75dbda1da735fb0b6b68d6db5b6356770a16184c4c14e07bd2ef437827c2324dda848060d51631081fe7c6759acf06cd346937912075f8c50e9a4c98821b77581c27a9f7fbfe467c3db92076a6ece872d39769931136590e77a2417d3ed5e11178e60108ee3d40f151ca39b440f02b127f0cd20401dc769a9f6ecc89881e83fbb5d0da90bd18470b873323fb1a7c7cb884d010c4666d740df395ff1e418fc4de68ea30512dcae79eb7f8bdc2f1f33f5470a4a0396fb7cb74be3943e5ca36f551fd99539d365771f5551a31830f155491cd8719c2125110511d3af8443f9f850c70b4ef1ee8aa5e6451eacafaba227c6a58ac773b5bddbcf5d1a252ab0b4e9015aac4a2e2a39bf84523998e59aa0a17ad4d87130759d7070e61e746aa155d7ce2c78e93b9c1220711483029a88ba3f03020705e735c1b9b6e1b1f351ebdcf752acc3a19b3cb0b51090f9fd2097c41695c8f2dc70849246424e00014800e3915625ba9fcea587e6aec10cc05e49382a74579b21ea254006bcf5c41e5be78e792d549c0b101c33084cf2a401e81a6c8326570acc971c59680dac17dd9b5b670d810a57a104ce03b91cebef33eed0f7677d05187a75f1a5bcd3ab0bce193f4f6a5fadfc49e999958fd70343469728b963de1852fae9d764f3143799059789f64187d3f7e203874efc3ebdfe22863046a1c395fefc939f910cf148b56153c19076b47bc3788110143d05a3ba272c1e378ec6b8c5994b96243c9a81e2a8921e87b37a362c11776a1d9c01e50e9b56c20800bca0b7f5855e972cb4f7cd326f0d492086b06438759264ce5d251162406601c985bef1047e8208f22a01e0f5f4362bb4c6306307366f555526caee9da54b4a96fc8e5fad857e040c4323d6b6fc15dfebfc60f698a04859f535d9beb0fc9dde25994421ee7850731dafe570dd612be048722159ec9ef9cbd0b0d9e999e3f187be9ca126312a4832121b7a9d7cbe9ac78a0bf6d215e8f0cc0c65505f80449e50d29551eb94210bfa70bc56bf187e5a7c7aa1bc19efbee24c90001a3ec7515e9770376a64998999860112b4a4c3864539ad12a486547c214b805136dbe9501b74c2d131562c1eb08561085d0872118c637ce90e00bddf1cecaab1116bb4ec67b22396721e0291e4f834cd372b1fe081806526a3572a9875fd3e839dc71f0fb6bbb396b83c4fb7e4f7ccce664cbfbb917ef35569781babda1980e5463033ea3bf5f9ff56f91580b3dd788d05c781b4040410806135117942154ab82d434edbeb1b10c420ba072394f0af33965f9e1dd9997a1fab79a558bcc665aa57569bafbf484218439d5e43ddd6acd104b8dab5ee0dcd68cacd690de76c00105901e9ca59c3b36bdfcb9474e164f4e160d78212a7a98c632d7619285486a7911cba8ab5e7d92e1caf17bd3171830c0c439f506435002798e5daf550150ea3f57862077c4fe7d44b55e8e1f06d362ac339d81b77a887f1261ce6ae81a02084f79e7d666cafbeef01c866321aac2c33ca65460717190a21de7640ddbb3369f1d6666045d20eabba3fb2c18f901f38dcb1e3a21c3a2e1bd0d9a19dc30dbc38910a3310b182f189e403c8efc5b576386a1865b9c0279d49c2ac7610e708ec2423ac0daa1a5ef9eb221b84c1c24509dbe60d399dcf6de7a77189e721427a366abc711609edba090c44b46f638337f0915f790d8c2f3ae99da1a4ed750285faa53c17cbd43302b0895143af2a136a5d2ce10e11a87b40eeeba93ece73143a4cf7662c9f91e80446ce1cd68d5df43c35842402e5859290b8f02712e92401cf66850d86cf464d61b203402b19ea7642961967a474174e72ce0e59639bb904b1534fd28ce4996b6fcb8677d6b74c66b9de14a0a81636102d174b954987a834700aac511914824ea1866a78e72ecf121093d0bb135d7635b006d0d4c1dc0e2184f2e73c90790dd2184820184c46bbcc6751572396aea477d72cda3961d850a893074c0cb69dfe0f907b3f50858879cafa95b4d4b03e9e61adb0ac8eeaae25b68ab791868af05c635b44b3aa2bb320ee032a6db050047a214ee0c7bc1de114e4f242f9a1cb2b1b7087c09dfd3bd93be1bef45017adf7d475a5fb6e4f7c0aea2e2fd32ee9401ddccdfb7461dbda660194e29c378039a27cc132c280ab5019c2d74a0974d7b0cdd84c14d44aa0a8193857c6b7e739e8f0807d39216d01b14bd56439d9213a73e451287b15623da0d9ca1c1e2d895671df93d9d26bf2a13776a9cafc4e5f5715607d5d418328f5f1ba11d03559cc5092428c1713421c240d98e439b188198e248ec9b2d342e405d7a28122cb46c1222091fc2519d596825ce1ebb67813b8fe05acb206daa78a13cabe50d3ce1e097dd71da85c1b86d528d317d3a48f000b4a66e7d5ec3e98218e423e799e21803b0fa3f25d4f64412e783e2b004218f0b17f7be661f38f6ec86c3b43ed8490fb1c8efee27a249f1f7be8943f0fb552f6b634988f80a9c927d1828b09248e3c3f36e7576877041388c1be5af09c1104f8032c5de41f02630dea9a27d60346bbc4ecb9a43ca12b3a2efcb566c118a49f18014682feb129dfceafc537e8cfb9bf2273081f00209c04488890232023611977036864060836a7e6f322e218ac8b0cd5a200e50ac52150a84aa02b644a8cbe77d6db098691f5e5dded91ae6954a4da1944edd53dc271fe5382d71bd4c3130361cb038d97305ccda87e90c0f18eecb07dc3a0f56483ed24ca06db592f7d2fb6605b9a768a1ed360764103ef67abb54b25e282fb80de37003f3a0ccd0d1035b19f326530e1f4e18abb4fd0fb8d560747424e21da07cd950310a5015af842508fd8fa0320dda1248444cb36887c6d60289772908bc8d35b350f0c77d8e781e23b3175205cba6fd3972ce49d5886261f94fa65b8c0d81bafb4eac1ab7552256e00e86818982d104dd1248b022c4861053ade6b7c639cda1ccab1de413b9c8de50a44d09a828c92b287b02412162c9c91a40b6450f5faece5d6740eaa3c210fb1b6467e630895427a8761f734b75227e1ca26cfd06c5f7613e35300e804d291085070221f621a6f29537a37d57d2632759d20f26aa6d958118183f7c7f87f1afb221bb6287db5ed703e790679a23d8380d091c001bdad1adc9779aee1d97d60bbcb125808a08bbafa20e046ac7a667aa8b9e6930d6a1c915296f7c6c297521463b086bcf419f83e3cf9f76c1183117efb5518c515146db1292b516146d6b12c18c2a5a92d42c20509a76cad61143d6c2b5869350cb2567af2d6ecb559549c87b0d535349f8a23fcb87c2642b3c75f8b9ab7fa488632726a4c721d854694ca854bfab279d06c375e1862160c18501b926df7132d7c88791e8bc0766c7d2297d9b70a2903aff710287cbee7f9751af0be061739a05b8fa27516530779bde05903a68509d3d103af2621201ffc4693253107958ad671e6172cbfa8506ede1a20743825fa405d8887ef9aec4085935e56d8ecbc805873b282a0609c8bac9b70f46ee10ee848b3c210fa7aec2626990a80281fc6c05263149f6b09a409f142a4d2a0a544241304f20be57ac6bcbe9bcbecccad67efbecb4ed08abc8e9a5c3603becef97e3fa043f01984c351b93781b82f07d12d264bd58e04c32d4a86fce3497dd121156878d23b322a5ca4b1bead9dc0b058acbe4b1f5e63819dbc8cdde6f52998ce7d36ce26d8f97e590bd7c695573b5a7d758e78b73e6e78f171368b700212c23f02dde1c3aa1e5dfc6743f9e3337007b027e39e25f48ddb02f9385c6076dc30e070f99de1e7ceab5f4723e36fb1c6f5466635ae3ae052209cb96b96010dde69bf2c766fdc03495c4bdcf0405087a8e7b68296c4110da6a06c9d01da201cc0b14b9e3c48c0cee73210226d86c3cf7666e31a9c8878f5351f6b33253f6cde6eb4d1b025fbaf6f27b0a4e06c0abe98c4df322f7b1e1020410c7f6505408a28e38e81cf34a5089b4717ea714f40fe63d7c2282a052af6a101b582de80ec1df11fd06b12181d114ebe34a714f7dee4e72924248960eb40b01bb6ecb9b37791aa761da1fc38e50db21eb3704c4ed4358098ef98a586861a4095057c13ad9b3b9f23de1f288a0f828252d80d4407ddedc46b090917c0d52c1b6c3d6e0425a489b627716293a1453cd90a985053d47bf0d8e21132b29fb78bfda0a420484220b1018ac5110514145905058455848a455904101458a450044922c2458482a32491422c20c60a458a0a10050591648a0b080a00b022c05015400524591122c0582c83246414202c0558a416459014518a808b02418a2ac582c44914228a4464228922a4804480a8f52023fca8bdd015ef828b50014f9c11064042a20a320a83220ba67ff1772453850907994e318',
-			},
-			"PNET" : {
- 				"BHCAN": b'425a6839314159265359ae09712900caeedf80100050077ff03ffffffabfffffea6034de2001a0006f84ef1dde0f7a0a2140fa910d8cd322fbe7b9ef0b6fb7dc739eefb7b7bce6f71def77773cf7725ccdb925f6a7dedf43e97a193ee76f69ed7b6f5b7b37bdedbce7bdf79f7585f7dcddbac6dabd8f6bdef3b1b55af33ebabde5df7a4d0de7a763002b40680005729cf6d2f7b83bd7773dbd7b7a376b31d3db6bd297005868104d34d009884c11a01344d46a6469a7891901a68022991129ed2629fa4d9354f5323d4d00000001a60912a9e9a9ea9a034d000000c40000012692224c9a526a7b47a8d34c349aa7e94f53ca06990d00d034112884d34684c86860a6d1343449fa98a3d27a8cc53468d0448882026811a8da2699a9aa69e420c9b50d0d002e0b0555d48a04111548a8a84411518228c11154802841115482280a31445422aabaf66fa4a7bbddf57e73c7efeef87d3fd1ff337e9f8cb0f1f5d14ffc5b737fbbadb2f187dfe8f2fc7303d8eeb173c6babf6d7ef9d62a33d1dbfe0394b0ff1fa42d0ee9af25fc8af5fd5f8e144caa4fc52eb5c6cada33a308b71000db4df09c786d3d296df268d77d41d7eb446af1ab738cff9d3deb7d54c6a638783eee33ce12caf73bfd555551a82c35f09c40fbd1e33c8e5036958e35037591ce303fa7e32889bf9c9d2af27a723735e31fe00034a420efbf3c4f6631c1eede76218344448d514b8c67555f8db41d33bada3baba76d6baeb92e033a68e4c88635c5136ff170df5dafaac975533d5ce7bf7ef81d166317f1492ed4da63f9efd61708700006b19d1e33b1d57f9000fe9c6a33c6c986854f07fad6eb269ab615b9fe07e5fc5ae000b63b6689555af451c132ce572ddcf75a7fd7ae7545d71cb75680fd270b318f3b53b9e6c7e76c7d650a8d69fd4f89ad495460a79e13ae6bad075a6e9d5c214efc35af775e526b238e19319d786ccd5daefc3ea638791dbdf147bfd4d18658e9ca8ed9e2fef8f687af9a4283dfc065c4d8f2dee5765d70d34f0969430f0ff5f451972000b80fd01917a989fc7a5998a13bf1881e1e140b3953e9ec81e330275f61ec3acf950d7ba93e5eb9913b85676abf5d3d17a7a6ff9f5b29783f037549d1eb819f57b9c36ada3d8071e996fac69567d68eb4784f5a20dcfa6edef8371f04d58cc1c65478002e3ee96d70977839ee18f66ff5baef89eef8945532ae69eaf8b57c5a2ef6f2f270f7b3a70ed8f8d519db67315e08dbddcac3306d1c9d2f6ce56753a4f4a6d5bdded55a2c3395f1fbcdc33c372eb27b368674b5ec23bd2d959943bbc2708ecd54aa3b5710764d6c7554331be8b3eebe5a351c7bcc3c3d1d768a828f4dff1eca1f6caf45af63dccc20d97958a61c6747eac1c0f7f8a129ab7166ae38783719fe7baf04f3867194c189f3ab1942167031732373ce4fe98c23823bcb5f4f2216e19d0efd79db61dbf7000597dcee4306888916e49f931e70ab7dd555b3e57fd9d7e97bb7baf724b185eff9ca351f5c2ba33346fbd16184797e99f4c7cd631a64dba8fdff8b47597e95e2ae1d53b6fe54e076efbe875c1d7f1f9481fe6fc96eae8b020753f2b03a394b2570ca4172cb09ce22709ce6ae139859ce729ceaa346cb2c578b12739da059e11d7e7bbf76283a75e6676b703cfb5d508d75518900038d5f980ace23054f35e15814b6f4db79b86f679a84df8055826d925d85d96ffb59919dd45dc887c5112fa96b2e0648610f2ac865c0cc36ff1953abf457ff455174a08a8e2227b41462288a414e62a0252d23425342530024564048c0058284510828a446a00814840058081010624056a0a85000445420c00222d52448208d11418884502088c4182901062080442214ee5557bc44553e1f13d337cfd3e52eb3e765b5bab4b6eba59df75b2d85d75f7958baf9d1a8c9c6bb5522d71ee58c89c7cc859346ade672632f1f37cf0c5d95ce1f3bc4ecd9de689bcb25a4f475eaa79d3cf3ae7866ec5d62ce45e6c3133ce79b02dd8bcf21979295382f2c5bc865e4a5691be762bd86267c881f39bbcd7a77b95a674adb5db7335b55cd4ee4503b088aa41411148aaac45440325d84bbacebd3cf7c2cf0e5865f1ddcf0cfab0c6c9f01442595294a3a949cda55992575d75d6eaebaeb69209a4cd8c1ec8059348226565941552ca9633324ae15ca4e952bada5449a924e739cdd39b5f5a7d1eebef45c59fa6531fe9852a93d3170a94299e109e68e8c66fa9c7e4b09778c2466fdf52ba3144c13839eb51bbc9616a727e4a369b289ee4b6534c75a9ad8be154ee8d61f09fd4d1d3c13ab04efffc088888936dad354170c52b7ab9ec3be62a544b09102840a000ec0010140b26dc9345a4bd99e96c40fbdbc2b9cbd1a25525e3b24924924914e9f576099a955c374ef866e569e32e6b266195ecc172434b3ace4be037971978eef99998d76642e3babbd5e5340886888721e222d99cd5babdb0004000138c2866417acc9c91198b8cd271deeeb0e4187191799112f3950d191466cbd4be598c5ba93998eaf39999998a4956a60aab790978ed8cf121659af262d17e72f509ca6c4c73c2278748f3918820d41c36a33bd5bcc599a36f98f9271d669eea3199a1ce658cc38d56d22497baa758b98a56ac2b23272b322e2e71e6f2f2ea5632e9d4d45e3cd5c5abb086c65a8588b5caa7c7bcc57330f10f58b31738c1ed5797a62f15b698a1925e0edeb9e79e5e121309329bc2bc2c2288422c6092122a241b0dc2144557777614969b238e36dc69758caf585badf8df1b6283781070c5217e5ac4a67945794b41a76f6ea51f6eed3d09341661af2a1ea595aeea6a32ae84c5c4bbb41581576fa069cc7c09c8b208b06d6893deaa6dd9cf37ce1f174f8df8367533b73c9ddf18e79c6d0f21e8a5d9766ee10349387882c2d17cdb4794b968910056bc4d15a0968309444626513dbd34eeeaa414c8a556c301e0a938d00044a04860c18d371c2d145a5235dddb4e1d4413a9872264c1234e44db68982149b6a26180010034018018e2db45d21291224a4c2689844628dc69c9190638db73248db6db6dc000600073349ad13a573754314fe3e1937b35376f2aaaaaaaaaaaaaaaaeea5b66334b659c333a74c908751358408e958bac74e122d406518126cb607937c507287b00536491e00479d76e54f6122701a6b602c215ac338d2d20369901b4cb802c5e2e1126ec75d90c3218dc3155555555555555555555555555555555555573486f721c9be15511555555555555d5cb2ad0a3aa52700a181ae0d0b3380b9b78b0d8189a114e528628090ba48ab0ee221a45b8a460ca100c8c1828860a290eee108424d3c037c629c91f8492c28330251e1d49592f36195b6e38646db758a4776c3e6a034756e761d050021de35669b0a14e12013b171ad9941031000e001402e80280532120500dbb9a4ba31d6a818d35c61cc1d6ead9c4471a60336ce198f5b8528b9156e1add4582489cd31048aa2ca85190904111a9929ab0e18332e73b5555555555555555555555555555555d4deea2b49d488032918c8033550750271105e20932a492a1df2b067106ea6fc6f0bee50593906904f0c39a1f5c4e5a356b1c6b22c1e6d717540c4dbd32c80a1cb2159c3c3260bcecc0d309a416123ba6a129bc8028159442e6a4318f4d9b32399d34bad50bc065371020bac96d01404c1ba1d9180c0340921e41330e063326a4032006c6a42141b9b6869fcc44553d044553151150e62267516d88a99e0800d02222098c5fd480884922678958096401024000109cf0c13fc87eb39d8156a776beae2b0127539026e51fdc02051003489cd101a18c47c36556a656e33297b816e008c618c846c564782ed3a628b30438412468869cb562b4de1555d5a220a888a24083228483425089bc15b81ac550b8dc09142a2a0ed06a225c111a8c8803200a48048aac8a2320c828923204ba57580a170140a88ae200120c8a3228a488c56102b0815900e0a6a17757832da8a960e9ca3c2808467a29c82490c0239e4c95be4f7a7a756d9c980c5e7184c673c339de8642484924ff615454f603dffa701d58cbed46b99a5f544bac416cafa5c62c44039181dfa20f1f5876fb65b0b0e60e07f3024bdf912a0a4c0f63af42518af7711d376c3aeb52cb2d0442b140911914117ee386cd73257f2b95343589f2b734c18890a46ab5db6bca0644af2d337900ca1e94a9487d04d34c08600d35eec02018002b18d0eed7553574ce300e07ac031ae72b850fbcd67d8e4cfcded05ff834379905fedfdfbb7f531e0fc6b907357d27bbabc01cfb5ebd768f137889883c85ba721c3857c3cac742e0a88e8a461189bcda1ce354ab04979761d4d363ed3000fb3edd5803f4f54fd6a7b5b2050002a84c1035a1b5d7b75629aebdb82e02e964311d813265091d9a61808522a04100111649112159084fd9c583f8b2550c80b7d8a14f3efbe1a6505377ea6baebe335d419093993720010b157528832ae3cd60003a20868d2c0449940f1f67b4f5c7ce7b567e14f5b86fdae624a28331f7fa7a66fd2852703f0f2530e2aec988bec78ea3b18dc98b361a5b272195a7a44cf78ad79705d3071f0a85f50c09e40f92993e59a000f14824a22f43f5bbedcaa0900021c6127a7114703b26ec635ad4f4e0a0eb698b6eaa124aa51a882777cbacb0718d2c0bbce76d34444f9869a5aa6a15dddb6db41740df3339c89a6685cf2a12cd9940274101642479605b16a84836340410f8981a9970d83c3e12b380d2c6c170c3065083243d2507b9e1519cf6a6fde0f0e3b3f599180a46617c627bca92693182c305b944b5065ab6826c396a05037aba3799b175aab6e9d4363b1146561b42c6c41f440a4845a99b546db12e5402c0081504b895064192cee9a5aa07dc2e5ff1b03b76edae166d4862a90f9f0f0c60718cf4d2b4d074bc4b039bd318c2a1c20f019880481e86401f04cd6cb852bd14e8da5507dd7a5e0d1aebcdcf7c6aa67a4395cabbe478277c926c10a4a09334ae02c055662ac49a182996d372496c648b4c61d8d6259999e8707cf8c86974138ce76186040c631843c318c600c17b74c2a110615abd800c8808232a90518df68a02ecb2b1b09ce78418ce96de351aac9370d10ca38efb23b9c11a0506a154ad32b025d54c0b2449444b56d544aa168424e104824838412c556a6dc8ac386592d6aa88b2012498b10398410544d58052108a8a28a454014522105590d0295b14189108282b142b0d785f1e5a21a2f40795a16bcf6db5c8994edbdadc111ef31602ba84e08bc94ee5667edd17af3dcba2e579ebb57e06542ad57668e2976def3e0f53f066820693570a7e9600c84150644711b01adc0a2aab6ed11066e5468cc0bd3db3d7dc806967b8fac98aa370932cc01281a2182346ddd3687896df55b73b8de328dbba89682f351bd6b9de6872196959d4a8c82598855576570cf192b408c1010c146cad244b44d9232a46e9496361588c3185544560ab0045422445141648c645200b090058401ecf73517bd5201215dddd0f11c4dca07c888b9b24922b9867250d14394c9354c3b0a69703ad58eb55bdb3674e7873a34b6f7a595a75357edeed7df4f680f0c4518d42d914582a29381598d2054d10d5f1ebe3ae3e93e8e8c3c9078e33a8a8aa8b3ab66b66f31b677d32d5699d3324931d336e2b4a0f37a52a808019f1febee81cbbc1aaa6a321b7e5b14a63f6a0671091fc03f4f9da62f302b088c71a27f7659c6f0c2df4b661f7740cc7a73fc04c91c9e29fc035dc10ef7f6fe3534750e9427cb02a9f07a6ac4e3c0ebd0be26403710202573fe877c098db8f0aea631c8a3436da59c184ebc5df9efc50359a4fb59c4dda87216e0226aceac26c3cbb21d61cf32221b0e89052088ab24351e500c9efd7768326874e8cd9b0a4a4a3d2c06f93e47d7fec998029b8a4fe1003a91813affacfe76e67790c4d625420c9d6a914be9fe672d1fbd9649df96b5e34a49f9f3ad73888aa4e638c294247ddf245a11154cfc0928445533bc1c627afa0d6348329de8b062eb00dd4f84bfbe8efd3bcee3d7552b9ff17df9db4a031334667903243222e86406cf40333cb35bbf6cf11719ba20dfd57074a25a40bc2206e407e8ab827838f870110e5fb586e1c183e17b5244484d768b7575b6036282d3042106451ef2838b492a43702fa1644b00faf8a3d96b85c22c5820845b888d817f1cd0e66128b8675c534d11f76d4dccea751227b380118e4a464bc2a1cd2f722b2881d34a040c3b7b00573d758d277413bc185ec94d3090e12dc141883cc866c2a47b24434e3cecb089ac41dc854a5373b0a2c5514f0335ae361927da9c7dc79b61c681f04bd88620874e14de69396986c356353942a3227486b8dfa4db21ade6a4bdb34b7bd22e0085c43100d7c6b93ce9cf3a19dfb94d1f4fece7edcefe9fcbd942db2b592da4e40e6120717fb7cd94544eec7fec001c40fedde0e2020810cf2021a9feb37bc1cf9f0dc18c287987baebcfd3fc747e776efefdf5f7b45e6d0e5d2765e34ce5c42a4348077f1d1c4219ccf4f86a134c2292b0a37c9ebe9ad8cf877ece19263a0ce23ca18828419beb700e77f5ebd3af19d6d4938612b14143e42dacca7bc43c19a4d590a56d6a81a419050c81c0d7b6c576b2742bb5a3354f128ab1d391ae5763bbbe8cc43526dceee5cb8ce3df6571972791206adeaaaaab1562aaac8aaab0558ab155562aaaaac5583155521757134e391beb8d2add6d7025ed869989573ac7c66e95fb1400aef4d8c7b827a018a01d17ff4c78220037f67cd90198e1fe4f04c4a7b8c394c8d3d1c619999381b9441fea081022221cfafb384ece82215a661ca6afdfd3380322041582fba3f3cd1d434f8d63b367c6f3c9e5aab535067763a030c8173772c4db9793843023934e7148c6fc83870c397e10addf200e0a2340ac0cc8c134e090c47c578da08f23d08732f2aa1a06e9bd14504e1d72d6bb701e9a842b5086fc21469360584ebb9044301aded599fb2f427b4acf98bd286c768be2c6c1010ceb759a13cbbbda40b5037d390501f23c2103c3e4a330a1b15048a024473ed3a78e83608b188a7bc0b39a620051842e79c210a7de43c69ce1eab994f8e43593f5e9df73a24dda342a0b24ee683904b46af424dadbb945dc8792976ecff5614311e57e376e730146d990870304600418bc3c4f1d0e260bb8573521c7392fe29c2006848a4462210cebbdb6be5cea5cf17af1738bec0e6e301bde676fe2ced152519fc8d41e59b7e92e0b4e11e89ae637d08c6324b6e829864c438f81982ecf9821718c88208761f2325f355a48c821cbbb521c5a30dd25658b27df224f85ed0b4e305f48a1d616517b75c688d4089153612503c2cd0fe6fac3156bebef43110afde23c74aaa6dc0124a0414defcae21bd87ab08f9958197efbb5d5a309aeb9a859cce4f5edb742c3506c210603021061e6df7ea72bc9030440b83fe78d60b03797d850d6392e08d070854038eeca7bec40e612df33bffd8372a2b799c605e910bf3b88b37823d2d323c9078a210d4a063808c0e4d9a058822247d43513ca4f17d5783e3e3dbf3f663efd5e38057459b8aa999b0a62e5ee41afc2af75e72ac102044440a13f59291999ab80983549955800a814833acbecf8920788d4706c28c39c81fcb34833eb84a54bf630be1e32fc1c61eb187c0f21b52b278103abc49f8d1dbae5b9c61bfd4deccb828f37cb785c342961c6afa50e350bee0d0aeda1ac53b3c79a1d370f12a8a399a1a1479323a102b304b81842002f6140622fc244cafb87c0beac6a7030d2c30e3b471cda92c2f853197e82742a4741c273006f6392f35086913f829c4f750b3b68fe44313d452c9236c4f3805bb776f1fa9ae07aefe0ed8d0704ae2911a70829bdf0d7da72aa00a060d45553047348948248137e14235e55cefab9c48a28a31a716f38c6934952a3bf793ef1fbb592f80404fa44d7b0149b0436b54f0c185dc38d1ac1312754f5e5c2d20422f0c697b078568f2da55a762268c0d0707d56c0f1613b0c9e40c35d7b95b2e620f066ec6e7290b265836318c18290230709cb0721aa121bcb235a80672a45052f8f019e09e19c64b196bd88e8e9ab83600348010646081828eefa8f63effddf64fb44a90824d0eff52935f8c892cb4a7d48a9b18eb6e9d4f9598ebe679490a3d28e4822a38d84d3e9b650961ebeb0231215a596a6b5f93b989fcb5d394c9a977502a1bb8ae010dae90f8ece657a40e0024fd24ba35c5e7c3a7b27080ae8e78c88f5653ebf8b771d41ee201508e5c0268a2e443a389456c5181da00e5143cbe276ef1c402d00d2a1d10039453340ef807299880728249e155b088aa750a8c33f80c25571dc4d3e7e45600e54fd1fa67e12d7243a9ddb2d32335e161dc639f0d4a6dec3822029036530526693ae87b8ef3ae86fdaeb6427d47a5284f57ededf043ddf8feb87e5f2cc3eb0f8b4bdf32825bf65a22a22e23f8c1e78bbf2c9312902e7b1e6785c36afba715c1bb2cb21bce781ed2a8d9185430440eae10eda114b54b8cc408c343a82072bcdd7d4cde300c22380fcfe5406bcb22e90806da6bf08a318e597086282202c0400eced219c43b3f45e39d131e3dd5981405cb85e99df83ea77cf0f0279378766add2769eb2a9ec3eebaf0f50601eb1fbf6661c0e7c67b6b75becf2e1dd705b5a72e5442903cbd39cc2cfc42473ba37bdd159002409152450703e9ed3ebf0acfad5f87caf436b9adeb3db4c197a580b9c14e53686b453703b3020c3f1d1f32d27bd80e21e9f1e66d5c736594fd26bf4d3a60e3936b9d8a7eb00e2932ef952e1105e83d275758a7337e4566e5acefb0d427d0650441814c07008010415c58dd26712d09bcdec2dc32ceb203c41d20bac513dfe450dc1ed050f29e10ebdf4799a177440e7eaf606c44389104f6cc10d2087a12a2e26603c2aec1d8ac1d6b60a6433363274ccd0cb373be10d4c1a9e662fa072cd8dcd3eb356f5afbc22420d09450f525c4c27d5a91374a3ecb618be0751194ed540038251d35131099506183c0b875e3dd5810322f051ec5540c4679b1bf436e8a9f985337a52eddbc6d87e032447cd5ddd9932fafc802db2a4072f03d5dc4e3ba9b596147b206ef551b67aa5d772a6fabed6a28bc353e9924923a4c458a2f0df1fc0ee88c8033afd0d3711154dc38d67e5b35296aeff09ad5421db93a10e4735d80022ef90b8b24806b0db049ddd9007a4754147850db0e9e8084900485d144abde2c77afd70a4955ccc98ab9998be52dfa1ac8310d84d48427827846e07d056b561a65edd691619a0905023cf682aaa8a2a8aaf8e39c4729795d9c6f9178e3312447eac3c74a3f9685749c4efe5cfcb8f275e3bb1a909d45948f9342a1200e83d277b006bd7e08c01028151be477ce9b5da8094233145301b68678713435217078b07c2e82d74ce26bbee48bc7d425f6466823916407420052221140d6bc3b895471c758ceb3bdb33270264cee1d29ea589d2f554f8763be1f1f87dacc43b42427bdf77eb67c9840f47987cfe7f2b6d6d6db696eaf7def4661f96027b7200ee348771aa4745e30f6ad6cfe30cc7ed0eba525cb304583eac185fee8014aab7f97eea3ae1aa470fc648a6368fb28b8d5307cef7b995f998a49c35c1d55469a1d6753693902216832151b6d45780e45cc8af007b7f2fe7f34f80c174fe5fd5f1ca09f24271f1b8972ce592b149fa33c19882c5dda4f6bd536f4df0533a6e92f55b26edb704ee0793684402731dd7f848cd27df2333063e885097bee3e947ad8747f3a1d07b8c7c0fd013a38073081c53f663a775645354191610353ed45a1865424ebd7b4e1026a0ed9d3b6975c6bbeac0510d1e46f0120c609f49087626bb51b99c0272a8937a0ec895ae14d3b87962813456542018807440e18fd02d87dbf7344b637d18488181a0233d141472602e5c5444880bf2b1903dc6f6bceba4c2030fb1417cb3358e04970a60d91db73a05503bab89189d54b1002ed70e1b72522d3a10e839b8f1230ac80a8e33e504302accc3e299e80f9c44d330a9a069937cf1ca6197130cb8985ef2dea37fa3b69117cad9d37f873e50cd30be44c6526c75850ec50ea03c4e5b69b4b375ff11aa3cdc3a6489eb736bf5c3eb9610ac21718efade08f07e49d55c1042e012e351412406e839000d87afa9eaeba71ad6e70d078c1d719198829a2e0bbbe94b75d15091091424416405915036050989264eeed8470048090183220476760ab7dc85ddc13bdcd05824584c5c90e97c6d95e35ad5dcb5371fbf99b5555555631826f8ede9c6321bdd29aeacbfae4c4d0a332ce8fba29b8607204c044e85264e3c1e29cb36db9aa40d19ac1de26b17452249b6b55415724ce4a717b801a9158663f457abca2dd125bd6ce3bd5f1629c69e5008699ada690e468699bc3c3bf9e5f11d47ecaaafeeaaaebdfdc05d4e7b395b6f0e91eaadf248fe5a527381371c9ce701f48aa01fe0e00118d9a8042d4b38bc7aeaf080c27aa771cd3acadbc2c373e1d5941d3a031ef5747b88f3cbb7ae503bcd0d9a6f325de2482598840030bde7b6c38f7a1e78a3f77dc08241fca7dfd8846f36be45618aab41032392116288ee249ee001e0052f0009fb2d14a1f6f6a94851e8e3f6225d30f0377b9807b58c7b5dbf85f598335568ca7984163c20e20dee7b3d7d23a66edd4f4dbc20d43e5d09e9dfcf8cf8f3b7b86b35903a30efbe8182b1f29ecfe607a802816482560388b41d5f93c149047629e7d16761787f0ddbf5aede7d131c2f35ddbd5545c377fd318dd7a737d0bfa3c74e45642f3bc7edb83f1bea776389e8fbe9f2f1c6bf1ee1b7ec96d87273ab3c60c172b9aa725d7efddadd60b4f0366566316d59d1c26bc3c504dc32c0c1999999917cf4003dd8fe8ab6b4df76a8273b7572150fcefbd11155557755bb75f43bcd0d99ef55671bcd0d99ca0cc7884418dd862ba4a2d4b74bcef2d9044d462f85ccaaca760b06663a989724c5338220320601806099c0db919c882de6d6a215cab263d34c3499d8686cce4456371a1b33dc3b0f4312eff55173b0c002c7bf75ab4aecc0256e08f779b04bd0030400c3c7c5db26b58c0ea79983ad5470641b173e41bd8ede3afa71eea0f685a5a5e0a3a88be860cc5d37e85fcb6980e80ceba13d448c56723858c860e44239f5af0e8f3eb88f2b6ef8b1a029e0cd6b82ec43cafbef8c5ce739ce80ee54484720d92734cdf3fef1a806b1540d7c0cf455f24a78e5744e8686cd1ea7bc85c2a0127282b73af54f2fddda37bf59ee3eee7315c21283928804d3c3cbbf9cf2ca5998335596ecd1c2c160065f877473b044b9527e9b2910dbc3c49684ab9577fc0e875ebdbb75e73695318c87f70079807dbf38355c785f7a3a645cb79129365765ce333f08f6a7b2ed299072a8ed63589c124a2a88a3a162d12e003117c358ae31f1e282a0cf80007a4c9827d6d6c1db614719b11652b5c688888888ec616da666193054379940c4900cb66f38878345647baa081cb131233b7174ec7abeddebda9d7af5eb2b4ed343667a8df809622b13c40ee629c085a001504ddf0bf738572ad51e0016e77162fdc34266ac58eb6adbcecf898b3e27e6c7e1fc9b7ffe33eec6e000b985464e35dbc3c3758751a1b3671d0df94094856c6f51b8c5343721a22f0834acf9ba96006a550991eff7f8bf4511f0b81014f2374077fc75f1f9dc81333350044439c210b1cef36833270113ddd137088fbc3bca66667d2d867fd17a15be2fcc59a23b71f83c6df20ac04b13333e6958869f79f11d794ba983355616e9e49616465aba85f279603bd246f9eb593bc0c4771872654a74ebfb7c88e05a24947b667d941801dc423f7b70dee8c4666f7efcd617e0cccacaaaad00e000707808001b006a6434780da1ccdc1f29415881102bd6766082f543f2f48b81378df57b7dffa78fc40f9d892ba1c3a1106c0d0f70e5d35c9d96fe3f63def0baea4202c8be55ef257f2f82314a61c56b07824cf1abf9bc4c8c5c7e984966725b668d73ed958937c2b456a19f4445a83f249ab592eeaafba69091562a44a1d6a3aca24b079bc579fadee8bf2742721539fe6ea858d325d0e599c373b6c08450ff18f7cc0b9e95ec83533d505af9a00145a1b71efe43ebd5206631a0f90920000cc606ba99c0003e6b33384fc8c5bff55725afc0ff87797ede91d29db08c6afddceb7c7e77a0e17110ddfa79a6f4d80038bd8798cc563f1fac7850fe1048310542229fa0f35007c1183f7aac7f96baf1c76a7e4ba1fe4f19a62aacdb711f3db3441f64f86ac1d98618601d907d9bdb37c6a601abcd6af888d4b869a41b6c7bb6067d61f8380a07fd181b1ee3079786ed7dab148e7be989e90e704444444441b8a00000c696d949340596f3e72b0e6686cd47aab38de686ccfccaaae407d02a4e4e02158996d78f2e880b6bbb2e533d5bf462ec1b3256e47b8413a288a6b5f089110e11a81668a420c0bebbb9e0465c79093e90fb1eeaac197fd3fb70211d61f600f2f957faa897f700189f8bca7d4d7f511104eca161e7d7a04ec29a0c5dbab861bb69ef9a2bd572467bba8c434f502f79d7f3e5753b090052320450720cde8480865e68a17496e62a4c810c2e327c36185b27d02710d50fcf281e10242140d7fdf3ae308139aa6a9df764a34cbacc94a1bfe41dc0192ded048019a10c940adce1b0075241f818d7195fd982ee320a6433db337d2a843ccc55cfd402193f20682681e5ad8e24f32b4f235349a7668afc52f2cac35f54285e37903643c65feb00d61a34a76e0d19ef00f30a386c048c244867a8468eb1ee7c31313d5a0ee9eea27b5965cbbab8ed0c5e708165f7a08bc94832000482284589081088a0c48a0c8208442320290628b08003148312118448c05182b200ac5220a609d4a0ec6bbf95486d9503da45ddade90fdf61649dc221dde8ee36001a51b2c0019b952a4120e554377105cc1d9e777c0c01b0f257d8242e0c3cc01d54bc00f0e5e68bd83801b0c899fb0934c0ec0ad4d074953b6042112b8d2f07053ac2dbde89ae63b4c80059990df879ccd4b464dc66ded43863436ba73a50a3b0026ae1f0450bd2b268003a757f406f354e321e50fd444413aea9ef15ca4444ee0d96f8f7fdc6740746e2b79493b6b5d0124883b68787328059206b1253487b00410a20c8198834a457a7cef7eaaf3279e1f9193ae74f60027d45490f625302a36fba2c84848485daf99c3c42a40f60878ebb8ff50fa006e713e033c084c879862d35c7502788289711ac00c87d2a4a40ed03131e1e600a79011e3b38fac376f31328393b91bf801d7e5c6eb379a4af0a6a583403c3861a49ead16a7a9031cc5a062cc1f587d812085a00750f334ce75ce1bcb36f827b6ef479db6d2d0faeaa028f700b2535f06029a692443066d94131f4fbbedf82386ea33f224fb90c1e60075b43b30f4cfd4f473d3a82e3bf02b4e3d3cd99d310d19c44412f3c78bcf6e6e227e28bd08bbe2ee0540a5605945a1e53b50d77e6d5d8198c211b7321e86067249c4834252587ea015553b2f39408f84d3a9a46f9a94001784b8a475091b76ad4110402e06669838de90b0aec6cfa9bfef302ed8ed4297d1025f4a612a43c835029dda5d568910dc148b1f090c1d0d7821bfcca7ae3f24dbb5ef70a0e739f647cc02e80706267a6816e085501cf08779bc3c4baf38d071849fb8cfd0fa112a4938f7087dc41edebcd7ac9b9c3bf7c110e5ec47ad5f99014072b02021fb8e3cea2caeeb680037bdb318445f5652042e6b7d8007b9b1b9f2bc7d471a50913a19437006729a81a5402bdc9652e9c2a347c0037c5ef800a37ad772f4cee03a830ed0d708ff494d9ec4cfe74c9b73f3af3d99b4f79d11918412424499e524330d4f1c3480002033df43a93d4cc839620a5355ba4b79221942b57863201e1411be316e6fa85620e41ee26a2ce86498819a5391f1390e6102dc64681e0720f5bf9607a2e95430884d7a35dbfb3f4ebd5cd4e3b29b154075f13a83e507a6bccec0729ef02357917c20a734fe039cd8f300077f240e429d7d75d019d69379f9e34b5a8055b0164d2dbb42a6fef1155f77e87a54de837a86a678158c3554b98df7e280da8d26c698eb2b5e61bf6038888826aef3e4713ec5638434fc003aa21ae4039533ba34fc42440d91d598a001c25be9b68a4e5092c467da36d701492c548f50030c4930b428c53cdde552c15f9b2a776698c640902a0bf6bdb6e46d0c6a8a1cb87edc7e9b9a6db16f1ad0487a8e28924924963f08b20741508d221f2501f9c891ecd66a9b6f8d411a73dce7b10230084210d0df5e23ad9d7cb6325b69ab88fbc731a465f7ec89a34e1b7c58292da524c8065e87097af4ba8a403f7800328438415e300d35f31aa0f97304d174683d7f51b00ca1e6000d9e8bb557e486decf3fb8b720a5fc74801d7c7458bd58783ecb0b1b7cface6c1e5d40586ed201b227754829b9a7c7d139599b3f1175d50e242a6bef00aaa00a1d765130df8fd036c6c68678c3969325a56f7556177021656bd963b8cdd2a9103f1c51fe60048b21223232280a045920b245905915108a40448222ac0501541604440050148a2a9082c58b020a490514522c022804522c914088802c59082c022c0515401488c91420b0054488c82c8280a420b21162a924508a2c82908a08908b055480ac14521140050160aa3151416290505920281161229045641191423164505016421105248aaafe42aafc54007ef1103ec1240916914512a2a0feb05442e2544440d73ffe2ee48a70a1215c12e252',
- 				"CCAN": b'425a683931415926535969efe77300fe2e9f8050077ff03ffffffabfffffea60441e7d80000000180e038b84000f01401f221000900f8fbdc7bc2b3df67b838e770e737dd71f7baf7b53777c3c6ed6739dcca003edef6799ddc6cc29f4ea5ddba0065d0029d0d4401a8803ed85d800575d074a79beef40723450376f2bdbae93b776a8054a8685d6748000f84015400001e802801f46b23d0740800f01a9e90020004d0010680a69ea6a36941e29fa880d4f464152023536827aa7a43d2193f53447a83200001298491146aa6f53ca9a19a7a649ed509e53d40c8c8327a80024f5524226a98653468f506d407a8000000001352928d04a3f2a3d434c8680d0680321a68f50d000911020209a0046434d264d049a6934c628038097aa92d0a464a868495652ad0a46929a148c9545031242490c0048f8f3eaf2871eff6ff3fee7fa323fa7fd7f7aba191a7f8fdc7e59f1576985b3b7f962edb41fc0a0329fe2f647fb1fd7c26197d4ef77fa45ba56a2b40cd3e8d7465ed5fda0298ff6fa6c6d1f7921f90389007910108012ee118cc32213ca8e7f70d6b5ad689fdd8f7d4bc26b13cf58618b163ebfded007b49a81263448fedbda7a5756f33c595e11fddf4406ad6d4fd0928f162461e0ecf7c43a283a537f1d9ba6bcb318c266e4db5dd1ae6900b037327875aedcdc0c41f370c6ecaf277f01761286e62ef253031e22ab0648f15ec84bfde3651385c3f200c70cd9ad13c7ebb3444f4faca3a16a10511129ed37db2fa6ad6b5d901789cf40ca968d68d04a17d1aee476f8c5ceb4737cc31fb31a7771f074dadf730363663124c1965a125b21cb490e3468a50610a04f4136094d0555559e916e550b715b04f9deb10f566daa168508535ca780d8c1fbba75ce90035bcaf4bc9c00a90124ecc976124fa2ebd8def83c52f0f63800bfcc2876dc110e9d7a93cd8e146315a25778ad4b158a45fc370efb27c4cd09982b69b1a1bdc997971a982b75290f3b437b90d927516ecbabbab8c6755108e59d95930dc6be3de49e3244aa43cc7854ebb68ffc768c4bae2fda25970f1238ac74eb68df44eabae634b6bb0636d0b736dd53237da45ef60ab4ea888d1a801cade4705f5d341e4e7d5ce33840650e645b18f4b1b018ff9aaa8399178d3d1b54b770934512eef4b79d21f1cf4fee690db54447572739a5f897fd89b072a1dc3969378f2a36232861249232f6a2f17f5ee1f84b8afbe7bebe7b61e7707766430f2a09ba48e3e34bce0cceb2417dc1de049a44c010e968d63556c1191e4b5388585d9c466d12be9a3268953d70badb274c78128c8f4c5c4d63f0fbf859578303c7c65ade483b7aba44c85abdd3b3a92f65d44fd71a35a93584baf849f6564924db4628ec18e5daf19763c9f6d7aba5016530fe3839c1b605d34c93a6abacb1b5db62d74ca8b7606ddfead1f7c23e2c2773780a2c87605cc6d2485fe8bf4a11132651635111939bc6e70793343c6ae12a517e4fc8c0cf19f6209c76b1b268e6b42a243d9b2feed715124374730297fb5d7f78aeadfdf2fb49d1c36172ec1810735d184615f75af0a76af01d507e58e1b2c0f135a0886e413d2cdc0f2cb90dcfba3e400f1df5775d1fa98a1051113af841db93c51134e90125e14af6acab8968fa5cbcf5e8e6f9ce793b850df211f2c7986d6313f1f6f7dad6b5ad6c851c38786dc09767572ad04477477d0d720eaf8508b7c1de6ef14b9b5afd20005f0eeb0ee09075fd02757a9658d852b6256e22d2ab96b5de8177b03ede140f45b267bcadc4b61d6de8dc5d655df260b5a40eb52027162d7df25acb325fb152c8106a0260c5ae105acb20b8156f970f0efe3f1e5f1d3846ab92ad39e4cea6cba24605525ad78a05e2c144b8535504c4a9ad4e4d0001a589ccc457639bed7ca98c786c40057580c006fbd8df47429f0e0ffb1b83fd2cd361171032b118c6ac65ab160b7b17b04b1a2e6273cfdbed1a2ca6e83749dcd5fad4af02144a94d1f146e340fadef5f5fdbd7a6db6de9ae7cf557fdc057c7092af5857b52ab5484d55ea2a2e382e25cb8394d4b2b15aab299591314d4a6a062b9690b88c54c4ae7289ca651cb48b885a25ad24d6a2d172e16a6aa2b864342d2989569565952b4496961efd54e0f31ce700e0e73d5fd7eaf77ce179fe98745207f074becaab347e579b52f58a635b05bb72cf2a337560dc9b5511042a31a56e0d58086210894f0887010850314ca7911592aaf62edc3c7182f6b52999989ba15742b22aa545628ab66b2a9431831d32b336d252b156dcd1d392714660bda18331e564dbbbbccab927056c6e8515b5118aa466bc9b3a2743cc61d5c5c549d372714660bda1999851373aa6d3c8516346298bbb4ee6f68ca95c3c5b2c638a042390920424c4024024c0048690920117b53133333338d32cef7bdef7bdf877ae9c58ee5caf2fd6d71b6171fc9c3f5af8ef7cb2080b86079387932cea0bd92023e4a1911918673a48ca8b008140d98364531e2640682e285c585e550d105e5ab6ba8c1fd609e582591c208aa51213bb2c5c255183994b3b2d1902907b9d552ecfbd0b83def6320461b6e9331468a1d3121486ae066454932bec8c5a42cc1977176c736da9247023e1120fe88b1ae69998ef3be3a0aafd5d666e954f48a39ac7977f429e75ef6e93f5c6aa1d46fd1ad6b5adebe5803eaffdce739c1c1d05e68f0bee8523c3b9c42570ce5e59ed43050465001d72f74d3c0040a9090bdd99b19933758c48db46ad5e446de52c39374b66ab50a1886d9b7bb6c429956b9071d491a64598a6631b0a774c1358de6e56ba88a7b140caa893991311856ec72dceb4ef931c244d32a95d9a1564b9999dabcbbbbbd591b494ee6eae181098aae5699792998c40080013120c5a8432b6848cc5bb359b7b58d6bd736decc598553b34a05e222ea05dbbe445dd6c6e5973acee35596f6f6055d41b738e06c6c6e17b7b30b10974b2dcd3219ab773ade468c8b0b346081173786ef2eeeacdddce4e5de455aa5bb32d1ddc1ba771ab75379862b4e6d5dcb998c755b8f5ee09a59b0b6f2a4852e1babad99bab140d2b7515aa966ccb477706e9dc6add4de618ad39b5772e6631d56e3d7b826966c2dbca9214b86eaeb666eac570f26366f372a3b05da655044c8e2221a0492443b4a458b136c5460d27621552654d63506a631a6d2b288ac484ae444ebae4bce372460ab9092dad4b5d4b64f02002e2372ce2b97c28951d1f7dd9d39a762b7a533becb747df8b6f5cb2b578da55aaa6a7746b60b1d90965064c72c920eaeec6dc5bc3bea686ac27072f0e72686ac2707e2ddd1489249249403518adea75d3b1c099830d4d021c9c710084ab13630de2ab4859bb8706f85a9705af9da520678744927e1da93a952ab24cca808b1ac1354754ada3bee739c739e361514626c6e410aef3bb9d1c3a3875a95c098665d8054ea49e18078466017744b492a1e48e10b31aa966340458d6251b4c5647322c448476b91c43658a165ab18100804c31a7291d748e296885468b2c06a20c46231194c86532188caeb2d8e4921449b754b62159649295c910acb24944ad7596e228c85294a30200a4ac68864722ecd11792d7786ebfdf6eb71d377ef7676bb7976000002400375c6eb92bae725794bbf48bc08e0a33c0f00365c874a76d2841e061a1d88e41b2930ad89b1262c4b34cca45145266f5078b74018b034c77a99aee088149714a378b4dd487dcdddfd1cbc46f4e5dfa000000000000000000000001000f2f3579f7e717377f239eaede2eae795bc00036dd976f3e6f2bc78e8000012492492492492edd636caa478795236db6db6d09803ccaa47855236db6db6d09803337aeda6d60b1f4834a918f15ccc441713166b2801d14a7163111f42a9ac6578d201620e09cc6fa5951560c434795b0e6404bb33b7d2f1e0ec886f11c69205a9676d1a764f0b8b570f071ccb25652d490aa6922f6cdc5ccc8b01edccced223082c1af0df1b1dea668b88e2dce6619d6d04d3d43c434210b05d5d7388b9b95e140594018100406f25330ca02a86733905b6242a9948d6b51a5939aa105d6609ac4924b0d170c828a613311b9c66449696656f7469bf3a78de73bec2d7572a0490978f0480d304b31244904213cfc7377f15d000000000000003975dfae6eba2b96f55956eeb6ddeed9dc2f33b491b37247c5305c65c8aea492c492492a3f11f57a59c28f7143a69404434d51c078f4790b982c090c95c2bcca8ebae50e7539d2048e26a26812226a2d464474bcc66025da31a388c675481d2c0ab12c305aee18f6609034310e5c08b11a8c68e975198096a31a388c675481d2c0ab12c305aee18f6609034310e5c08b177a94de73088cd303cf91211df6b58801e6ac06010e030ef065fc0ccc0c0fb90a47d38417e3857994bbf55e190bcaca4fa5885e5a28f4d506d44bbf493bf3d9a11b036546c93bf0bc30f0614681b0489600313a05f737a0bff8562995b3a4e768731d055f4759d2255eadad921d66b8d5ca5d524743104191305f07a3d2b65483462ad45af55a3699b96ef9c6ad96e356a5981c7aca22acc0348f8cd982e4960c668c7180dbc0e0b0de720d735896bc06090200486d99351612d1b77d92ce50f0c6c97565cce6953b75c1362d8bad5cc1575a734da2ad64b69156d25cd515dbae26c9536d9b4da8b6973398bcfb9c0bad36575dfc15b54bac9b1c6d5c5ae2dc51554cb5c9b928d54b22d88b655767f8ee9e5ecf1f0ed9b8d9732e6dce636f306781063467b2c9995249253cb8b12492446d72528e95f22f649dc9be36724322ab34c518921249ffe4484812ef3a70ff4fabfed4fe0a96677de286857e3e7e7a52b5e1c39f3ac4ad2d2bbd3045e2b6202dc5e7ffbe45205c4100f6c90211d96c081769cecfc9ef3c7d5f0f736ac7f8ff11349191edd6235ec412ca937f8f5671d9aadb2ddb071f12b5e46d346666621666609b546da936ac5ada8d46b016d84bc45d7d77e5a16048b2bb47c3850994122a4085cc3fb17292573a18485728d63054a6d7edd6a6484b2119305e599533cb59309017fc3360c1531b65df4321018483018f9b654cb06f26016a6400641915317e591cea660841c70498e98c19611a24182fd2c69642bdc41970b5ab64837b9bfebac44320d7cff913eb6446e1bc83b526376bb10e90248f50f123c9fcc45823d1d44fdec786945a3a521760300c14ea37f1e7c2c6f1696b55c5dc60d6b96b771836016d5c564bf675231c33209084ee19dacbaf720d5960c2ec17c90017845dc8c7206da422f234401349bdbcd5a6d670d7ce738f1eeedbaf1ce61b088e71f0e161af90d2312492534c84678dc6d5c2bab5925ad35ba549b62a8498034340a0681b01b4da4083d45d2b5e9d863b30906067aa4414ad04b3510028ab5252881496d2b93cac02416fa2e54bdb277117466db6cc0b3ae1d84ab66efbd0468513def95441530c75250a4d46c633d067c8b737f01f56c78c732dd49573158e20726f5985525915677e3b36a2e8d0d1a6c8125a1b175bc48d2be2732385a80c156000ee06a08492568110a5c586b2a5d01d49b42484bdc451c39c9a5d69cdd7a5d69cda6dbc1a78a38928c8b0cc986242004b3331a9ef7883c8af2c7564f2b82b96b657cac8122c7c1532a2150ca92929ccdf56a7c01bf99a1ce041b65a7c1c98eb4d8e0086563639c8564f20884de9bc13761bc601b912ad9b36805930eb05a70372c62cc91285130546120f8bf53954f9eccd71872ebbbdc47873dc7b7c7b872f83fa3c253d90f75d73350956da6922a79326cddcd16eeedcd156199376ebd69c5a96bd041a1633310a8861a869886a26d3830333dd98101989188062584d6272ab876db4398748cc68eb53634385bdf850048f000b14ad0095e0f9bcb3bdee956294a0e631bd4e8ddf38280e8424b9c4ba537c01b07155d73826dba5100b995a4a0c06df521717dc3ea1b6f7c8e27a3bbee3b998662d1642c3265d0b985178b1a18b5c1f785d6ace95406b52f0d3254403540b12f483156fdac68d4dbd59b6c44ae6ed98f66dddb2a2482ae1a6f76922cf7e57a72aa4770bba081a63631b5821625e93e1ceb9814bedda6665ede63381cda040a834da829283db17bed334c612124b181b5d80ed5ca2c052cd14a65945925c6f7e1963189c0ac8ef6db6d9d59f713d8dadf214f76065369b2e4165d68939cf0bbde12173df06b4411708b5c5ec654acedce42feef1edf575701a3279247611d64328c10e03699620a4b8db6f735c31a04b124b0aeeecd1ec86a94dcdbb8f44d2eaddb3a4dce73b3959753a5d4a6ca9b5aa5316a6c44a91a32cb63693246ecce0c16e143705b8515259152998c98e35da73d7f17c7cf155f2de95bb78ec9531ceb9dac016315729128e75d6f71de6e9080ed314a52422c5e6b10af9e56aba9d85267e9c175b6ae1d25f3d69b563388d55238aa4d2bce96e046f6bda353a6d1d7bf4eacb0a07ac06a4c52292894e9b3c356a1c635024934dd28b5ee9ba5c82d35e08ecedaf4807b8c06d2f43e84d547241f4196f2fa65aa892ac520836d97732886657b4aa0e31493b02a710e91256db8cd74db4289aceb750321530fb2a1d0506e8ee1eb1e9eff0f18f4e1b3d503a9251cbed8e8db6abc85a396235bb2ee526bd9bb9479905998259896425892d1d4949bad970d4a398a2e1db971738b9b5c3435449b52cc21046928db562d6a8b6acf87e5dcedd70dfa83130a61f29d194984f4c5f16ad2960a5215d4c436d91043735bd7162cfa8296e754546d9c799830dea4154f1a3cf5da0b91d9d82d5ac5768eeec4aebf47609ef22a0f5ea83112b220f1438d68e6ab7592429b72d2968b744259ac733313f6fb887bbd2bfe4e5be742e5902b6614aa4092931083f152783a089bd2944ba85737244810804577df4d659de4e96ada9696589b72fa74880fb7c2537c8a90c10e0848218836667130f77cf3ed0a14c42010bf37934a0f2a304a0d1ff11f46af5b02963206a84888630625fca920478e1ffb214ab5343f776288a8cccc8f9d0e0686ae4df125fdb41b2c8115120690a56dbffec1bda069dcd0381c0cac60c21ff146db49680983b1908c2dec016b66880cca0a8490e1b854e0aa34252820e00646689a896380d073417f79392cceb0b0588d881993365106dfe91fa36cff0296d3646a92f163ff645b3b58b1eaecc47ecd2a261780fee3fcf91ed888770556c7ab03264946900c83f77f4399fd49a36d7b197bdfdfdeb31ef62d4b56d316b631ec6732dfb91120f58f196248109404b2250bf80e2423fc479090143e633fba889107ac0151240849dbd0d3d7476124084bf8d42858198928c4aa50c4a52950941ad178fd4fc15cbb507645a0bc16ebd6bb3c776bc8b3e39f177cf67317d309a759d7921f69f19f82be465ff7ffedb87dec61363494b164bdfefeb7574b97f4fbd7c5dbbedfb2ab97bcfb7d9dde41fc7e7ba11c241f7340b7eb17e54de418b9863e30663043e034783ba5ee09c8f6721cb6db6db24fcced75b51b51c24924909236f4f659d6700c4203101ef3d0c2a568966c492ab068584a8807abbe902b36f0cb8d51daa56e6d58b9629625b60c626e0fafdfdfed5422c7136712683be073e1f0b27ac10c76c913c7c7332a12fc92fc2a6aaa6aaa6aa1a84a1b574f86ae5a533334acb0db565b6d0495366e3ade77a4b5cf178ddc486cc000a92c748ececa4c41adb6c0409e527ccf80c3a373390798c4c54cf34d158867532d5f924b72c90b2b10c633126c77050409306106695c2731a8410d2ce000e252049071ed104ebe65b90dbcdb1ace039876b167abd350a2bb488a692559b46a2552da2d1568c120cc10b10bc78700cf7b350175ed3dc5dd3c6231c70e265a24924a8037c6e8db1b7bf04d08c5e7b90ead51a322c6537c3845dd4903c0f93b954dd19969083768c4e8253cb5d66ac399990604d518ad6896b264d18f4d0c5519529291bb2d76db841110960075365bcd8768de41643d75b4e53f0e19fe07d0a0f9799567d06318c6318c6318c1e318f18c78c4318d886262189886310884974ba4923fb80658199320a7738fc9fb1f525ff9b973b20ae5f8ee15c080d77efba27011d0e49664edb9a76f8e7c4d3fa3ea67d340e5450d1fa31eb2e087f44d77f0e3d4222ff868ea39a066fdb0ea20c46ae6d6b03d5572d2a7d22dc9a41c006818fbd2f569b200e2469836e260bc1b932dca140492850c4360ee7d090285cf13e263cfc6bd25c5291bdd35c93d35dd755ba928987f403420a9c5635e7d09083af43afac2e2e61970dca06c6669f25dbd76d4551e600306800244868030624032408686db6db698d5a55a0b33e5e804592fd23f73fde84fd3c610404f97d68f3b2bcb9f3faaefaae7de622202a8ce190f7fcd3a1f9084e80abc3f4650221ab15908b3585a0ebd01d80f334a9a9d7d39efb8164bd44902128c220b7f91d4a1d66070906e31b1b18249b141f07c3e3b5b576ab4aa9b6adf4e6bdd6f142051c1232f4e22b1c0cdc1e2f5118c0586c1d04b4e27a9d5dbc256a60c15d920e8121ab0d1342b16ac905f214859352c24625286306343d458da4c8fa121290be7750310dc179127210304db1a8ee190defa067be89551c121e1e5cf382181732450e06641a1434a30e2c3ff034c649d0a15378455a938c91236ae7870041b9e8c0ed689486306c0fa4281218cfbc2ef6a4189fa902869b381e3a9022514676ff8809183676440feddb25da95e0363650b240c35f999df36b367d843068e10048f0fbbaa804acf2cb328be0ec3cb87ea39a1f086c51241099e44d9a636fd67ac294625224502600b0af000860692440512d95fd6be9b3d024123ac3f619af7fa29c15c22c5b28f40bbe740a522242d1ab22b052e01624a91ebcf8aab2c58ca7c4f998abef0bd999f81320cf1264a49ec6436352d3432225cef9e90a59f11fb046879ee14f48a69ea1e36d404666ba7728086c43177b817f51872f46670e646aa23c91065ed03188a288e43353dea643a0cc24a649b82a844836548f390864abe28494140c6c11c03ba094d33b4a8c7a281aea2026a9147519ddf6d6945e904097d2081824d0a8c03b4ecf0955123e71cbec8b82c8b6dd65c9a18e4561423c7cd5525612911735623b03c208ea815abdc5546a6696dd75d7848ea7021f14b49112d1a8bbee7fe839d11a827a10612911fc723497fac28f16bea7a7ed5110cab7f51c18a52207261e0c2203f1f0a953cfff59a3bc4612483b9769076f7f747c294817afccf7654ef4861c2f743183018c1a21b6441d0f97327b29337415ff70357eefed90fd4be5e8c3bec4cd41715b267ea5976fd2e350d660fac4e303bb9ef23ed4caa7752106635d4e295124084a454984b368bbe8124904318e1a81a0e38cce730127cb91ae2a7ccfc96be12e94ca97d0be0ae6f291be36bdb24bea539a3d8dc1488cc7e433dc39c01a9df289ea11cd24d10c1c119f8c780d9bdcaf330582b5da9cf70361703c94104ee4952e6c770ceda9918c948815f6c48752d1f4ad58fc8ea78c8a646119840713483523acbeb530995ccd16b26a99c80d5b3d17b0209f2f5cc6777eebe4d12fac84cc18b3f0281d9e7b27f8f7e75ca04b44c0c807f38cb63e24fc7e52751f05dad7c5bf186f1520b1e23fb96fc8e7ccba969944221e1071949d2ed0963e32212c6a3644258c5144258d3591bed610cede3ad2cd6d2c6891896c66449654349638f33f3b9f668908f864c61e68d391e654025a4696f068ea33d892c65201a18cea1621b4ae100bd237c8df96824ee76b2ab41a6318cb1c48509a612430a031ad4cc2609e8104e6d1534801b4da58608d588a43832363870c5724c2db1006467ca42e0c151909e8c901e0b9490939908ca6d7d5ddc8d1609ac1340084c070d1001a4255743cfe9cb8b641ee487c229359f8c1103fe453dc7ee3087e8d183e6d642316c991e9e3511629a7ca806b6789c41cb21fe4e528e5e78f80768d13decb0921080a5d7894ba2d64a0fc1dc50b2a8cbb3fda992c87e030807717177f2bd084eaf1ee6ee42dbaf235d78d5b78a2c58d4c20a700c9a1b2ac510d64410f56c790663a63de5b9e8bc53276edaf4f6fdfbd5e2f56e101110000018800c40041040003f57cdedb97d9fa377abc55ecb5c56df75801f36203319d18d8a0fdc65c490212837a0543082ad451052f3409246ecba31836315eba1e708ba5cf320b2597b08a9eda184b6709a4ae0ee1e036ae07b6f2468b0631be382c14cd5062a17642c3cf2f9fb7673d0269d844aa347a5ee30f97b392bf9677bfaf2cef4ab42d9e6cdf711db0b9366631b5e7dd123648d385d90544a3065519014a07c45230ee0a8dd8a07c06c848e96a5195633cf23e835d41a0233b97192008ef3c586edb8962822499060c621c4150b164c65855100b50eab151d085ee589942a2761a02a1f9b7e2d57747b2efbb575a30daf795d5ab6dcd1d0db2c951a436b0edf9af97abe5be2d6f6653790838902a32772008882fda405389a6a494a3b392ee160d0d133e1ff6ea6493c7a0bcca0d3204fee063f53d628543e9595f1cf5fd0fed5ff570ffe73147d4d5436d865c4d46337a153f63f693058c173071b01524842bb39b1b17263f732a59268a86a72af5ecf9cf9ad786a2faca22d45c5a4db5957d4fc5d2136de7d7f5b2592628f3f48c8dfc9da342f4fa523ee9e0fe91c8d07a07ac0645ceff8408dd6c73520d0176947e49307ed05b7812c04494204513624fe842e568130bf1410432767b777793cc888ea235223ad87d747c2352e0f08295083ab88557677066b9e87f3df416dea12c94a3db91206edb49b1b06da6818d778c0206840c683a3d7b3b27b3b870fb78cf883e2369a5dcea6dda762028008f1a321006f1f91a1064c5465460a182ba5ca09398664a8302a8542cc83b69b9033520c882ba2b927813df7c234532dfff5de90b53c8e9390ec8311a3c19c2e37554be47e8a3c9d08677849e4c5df3f692ada5dca9123f27797c394cd75fcf9e8a2964659bfec0c9fddd59b0f362969b3ebeb146ff48870cabbeb148a4aa5e357cdaa7ce002ec368bad80a30ea36a01434e5c207202bd3b7b3f6f97a2746fcbe6bc86aad53e83c7c34e1273d6bf9491b636db77da00661355d6dec93111111a632a57eedfb07cbea06a2481093d55ce42a5841566e874e9e81d391e9679fa5f15978e5b3af191e564644b581a4d8be54131b06b9121750f14ba64364d7b796dcef4b79cf8af2bd93b00400f86bd3bebaa70c54c164058484afd6db4192d736186a8c8828c14b0940711815aaa348431809a24eaa10c92086b9f1a61b28c840176258181fae0214993b6c64751b067811916560f78eac6736459f1107ef7a0ab9543994201ab8ff8e5b90190cc8edb119640c9806c15b6803318875506b64860d0792b08860b9c6b8cd7c5e49e3d2b5f7741a83bad0f3b8c90a5203681508ad7476155233bf0bce1d1a73b44bc6b9068cae629a18d96afe5c4f9b3e9ea1d17d2963c2b57f1aa91a1885c2fd27dba7e83c76a006ae8781f33cfdedb69b4db3a148445cb931494416a7d9c53ead0b4037fa9a381964c972c955f935f674c4c967feacd1e71c24da232657284a9b4021587e9d4a12be011703602a5285f16a3a98d8d152d8fbdace6610c19f9a050fb5894dbe6333616830f6ce71b938ba06c836c62900130631c5952b3762e850f46b32d527b571bd47e8f8ff5fa93e1f63fa1fa5fdb0b97f6379b967acfd7a6e2961b2e207557509a28a320b3c8e1223f19e483739298ab9792e9c4c4cb8c535c915aa33bcb774d66ea3019f862c8013866f7e2be77afa89af3e7db6fbf8019009a5db6e50431c3119ee8628caa81362817185228846d420d06c647e2201962dbe0f9170bc5e58894bc89eada8b256218c1807775054e5a1c29c256ec0c0d241eec038a965071a41994148bae0aa304a52c16df875a16a8829d421d03630159a6c89dfb8deb41769ce46fb9f2283c3449d85a395ac4d1f29cb43af8de81a1c0ee915296ce82b71a5b71d0786ada632905ebb744307f3023e279facc05bf6cdd8a571b8d5263e0c84fd48333ea42a1905982582f5f5f28827243ac6e590a0eca88471108e22731236f3e1f0f6a4ed485c06ce89fb2b0423047d3df53ef2a9c9c23d9a77815ef012d670ac9361433f32a75f11dd7dd153f610768019a553c3a23f0bc81f925250f886067a2cad9049ddde32509981531f5f6e048d8d82434818c112549495492226a2a66d6c9a018d26340c66ec0503480d3200e8fa74f07e8fc1dbb55ee2e2473186cfb10338b3692a402011f1f72f3601bea60fa2ca8aafb323ed8116bf6125fd82b0172d5208a59c1daf9bc2efaeb7aeedf82be8736f54444444da52c98c03cbafae991ccd4f73abca9bcd4751b0d30994f23ec5ee56c2f3b0e129018ba8a6b9567c0d384054091f742376ab85a2b2e15b06ba00738c99d0a094034db0eb0e430837187bd091b2ca8b23729a50da475211c5071440c82e4e45c2c5b8fb2f9d76ff200247fe40048e66f9eedc67134eb9c7fda780be5461f25d7fd306338be7a8af9de1b72e413b38b29d235b427451114896c1a2c1a8eb4d8d92d2c92895ae2c53f59f73fbf8979f96ee0afaf3d64133274c4a2099951efae427441999fa7cbc812091632c07b18c0e740466022eb1effbbeeb96c658793874a690dd1a008b9d5541ad05f829175990cd3c0019a7ccd36dc00f387b0af103e4040aea9203465b402482493d7023cda805abc752412a56a306e729f3823bb56fb3f530720f2a16b0e3fa7f5cc04858ce3cce3c7f15ab7616853dc2c0535ad046e1966e45215639156283e2a119ddff5f8e1fcfeffcdba47fef6e351f6b8ebbdf180000000000db7e21e2743b69dc8cf2847da1ab8c201e56b9dbf8362b52f10c9382209d57ec6c9ec1d6266fcc9fa05891ba4f410068a16089381ff2647ea54ccb999b9a199c0b85346d980f9943064647a1d44164e22a02816060415127b058eb61350bc621e2375293fd74ce2da267dbde0c1c3cf5caa549f75c0cfa57831b99ec0c1d7e763c355ca741678e7a9737e2db6db7e0760c2aca18c1c06645b23c6e5ed5221b82222244224c25b4bc8256b68b9c06a28f2564e877cebc34501f7f016447b4c7e0844f8a5a1b0b795f5f07c2cc6a062c6b02e041635991256b47050fa37977e80000000f16d5daf9f7d2fa5f63cec679e4c6e67338bf2c78dfd79f4f29889c15e42d677284cf2a143be0af05de70c14b041fa50f9b01e691608b8786b624b676c5b09c388256b67cbc1e239e1793d80d44a1ee45751b175d82f3065ef520d07282f217c132dc576eafc5fc0fec6c6fbf5110dc1b1f4316cf5287919655c7a7206d978df3be34b8bdeb92844514136919d1c91325ef6bcefb2a4af901c0559efe62388b1d1bd36f517a95d6fc1c3296a13e44cb6df0f8c739292ca04440a58529e26d6ac24638904a65455f33661c49dc223b8f8162fe27f3686f30f763f3bfe7e7daad33b34f84f8dc8c2e766ebc7a377abef212590760cf8d28340e58989417afa2935fb003bf10350078dbfac10860f5b45552c4da2ffd1beab747d31f777baa47d76d62544a545494fcb9f79951f8a17b70af3abca55f39499860c09af71dca31077f1d88b5e9b3fa6798870dbe5ebf42ef9444441e8150308124f96ce160f8ea1efe5d845473140ea320560307daea47ab44173a981a19b978556a001b85b252c803be23d55708a893858fcda511111112c1ea2f730db4870784bc656329686107653789098abb6349953493f644b6792222829e00f438f158c30e5a57807bf8ff4ba046bde06bef98fbfe1faf3c4c450b1d8751769850c2308a84457549e412b5b1dc193264f165b713adc1f4abc828f7988d2789c8996ffa9fa674a0c7e878f8e2b56db358889996db6e3a050993c8920d4a75324ef20161f691dd6c31b99aad662028643c0ad7ee1134e03da5c35db87b79ba73c07dea8098564388378b264a059f56df79aaef6f8eb9c7d7f4e311a922e597be0d0ec24e180df29cb24b07811797c053bc768ef6f02f2858c88e2ba09277c38276d6c020aefededefdbf8d8b739cefbe8353ef875bec867d2119d5c6f3b2a444c971893a1422c014a404020152941ba58956855691ec1e1402957bf5a36f12603139b9d4d5edd93d582a905421244eb0be15ac57ef80e9bbfc70f98741a9f5ca207ea5344c7c0b91bb103831dc548468874c7c62bea1ce0f6fb49cf180b92be1d5eb3660a5de90ebaa6ee836e7e63e43ea50a29063e8c14d0811ca50f2b02550f5019907c49ea0a1778423373aa6360f5f9f3779a57dbbf8c0122757bccd545cff68041b9a299d5348b40ae348a00f9180dba60a55863942d7cb6b07b7b142f405a001b11649370dea7001d48ed2ee8f779f88afb23d97687704aea7edfd8f2e50f8ff0c492fdffb7fb669ddddd4925bbbf97d1d3a74ddd6db6d863b3d1f778fdbf47cbdfeabebee7000002e76f17aaaf77b7ddd5e3df7e5bd5e87e6e818f8d7bca1109450e49249bfb3a72db267ee41fd7d9b55f9fb060fb7cfce9a6d52255a0ad8c490c07d85f692f7aac1473209205a1035b969ef84901bfa4200bf276ac6f97a8f4631c36731f32256e7024004f0dbb07ca7f2d180e87a179d2b111111111a007cfe61de7e72aee70c26eccf40b7aeaef08162973f048924820924924c9ace80b1a4931d48c04d511c07ca444624d1aed316b58c049330880beb2addc6ea2c323b588b24d34ae05c33abebd04545f22f7750e45badfc4fa24401f9b2fa15f1b8991079423fd8e6307d8c88af25cfd00dbd44fe3c85fd5fb99adb417faa4286261e8207d9fe4e9b830d827fd20ad3a20400280ef067c4dba8b9c05e13413d85eb063a994179f577beb7fdf80073990634c9d9dc65f56b560fac38ae82d8fc63fb1c59b33ec46b99633123a3010582a9c2eb41508803ad69e0762aaa10185b9fe7308b25da83dc158f5c97e5303ac029bb493f3cfd51f99fb7fbe9f368698a0fa7aacbfc0befdfff2baed18d7cf46652a5a69aa7547c85a211ea03456c63d1087ff0a00d8a00db38400c8509b185ec178033e88ef579e1963f83f3d333db5159c8e221a18c5e724c89170030704511dbc2f27a5387ad4801a6c93e733e403967c4ac4b998c5a070e06bebf816cc57175c2ca60ba693bc34863c11d8150a8d54651faf8015aa29912327b409bd0c8b22c15d29702949e8ab0734838c1446fd8254f8106867963cf81c4c78f6f35d993b49daf18b3d285eddb9cd903891240180684b6aa2d956263468360ab2d69a14c56d635aa58d2ab566c1b08c569a6ac96d255a8b609b05aa584b564f1b5e3df39f1f7577f9baac9a162a23c84b3a866348a45f99d7339ac1890a42b6706a96f2690f41fed6606ec1934720d8d8177064c8959a26b6b5b22e407117cc7d05f4f752d6a57d0da3ac2dd765bbd6a6c75ef41b9e540c818a9c35c6c0c5f43e6a9a805d1c27e21fb9fa884bbc5ddc793d00ee176b0a82e642390751c19501a5bd2480c54f2b0442a127192a088c9606d5c7dfb192f02c0198822ea770fc9a0e3b87514da06bacedee419056e23bb3941c1f1c80d419b9bae64483021a603eacabc83bfc3bd2491b4b0a0750111e46c20bfa65c1f91ff082e1c00b1a1d7445181c7fba05553effc46bf3c5fae953d5796bdff25f077656b7ba6fb14bebd0285080f232390f24210f96f2929a0d64790e01b557779f3acbcb7b749df1e35693986c375725c921a49ee3259449a641541241e1097b25a32093cbeef4f25fdbfa375a81b3eb7d04ff24020a4a080183806c7194fc936d8d8d8d9454546077007bb5dccdc387f247809532ae628a182a1704c5747215567f95dff20243da78b177107acd282f925233cd1065c45e9f04c434c7f602da786a045723922ff700a1fc4c28886b865d471338f7ee284d3ef7c492d0aa83dcfca5da1de71423f0c5e214f897502410fe1fcb166fd720f57217a8fecfd38245131fc184720d1f202c06564c761812cf4f22086201b14b42f001100d2435b9b07d8d59b41b31bef9d7be84d2fa7d9d00b9e156e4cf682dc01c628669da8c0752e4067fa5336f2c0581661b09c36c71a69295cc55e30acdc1c1c0eda833160ae022d6a92ddb245ab51163cc217b1b90b51115e27f3dc279e906d50e19afe4b7b8049c80c880c1f229e68d882be87f0ec5008f217211e01a1a2040029d3afce2367035486c972b83d28776b6ad95a81e6b160cc3d449be43f27310972649e4565855ec4a4a15fa4a0f0a22c88d41ec5da33388127657f554477d0cc5f14c6cd5c2ed808063486d3b8fee0b4369235b1b76fe86ec636c8de622800f1492ebf9e76a6c72585880a6a6ba94adf14ed4c186d959972d2be84d6a655f9aa30751915821941e429a10da9383a057a2e2c16de97b1c08035018b9f95c0ab91349421ad9e93b51722688a945f5d821e2c964d8b597aedae5e2cbdd67b2f2bd957c958e06daa46773d3d69d8b808e04769852326b1011b90c05bf30265b101e3aa5a32862c1126ecc99f446c45a8940ae71fbfd60f9fc7c49afee1e4bcbd5a6a0df7621f5108f3ea353e275f70ba0dfafebc0fc0700374730c9a6c5d52929f685c588d80aad03c40dcdceb61d6a9adc565f53f8b7524b5c8af61a8837c0ee8617e85fb52b86f923d9478c07c1c832843240db901fa52afc5ee3e63632971c7a2c80f54bad97ad2d4b536b1857f30316469bd0090c34955361106624aa030e434a50a826545f711a4f4bc177c8f793f0b2e56e31e9c358887036911100d898d036357239c8b99ce70e73539cd2671c98c5669a220200d850929fb1c24b7a600e1586bc0c3229f5bd5f5d6ec028549180d1a852caae90bec35f793f5d546d8f7cbb34355a0d382225992b864e7ab3c54d3070c5658dbc0ac1268a7514172ead71d9c904b78fd16d4391c91b7b0a455166595a9dabe3a1ea6c5890a1ac24a49841dbf3fad26810704d25aa0ed59a3a8fb0a88e007c2a7b80c3a2486304c684daffa6368c1f269604758f4e6960f4eb82e246c0d2e28ed0dd9caa753041b24b41bd9af8a24903994b8841a70365fd45d24ca82e7add080466a07de06af8a4a06a2a8c182b1f2a435bb8626cf8b469464094b44b4c6d94f9f426b4874ae0567545ef0afa66a70d3ec040842108e712fec3c38978d0f07450e11050b15f1c58b09b57541c8f4816750d758b0cabf61700bf5a6f1ba040026b44d2e188ede27dd318fde5a28aab65edc434844269ea752125602db22cc1ed1c1c350983d8bb406109099f3af9fca8bf75e75e5739cd78f3e5dfdda49e43bb020fb907d7a976accc89cf8e91d8ce28a1487d2073a47b236b6cf54711468656c8b3ea011d20bacd42fcb27b2b3d10fa5f2eed47b5eca818d9dcfe596031a0dc86cc2189b04cb456756a5c5a28d68cbb6d2037acca02e8db2a049092489bcf7f3bd2b7b117bb923e54b16fbb2348e2a7862975a1bab645d4050701a8cca0c4b31ac175c30db6db6d9f51d37396ad03eabfce41fe7546a0635212c14c328d4481dc8158509fa090db52c6ccedcb970b58df511c3740ceb43d0d9213609036c6ad3aae8357086012ccac8eac2d13390b33af702a628469e42fa8b55aebc895c079b3fb2f0a144146c8d0e143c54a3ca648726e67aac8e81143e7975d0c3fbc751d858f74bf52e24580fea84021a2000b3491a1b23b88ca40680f668af4b0d101f26ddb5400000003df7a7beddeaf3020ec12010d239b19f34945994528d5071470d47f00ad44ac76714077b8c23efdfbe9129760ad2965a722b82de6b5939735fc075f13edb9b80db4896a1912a5250c521b73f4ee4b769171877e891a93a094688855c196671061088ed02676628902284ac900407e251d7f74a2d2db1318190ae268eee251ae912deac6701ca81ad0b108b104151b97fa0bb603e0f836a786b7f5f9b6dff9a8358358d936d11a8da8ab25a2d8ad8c6d88c6b1b1454551158923546ab6368d551ac58b518d80c5a3546b635a22a8b151ac68d1b1b45aa4a2d6a2a0d504562288aa8c6ac5146d116c154982b46a2a84d151ada36ac6c68835909b1ab34c4d5146d582d8ca369ad62da48db516d92db4496c6935164962864a5adada36ab5a6d2a2fa012fde057bb0aaf760afeb9356dab63e7c12d8ab6aa4bbb4fa3439aaa57325b52d94ebae3ad096b2da4979787ff17724538509069efe7730',
-			},
-		}
+	zip_base = can_bases.ZIP_BASE
+
+	# decoded zip_base blobs and their directories, file name is checksum
+	# of blob, marshal is the fastest format to load
+	cache_dir = os.path.join(
+		os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache')),
+		'can_parse_util')
+	CACHE_VERSION = 2
 
 	@classmethod
 	def arch(cls, archname):
@@ -87,18 +168,82 @@ class CANBase(object):
 			acc.append(cls(archname, can))
 		return acc
 	def __init__(self, architect, cantype):
+		''' base is decoded on first access to by_id or name_to_id '''
 		super().__init__()
 		self.architect = architect
 		self.can = cantype
-		orig = self.__class__.zip_base[architect][cantype]
-		self.by_id = {}
-		self.name_to_id = {}
-		js = json.loads(bz2.decompress(binascii.unhexlify(orig)))
-		for key,val in js.items():
+		self._by_id = None
+		self._name_to_id = None
+		self._directory = None
+	@property
+	def by_id(self):
+		if self._by_id is None:
+			self._load()
+		return self._by_id
+	@property
+	def name_to_id(self):
+		if self._name_to_id is None:
+			self._load()
+		return self._name_to_id
+	@property
+	def directory(self):
+		''' {id : (mess name, [signal names])}, base is not decoded for it '''
+		if self._directory is None:
+			self._directory = self._read_cache('dir')
+			if self._directory is None:
+				self._directory = self._make_directory(self._read_base())
+				self._write_cache('dir', self._directory)
+		return self._directory
+	def _load(self):
+		by_id = {}
+		name_to_id = {}
+		for key,val in self._read_base().items():
 			key = int(key)
 			name = val['N']
-			self.by_id[key] = CanTemplate(val['S'], name, key)
-			self.name_to_id[name] = key
+			by_id[key] = CanTemplate(val['S'], name, key)
+			name_to_id[name] = key
+		self._by_id = by_id
+		self._name_to_id = name_to_id
+	@staticmethod
+	def _make_directory(js):
+		return {int(key) : (val['N'], [sig['N'] for sig in val['S']])
+			for key, val in js.items()}
+	def _cache_path(self, kind):
+		orig = self.__class__.zip_base[self.architect][self.can]
+		key = '%08x-%x' % (zlib.crc32(orig), len(orig))
+		return os.path.join(self.cache_dir, '%s-%s.%s' % (key, self.CACHE_VERSION, kind))
+	def _read_cache(self, kind):
+		try:
+			with open(self._cache_path(kind), 'rb') as hdr:
+				return marshal.load(hdr)
+		except Exception:
+			# no cache yet or it is broken
+			return None
+	def _write_cache(self, kind, value):
+		path = self._cache_path(kind)
+		try:
+			os.makedirs(self.cache_dir, exist_ok=True)
+			tmp = '%s.%s.tmp' % (path, os.getpid())
+			with open(tmp, 'wb') as hdr:
+				marshal.dump(value, hdr)
+			os.replace(tmp, path)
+		except OSError:
+			# cache is optional
+			pass
+	def _read_base(self):
+		''' decoded zip_base blob from disk cache, fill cache on miss '''
+		js = self._read_cache('base')
+		if js is not None:
+			return js
+		import bz2
+		import json
+		orig = self.__class__.zip_base[self.architect][self.can]
+		js = json.loads(bz2.decompress(binascii.unhexlify(orig)))
+		self._write_cache('base', js)
+		if self._directory is None:
+			self._directory = self._make_directory(js)
+			self._write_cache('dir', self._directory)
+		return js
 	def get_name(self, name):
 		return self.by_id[self.name_to_id[name]]
 	def get_id(self, id):
@@ -112,43 +257,202 @@ class CANBase(object):
 			for key in mess.keys():
 				yield key
 
+class CanIndex(object):
+	'''
+		lookup tables merged over all bases of one architect
+			by_id     : {id : [base]}
+			by_name   : {mess name : [(base, id)]}
+			by_signal : {signal name : [(base, id)]}
+		tables are made of base directories, a base is decoded only when
+		templates of its messages are asked, signal tables are made on
+		first access
+	'''
+	def __init__(self, bases):
+		super().__init__()
+		self.bases = bases
+		self.by_id = {}
+		self.by_name = {}
+		for base in bases:
+			for id, (name, signals) in base.directory.items():
+				self.by_id.setdefault(id, []).append(base)
+				self.by_name.setdefault(name, []).append((base, id))
+		self._by_signal = None
+		self._signal_names = None
+	@property
+	def by_signal(self):
+		if self._by_signal is None:
+			by_signal = {}
+			for base in self.bases:
+				for id, (name, signals) in base.directory.items():
+					for signame in signals:
+						by_signal.setdefault(signame, []).append((base, id))
+			self._by_signal = by_signal
+		return self._by_signal
+	@property
+	def signal_names(self):
+		if self._signal_names is None:
+			self._signal_names = sorted(self.by_signal.keys())
+		return self._signal_names
+	def templates(self, id):
+		''' [(base, template)] of message id '''
+		return [(base, base.get_id(id)) for base in self.by_id.get(id, [])]
+	@staticmethod
+	def mess_name(base, id):
+		return base.directory[id][0]
+	def find_signals(self, pattern):
+		'''
+			signal names by pattern with * ? [] wildcards,
+			pattern without wildcards is a prefix
+		'''
+		prefix = re.split(r'[*?\[]', pattern, maxsplit=1)[0]
+		is_wildcard = prefix != pattern
+		names = self.signal_names
+		for i in range(bisect.bisect_left(names, prefix), len(names)):
+			name = names[i]
+			if not name.startswith(prefix):
+				break
+			if not is_wildcard or fnmatchcase(name, pattern):
+				yield name
+
+class _NoLock(object):
+	''' lock of single thread run '''
+	def __enter__(self):
+		return self
+	def __exit__(self, *exc):
+		return False
+
+class DecodeCache(object):
+	'''
+		LRU of decoded payloads keyed by (bus, id, payload)
+		cyclic messages repeat same payload, so most decodes are hits
+		returned dicts are shared, do not modify them
+	'''
+	def __init__(self, size=4096, lock=None):
+		self.size = size
+		self.hits = 0
+		self.misses = 0
+		self._items = OrderedDict()
+		# daemon mode decodes from several threads and gives a lock
+		self._lock = lock if lock is not None else _NoLock()
+	def decode(self, base, template, payload):
+		''' template.decode_payload(payload) of base, cached '''
+		payload = bytes(payload)
+		key = (base.can, template.id, payload)
+		with self._lock:
+			values = self._items.get(key)
+			if values is not None:
+				self.hits += 1
+				self._items.move_to_end(key)
+				return values
+			self.misses += 1
+		values = template.decode_payload(payload)
+		if self.size > 0:
+			with self._lock:
+				self._items[key] = values
+				if len(self._items) > self.size:
+					self._items.popitem(last=False)
+		return values
+	def clear(self):
+		self._items.clear()
+		self.hits = 0
+		self.misses = 0
+	def __len__(self):
+		return len(self._items)
+	def __str__(self):
+		total = self.hits + self.misses
+		return 'decode cache: %d hits, %d misses (%.1f%%), %d of %d entries' % (
+			self.hits, self.misses, 100.0 * self.hits / total if total else 0,
+			len(self._items), self.size)
+
+class SignalTrace(object):
+	'''
+		change-only output of signals, state is last emitted value and
+		its time per (id, signal)
+		deadband     - change not greater than it is not emitted
+		min_interval - seconds between two rows of one signal
+	'''
+	def __init__(self, deadband=0, min_interval=0):
+		self.deadband = deadband
+		self.min_interval = min_interval
+		self.state = {}
+	def update(self, timestamp, id, values):
+		''' yield changed (signame, value) of values pairs '''
+		state = self.state
+		for name, value in values:
+			key = (id, name)
+			last = state.get(key)
+			if last is not None:
+				if abs(value - last[0]) <= self.deadband:
+					continue
+				if timestamp - last[1] < self.min_interval:
+					continue
+			state[key] = (value, timestamp)
+			yield name, value
+
 class Utils(object):
-	def __init__(self, arch):
+	def __init__(self, arch, cache_size=4096, lock=None):
+		self.arch = arch
 		self.bases = CANBase.arch(arch)
-	def print_val(self, mess):
-		found = False
-		for base in self.bases:
-			try:
-				templ = base.get_id(mess[0])
-				print('IN BASE %s FOUND %s' % (base.can, templ.name) )
-				for name in templ.signals.keys():
-					print('\t%s = %s' % (name, templ.get_val(name, mess)))
-				found = True
-			except KeyError:
-				continue
+		self._index = None
+		self.cache = DecodeCache(cache_size, lock)
+		self._masks = {}
+	@property
+	def index(self):
+		''' CanIndex of all bases, built on first use '''
+		if self._index is None:
+			self._index = CanIndex(self.bases)
+		return self._index
+	def print_val(self, mess, out=None):
+		self.print_payload(mess[0], mess[1].tobytes(), out)
+	def print_payload(self, id, payload, out=None):
+		found = self.index.templates(id)
+		for base, templ in found:
+			print('IN BASE %s FOUND %s' % (base.can, templ.name), file=out)
+			for name, val in self.cache.decode(base, templ, payload).items():
+				print('\t%s = %s' % (name, val), file=out)
+		if not found:
+			print('NOT FOUND', file=out)
+	def print_name(self, mess_name, out=None):
+		found = self.index.by_name.get(mess_name, [])
+		for base, id in found:
+			print('IN BASE %s FOUND %s' % (base.can, hex(id)[2:]), file=out)
 		if not found:
-			print('NOT FOUND')
-	def print_name(self, mess_name):
+			print('NOT FOUND', file=out)
+	def print_signals(self, pattern, out=None):
 		found = False
-		for base in self.bases:
-			try:
-				id = base.name_to_id[mess_name]
-				print('IN BASE %s FOUND %s' % (base.can, hex(id)[2:]))
+		for signame in self.index.find_signals(pattern):
+			for base, id in self.index.by_signal[signame]:
+				print('IN BASE %s FOUND %s IN %s (%s)' % (base.can, signame, CanIndex.mess_name(base, id), hex(id)[2:]), file=out)
 				found = True
-			except KeyError:
-				continue
 		if not found:
-			print('NOT FOUND')
-	def _get_mess(self, func):
-		for base in self.bases:
-			try:
-				yield func(base)
-			except:
-				pass
+			print('NOT FOUND', file=out)
+	def trace_watch(self, patterns):
+		'''
+			{id : [(base, template, signal names)]} of signal patterns,
+			patterns are matched as in find_signals
+		'''
+		index = self.index
+		found = {}
+		for pattern in patterns:
+			for name in index.find_signals(pattern):
+				for base, id in index.by_signal[name]:
+					templ = base.get_id(id)
+					found.setdefault((base, templ), {})[name] = None
+		watch = {}
+		for (base, templ), names in found.items():
+			watch.setdefault(templ.id, []).append((base, templ, list(names)))
+		return watch
+	def read_masks(self, templates, src):
+		''' read_masks, compiled masks are kept for next queries '''
+		key = (tuple(t.id for t in templates), src)
+		masks = self._masks.get(key)
+		if masks is None:
+			masks = self._masks[key] = read_masks(templates, src)
+		return masks
 	def get_mess_id(self,id):
-		return list(self._get_mess(lambda base: base.get_id(id)))
+		return [templ for base, templ in self.index.templates(id)]
 	def get_mess_name(self,name):
-		return list(self._get_mess(lambda base: base.get_name(name)))
+		return [base.get_id(id) for base, id in self.index.by_name.get(name, [])]
 
 def read_can(text):
 	''' read mess like this 03f 00 04 00 11 00 00 00 00 '''
@@ -178,10 +482,12 @@ class MessageMask(object):
 		# binary mask
 		self.mask = mask
 		self.template = template
+		# message matches if msb_first & and_mask == expected,
+		# see payload_to_ints
 		if self.mask:
-			self.match = self._match_bin
+			self.and_mask, self.expected = self._compile_bin(mask)
 		else:
-			self.match = self._match_sigs
+			self.and_mask, self.expected = self._compile_sigs(signals, template)
 
 	@classmethod
 	def read_bits(cls, text):
@@ -197,8 +503,7 @@ class MessageMask(object):
 			else:
 				txt = bin(int(c, 16))[2:]
 				val = [int(c, 10) for c in txt]
-				for _ in range(4 - len(val)):
-					txt = [0] + val
+				val = [0] * (4 - len(val)) + val
 				mask.extend(val)
 		return cls(None, bytes(mask), None)
 
@@ -221,48 +526,292 @@ class MessageMask(object):
 		signals = [read_pair(pair) for pair in text.split(',')]
 		return cls(signals, None, template)
 
-	def _match_bin(self, canmess):
-		mask = self.mask
-		canmess = canmess[1]
-		for i in range(64):
-			bit = mask[i]
-			if bit != 2 and bit != canmess[i]:
-				return False
-		return True
+	@staticmethod
+	def _compile_bin(mask):
+		''' bit i of mask is bit 63 - i of payload, 2 is any value '''
+		and_mask = 0
+		expected = 0
+		for i, bit in enumerate(mask[:64]):
+			if bit != 2:
+				and_mask |= 1 << (63 - i)
+				expected |= bit << (63 - i)
+		return and_mask, expected
 
-	def _match_sigs(self, canmess):
-		for sig in self.signals:
-			if self.template.get_val(sig[0], canmess) != sig[1]:
-				return False
-		return True
+	@staticmethod
+	def _compile_sigs(signals, template):
+		''' every signal value fixes bits of its slice '''
+		and_mask = 0
+		expected = 0
+		for name, value in signals:
+			index, shift, mask = template.compiled[name]
+			if value & ~mask:
+				# value does not fit the signal, nothing can match
+				return 0, 1
+			if index == 0:
+				sig_mask = mask << shift
+				sig_expected = value << shift
+			else:
+				# lsb_first bit shift + k is msb_first bit 63 - shift - k
+				sig_mask = 0
+				sig_expected = 0
+				for k in range(mask.bit_length()):
+					bit = 1 << (63 - shift - k)
+					sig_mask |= bit
+					if value >> k & 1:
+						sig_expected |= bit
+			if (expected ^ sig_expected) & and_mask & sig_mask:
+				# overlapping signals want different bits
+				return 0, 1
+			and_mask |= sig_mask
+			expected |= sig_expected
+		return and_mask, expected
+
+	def match(self, canmess):
+		return self.match_int(int.from_bytes(canmess[1].tobytes(), 'big'))
 
-def read_log(path):
-	result = []
-	with open(path) as hdr:
+	def match_int(self, payload):
+		''' payload is msb_first of payload_to_ints '''
+		return payload & self.and_mask == self.expected
+
+	def match_column(self, payloads):
+		''' bool numpy array, payloads is uint64 array of payload_column '''
+		np = _numpy()
+		payloads = np.asarray(payloads, dtype=np.uint64)
+		return (payloads & np.uint64(self.and_mask)) == np.uint64(self.expected)
+
+# signature ("CANI"), version, size and mtime of the log, count of ids
+LOG_INDEX_HEADER = struct.Struct('<4sLQQL')
+# directory after header: arbitration id, count of its lines and index
+# file offset of their uint64 line offsets
+LOG_INDEX_ENTRY = struct.Struct('<LLQ')
+LOG_INDEX_VERSION = 2
+# both full and indexed reading decode lines the same way
+LOG_ENCODING = 'utf-8'
+
+def log_index_path(path):
+	return path + '.idx'
+
+def build_log_index(path):
+	''' {id : array of byte offsets of its lines} of text log '''
+	index = {}
+	offset = 0
+	with open(path, 'rb') as hdr:
 		for line in hdr:
-			split = line[:-1].split('\t')
+			field = line.rstrip(b'\r\n').rsplit(b'\t', 1)[-1]
 			try:
-				result.append( (line, split[1], read_can(split[-1])) )
-			except Exception as e:
-				pass
-				# print(split, e)
-	return result
+				id = int(field.split(b' ', 1)[0], 16)
+			except ValueError:
+				id = None
+			if id is not None:
+				offsets = index.get(id)
+				if offsets is None:
+					offsets = index[id] = array('Q')
+				offsets.append(offset)
+			offset += len(line)
+	return index
 
-def main():
+def _log_stamp(path):
+	stat = os.stat(path)
+	return stat.st_size, stat.st_mtime_ns
+
+def save_log_index(path, index):
+	size, mtime = _log_stamp(path)
+	ids = sorted(index)
+	pos = LOG_INDEX_HEADER.size + len(ids) * LOG_INDEX_ENTRY.size
+	with open(log_index_path(path), 'wb') as hdr:
+		hdr.write(LOG_INDEX_HEADER.pack(b'CANI', LOG_INDEX_VERSION,
+			size, mtime, len(ids)))
+		for id in ids:
+			hdr.write(LOG_INDEX_ENTRY.pack(id, len(index[id]), pos))
+			pos += len(index[id]) * index[id].itemsize
+		for id in ids:
+			offsets = index[id]
+			if sys.byteorder != 'little':
+				offsets = array('Q', offsets)
+				offsets.byteswap()
+			hdr.write(offsets.tobytes())
+
+def load_log_index(path, ids):
+	'''
+		{id : array of line offsets} of stored index for ids only,
+		None if it is missing or log was changed
+	'''
+	try:
+		hdr = open(log_index_path(path), 'rb')
+	except OSError:
+		return None
+	with hdr:
+		data = hdr.read(LOG_INDEX_HEADER.size)
+		if len(data) < LOG_INDEX_HEADER.size:
+			return None
+		magic, version, size, mtime, count = LOG_INDEX_HEADER.unpack(data)
+		if (magic != b'CANI' or version != LOG_INDEX_VERSION or
+				(size, mtime) != _log_stamp(path)):
+			return None
+		data = hdr.read(count * LOG_INDEX_ENTRY.size)
+		if len(data) != count * LOG_INDEX_ENTRY.size:
+			return None
+		index = {}
+		for id, lines, pos in LOG_INDEX_ENTRY.iter_unpack(data):
+			if id not in ids:
+				continue
+			offsets = array('Q')
+			hdr.seek(pos)
+			offsets.frombytes(hdr.read(lines * offsets.itemsize))
+			if len(offsets) != lines:
+				return None
+			if sys.byteorder != 'little':
+				offsets.byteswap()
+			index[id] = offsets
+	return index
+
+def _log_lines(path, ids):
+	''' lines of log, only lines of ids if log has valid index '''
+	index = load_log_index(path, ids) if ids is not None else None
+	if index is None:
+		with open(path, encoding=LOG_ENCODING, errors='replace') as hdr:
+			yield from hdr
+		return
+	offsets = heapq.merge(*index.values())
+	with open(path, 'rb') as hdr:
+		for offset in offsets:
+			hdr.seek(offset)
+			line = hdr.readline()
+			if line.endswith(b'\r\n'):
+				line = line[:-2] + b'\n'
+			yield line.decode(LOG_ENCODING, 'replace')
+
+def read_log(path, ids=None):
+	'''
+		yield (line, field, (id, bitarray)) of log lines one by one
+		ids - set of arbitration ids, other lines are skipped before
+		payload is parsed, with index of build_log_index other lines
+		are not read at all
+	'''
+	for line in _log_lines(path, ids):
+		split = line[:-1].split('\t')
+		try:
+			if ids is not None:
+				if int(split[-1].split(' ', 1)[0], 16) not in ids:
+					continue
+			yield (line, split[1], read_can(split[-1]))
+		except Exception as e:
+			pass
+			# print(split, e)
+
+def read_payloads(path, ids=None):
+	'''
+		yield (line, id, payload bytes) of .txt log or .blf file,
+		for .blf line is the same as blf.py writes to .txt
+	'''
+	if path.endswith('.blf'):
+		import blf
+		for frame in blf.BLFReader(path, ids=ids, error_frames=False):
+			yield (blf.mess2s(frame) + '\n', frame.arbitration_id,
+				bytes(frame.data))
+	else:
+		for line, _, can in read_log(path, ids):
+			yield (line, can[0], can[1].tobytes())
+
+def read_masks(templates, src):
+	''' masks for every template, None if template has no such signals '''
+	if src[0] == 'b':
+		return [MessageMask.read_bits(src[1:]) for _ in templates]
+	if src[0] == 'x':
+		return [MessageMask.read_bytes(src[1:]) for _ in templates]
+	if src[0] == '{':
+		masks = []
+		for template in templates:
+			try:
+				masks.append(MessageMask.read_signals(template, src))
+			except:
+				masks.append(None)
+		if not any(masks):
+			raise Exception('read_masks', 'mask incorrect')
+		return masks
+	raise Exception('read_masks', 'incorrect mask format')
+
+class FindQuery(object):
+	''' one --find request, key - id or name, out - file or None '''
+	def __init__(self, key, templates, masks, out):
+		self.key = key
+		self.templates = templates
+		self.masks = masks
+		self.out = out
+
+	def write_out(self, line):
+		if self.out:
+			self.out.write(line)
+			self.out.write('\n')
+
+def find_dispatch(queries):
+	''' id -> [(query, mask)], mask None means any payload '''
+	dispatch = {}
+	for query in queries:
+		for i, template in enumerate(query.templates):
+			if query.masks is None:
+				mask = None
+			elif query.masks[i] is None:
+				continue
+			else:
+				mask = query.masks[i]
+			dispatch.setdefault(template.id, []).append((query, mask))
+	return dispatch
+
+def build_parser():
 	parser = argparse.ArgumentParser(description='')
 	# selfdir = os.path.dirname(__file__)
 	parser.add_argument('--what', help='description of message or code of name')
-	parser.add_argument('--find', help='find messages in log')
-	parser.add_argument('-m', help='mask for find mode')
-	parser.add_argument('-o', help='out file for find mode')
-	parser.add_argument('-l', help='log file')
+	parser.add_argument('--find', action='append',
+		help='find messages in log, may be repeated')
+	parser.add_argument('--signal',
+		help='find messages by signal pattern: SPEED is a prefix, SPEED*_? is a wildcard')
+	parser.add_argument('--trace',
+		help='print signals only when changed, comma separated patterns as in --signal: SPEED,TEMP*_C')
+	parser.add_argument('--deadband', type=float, default=0,
+		help='trace mode, ignore changes not greater than it')
+	parser.add_argument('--min-interval', type=float, default=0,
+		help='trace mode, msecs between two rows of one signal')
+	parser.add_argument('-m', action='append',
+		help='mask for find mode, n-th -m is for n-th --find, empty is no mask')
+	parser.add_argument('-o', action='append',
+		help='out file for find mode, n-th -o is for n-th --find')
+	parser.add_argument('-l', help='log file, .txt or .blf')
 	parser.add_argument('-a', help='architect')
+	parser.add_argument('--index', action='store_true',
+		help='store line offsets of every id of text log, --find reads them')
+	parser.add_argument('--cache-size', type=int, default=4096,
+		help='decoded payloads kept in memory, 0 disables cache')
+	parser.add_argument('--serve', metavar='SOCKET',
+		help='keep bases loaded and answer requests on unix socket')
+	parser.add_argument('--connect', metavar='SOCKET',
+		help='send request to --serve daemon instead of loading bases')
 	# add argument --frequency
-	args = vars(parser.parse_args())
-	if args['a'] is None:
-		print('no arch')
+	return parser
+
+def run(utils, args, out=None, log=sys.stderr):
+	'''
+		one request of parsed args, everything is printed to out,
+		statistics to log if it is not None
+	'''
+	if args['what'] and args['l'] and args['l'].endswith('.blf'):
+		# decode every frame of message in log
+		mess = args['what']
+		try:
+			ids = {int(mess, 16)}
+		except ValueError:
+			ids = {id for base, id in utils.index.by_name.get(mess, [])}
+		if not ids:
+			print('NOT FOUND', file=out)
+			return
+		import blf
+		for frame in blf.BLFReader(args['l'], ids=ids, error_frames=False):
+			print('%s %03x %s' % (frame.timestamp, frame.arbitration_id,
+				bytes(frame.data).hex(' ')), file=out)
+			utils.print_payload(frame.arbitration_id, bytes(frame.data), out)
+		if log is not None:
+			print(utils.cache, file=log)
 		return
-	utils = Utils(args['a'])
 	if args['what']:
 		mess = args['what']
 		try:
@@ -270,74 +819,108 @@ def main():
 		except:
 			can_m = None
 		if can_m:
-			utils.print_val(can_m)
+			utils.print_val(can_m, out)
 		else:
-			utils.print_name(mess)
+			utils.print_name(mess, out)
 		return
-	if args['find']:
-		key = args['find']
-		templates = []
-		try:
-			key = int(key,16)
-			templates = utils.get_mess_id(key)
-		except:
-			templates = utils.get_mess_name(key)
-		if len(templates) == 0:
-			print('no mess %s found' % key)
+	if args['signal']:
+		utils.print_signals(args['signal'], out)
+		return
+	if args['trace']:
+		if args['l'] is None:
+			print('log not setted', file=out)
 			return
-		if templates[0].id == templates[1].id:
-			del templates[1]
-		mask = []
-		if args['m']:
-			src = args['m']
-			if src[0] == 'b':
-				for _ in templates:
-					mask.append(MessageMask.read_bits(src[1:]))
-			elif src[0] == 'x':
-				for _ in templates:
-					mask.append(MessageMask.read_bytes(src[1:]))
-			elif src[0] == '{':
-				correct_mask_exist = False
-				for template in templates:
-					try:
-						mask.append(MessageMask.read_signals(template, src))
-						correct_mask_exist = True
-					except:
-						mask.append(None)
-				if not correct_mask_exist:
-					print('mask incorrect')
-					return
-			else:
-				print('incorrect mask format')
+		patterns = [p.strip() for p in args['trace'].split(',')]
+		watch = utils.trace_watch(patterns)
+		if not watch:
+			print('NOT FOUND', file=out)
+			return
+		trace = SignalTrace(args['deadband'], args['min_interval'] / 1000.0)
+		for line, id, payload in read_payloads(args['l'], set(watch)):
+			timestamp = line.split('\t', 1)[0]
+			time = float(timestamp)
+			for base, templ, names in watch[id]:
+				values = utils.cache.decode(base, templ, payload)
+				changed = trace.update(time, id, ((n, values[n]) for n in names))
+				for name, value in changed:
+					print('%s\t%03x\t%s\t%s' % (timestamp, id, name, value),
+						file=out)
+		return
+	if args['find']:
+		queries = []
+		masks_src = args['m'] or []
+		outs = args['o'] or []
+		for n, key in enumerate(args['find']):
+			templates = []
+			try:
+				key = int(key,16)
+				templates = utils.get_mess_id(key)
+			except:
+				templates = utils.get_mess_name(key)
+			if len(templates) == 0:
+				print('no mess %s found' % key, file=out)
 				return
+			# same message may be in several bases
+			unique = {}
+			for template in templates:
+				unique.setdefault(template.id, template)
+			templates = list(unique.values())
+			masks = None
+			if n < len(masks_src) and masks_src[n]:
+				try:
+					masks = utils.read_masks(templates, masks_src[n])
+				except Exception as e:
+					print(e.args[-1], file=out)
+					return
+			queries.append(FindQuery(args['find'][n], templates, masks, None))
 		if args['l'] is None:
-			print('log not setted')
+			print('log not setted', file=out)
 			return
-		out = None
-		if args['o']:
-			out = open(args['o'], 'wt')
-		def write_out(line):
-			if out:
-				out.write(line[0])
-				out.write('\n')
-		log = read_log(args['l'])
-		for line in log:
-			index = line[0]
-			can   = line[2]
-			for i in range(len(templates)):
-				template = templates[i]
-				if len(mask) == 0:
-					if can[0] == template.id:
-						print(index, end='')
-						write_out(line)
-				elif mask[i] is None:
-					continue
-				else:
-					if can[0] == template.id and mask[i].match(can):
-						print(index, end='')
-						write_out(line)
-		if out:
-			out.close()
+		for query, path in zip(queries, outs):
+			query.out = open(path, 'wt')
+		dispatch = find_dispatch(queries)
+		# with several queries every line is prefixed by its query
+		prefix = len(queries) > 1
+		for line, id, payload in read_payloads(args['l'], set(dispatch)):
+			msb_first = payload_to_ints(payload)[0]
+			for query, mask in dispatch[id]:
+				if mask is None or mask.match_int(msb_first):
+					if prefix:
+						print(query.key, end='\t', file=out)
+					print(line, end='', file=out)
+					query.write_out(line)
+		for query in queries:
+			if query.out:
+				query.out.close()
+
+def run_index(args, out=None):
+	if args['l'] is None or args['l'].endswith('.blf'):
+		print('text log not setted', file=out)
+		return
+	index = build_log_index(args['l'])
+	save_log_index(args['l'], index)
+	print('%d ids indexed in %s' % (len(index), log_index_path(args['l'])),
+		file=out)
+
+def main():
+	args = vars(build_parser().parse_args())
+	if args['connect']:
+		# abbreviated --conn, full --connect never gets here
+		import can_parse_client
+		can_parse_client.connect(args['connect'], sys.argv[1:])
+		return
+	if args['index']:
+		run_index(args)
+		return
+	if args['a'] is None:
+		print('no arch')
+		return
+	if args['serve']:
+		import can_parse_server
+		can_parse_server.serve(args['serve'], sys.modules[__name__], args['a'],
+			args['cache_size'])
+		return
+	run(Utils(args['a'], args['cache_size']), args)
 
 if __name__ == '__main__':
-	main()
\ No newline at end of file
+	main()
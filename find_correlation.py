@@ -3,9 +3,16 @@ import sys
 import re
 import argparse
 import os
+from collections import Counter, deque
+from itertools import chain, islice
 from argparse import RawTextHelpFormatter
 import xml.etree.ElementTree as ET # for reading API.xml
 
+def msecs(h,m,s,ms):
+	return (s + (m * 60) + (h * 60 * 60)) * 1000 + ms
+
+DAY_MSECS = msecs(24, 0, 0, 0)
+
 # One process-thread-message filter
 class Filter(object):
 	# make new filter or return none if string empty
@@ -77,19 +84,34 @@ class Indexer(object):
 				updcount += 1
 		# if most of lines is in one template then all conf in this template
 		if float(defcount) / len(lines) > 3.0 / 5:
-			return cls(9, 5, 6, 7, 9)
+			return cls(9, 5, 6, 7, 9, 2)
 		elif float(updcount) / len(lines) > 3.0 / 5:
-			return cls(11, 7, 8, 9, 11)
+			return cls(11, 7, 8, 9, 11, 4)
 		else:
 		# if none - we can't parse this
 			raise Exception("can't parse this log")
-	def __init__(self, maxsplit, proc, thread, func, message):
+	def __init__(self, maxsplit, proc, thread, func, message, time):
 		# All that fields is int indexes
 		self.proc       = proc
 		self.thread     = thread
 		self.message    = message
 		self.func       = func
 		self.maxsplit   = maxsplit
+		self._time      = time
+	def time(self, logline):
+		''' msecs of day of split logline or None, same as in time_cut '''
+		try:
+			line = logline[self._time]
+			a = line.index(' ')
+			b = line.index('.')
+			t = line[a+1:b].split(':')
+			h = int(t[0])
+			m = int(t[1])
+			s = int(t[2])
+			ms = int(line[b+1:])
+			return msecs(h, m, s, ms)
+		except:
+			return None
 
 class Mask:
 	'''
@@ -120,55 +142,134 @@ class Mask:
 
 
 class CorrelationLooker:
-	def look_in(self, events, trigger, depth, look_before=True):
+	'''
+		Streaming accident statistic
+		Howto: look_in once, then get_correlation with any probability
+	'''
+	def look_in(self, events, trigger, depth, key, look_before=True):
 		'''
-			(events, trigger, depth, probability)
-			events      - list of events
+			(events, trigger, depth, key, look_before)
+			events      - iterable of events, read only once
 			trigger     - predicate to see reason of what we looking for
 			depth       - how much events before accident we looking at
+			key         - function to get identity of event, events with
+			              equal keys are the same event
+			only last depth events are kept, predecessors of every
+			accident are folded into counters at once
 		'''
+		self._reset(key)
 		self._depth = depth
+		recent = deque(maxlen=depth)
+		# positions of accidents which wait for events after them
+		opened = deque()
+		position = -1
+		for position, event in enumerate(events):
+			is_accident = trigger(event)
+			if look_before:
+				if is_accident:
+					self._fold(reversed(recent))
+				# first line is log header
+				if position > 0:
+					recent.append(event)
+			else:
+				recent.append(event)
+				if opened and opened[0] + depth == position:
+					opened.popleft()
+					self._fold(reversed(recent))
+				if is_accident:
+					opened.append(position)
+		# windows at the end of log are shorter
+		recent = list(recent)
+		for accident in opened:
+			count = position - accident
+			self._fold(reversed(recent[len(recent) - count:]) if count else ())
+	def look_in_time(self, events, trigger, window, key, time, look_before=True):
+		'''
+			(events, trigger, window, key, time, look_before)
+			same as look_in, but predecessors are all events not more than
+			window msecs before (or after) accident
+			time        - function to get msecs of event or None, event
+			              without time has time of previous one, events
+			              before first time are skipped
+		'''
+		self._reset(key)
+		# (position, time, event), window is from the left end to now
+		recent = deque()
+		# (position, time) of accidents which wait for events after them
+		opened = deque()
+		day = 0
+		last = None
+		for position, event in enumerate(events):
+			current = time(event)
+			if current is None:
+				if last is None:
+					continue
+				current = last
+			else:
+				# midnight, small disorder of processes does not go back
+				if last is not None and current + day + DAY_MSECS // 2 < last:
+					day += DAY_MSECS
+				current += day
+				if last is not None and current < last:
+					current = last
+			last = current
+			is_accident = trigger(event)
+			if look_before:
+				while recent and recent[0][1] < current - window:
+					recent.popleft()
+				if is_accident:
+					self._fold(item[2] for item in reversed(recent))
+				recent.append((position, current, event))
+			else:
+				while opened and opened[0][1] + window < current:
+					self._fold_after(recent, opened.popleft()[0])
+				# only events after oldest open accident are needed
+				oldest = opened[0][0] if opened else position
+				while recent and recent[0][0] <= oldest:
+					recent.popleft()
+				recent.append((position, current, event))
+				if is_accident:
+					opened.append((position, current))
+		for accident, _ in opened:
+			self._fold_after(recent, accident)
+	def _fold_after(self, recent, accident):
+		''' fold events after accident position, latest first '''
 		predecessors = []
-		for i in range(len(events)):
-			event = events[i]
-			if trigger(event):
-				current_predecessors = []
-				if look_before:
-					for j in range(1, depth + 1):
-						if i - j > 0:
-							current_predecessors.append(events[i - j])
-					predecessors.append(current_predecessors)
-				else:
-					for j in range(1, depth + 1):
-						if i + j < len(events):
-							current_predecessors.append(events[i + j])
-					current_predecessors.reverse()
-					predecessors.append(current_predecessors)
-		self._predecessors = predecessors
+		for position, _, event in reversed(recent):
+			if position <= accident:
+				break
+			predecessors.append(event)
+		self._fold(predecessors)
+	def _reset(self, key):
+		self._key = key
+		self._accidents = 0
+		# first event of every key, keys are in order of appearance
+		self._first_events = {}
+		# number of accidents where key is
+		self._counter = Counter()
+	def _fold(self, predecessors):
+		first_events = self._first_events
+		key = self._key
+		keys = set()
+		for predecessor in predecessors:
+			event_key = key(predecessor)
+			if event_key not in first_events:
+				first_events[event_key] = predecessor
+			keys.add(event_key)
+		self._counter.update(keys)
+		self._accidents += 1
 	def accident_count(self):
-		return len(self._predecessors)
-	def get_correlation(self, id_comparer, probability):
+		return self._accidents
+	def get_correlation(self, probability):
 		'''
 			look_in must be called before it
-			(id_comparer, probability)
-			id_comparer - function to compare identity
+			(probability)
 			probability - euristic parameter for answer
 		'''
-		# all_events : [(event, {number_of_accident})]
-		all_events = []
-		for accident_id in range(len(self._predecessors)):
-			for predecessor in self._predecessors[accident_id]:
-				found = False
-				for pair in all_events:
-					if id_comparer(pair[0], predecessor):
-						# found match! upd accident counter and break loop
-						pair[1].add(accident_id)
-						found = True
-						break
-				if not found:
-					all_events.append( (predecessor, set([accident_id])) )
-		max_num = float(len(self._predecessors))
-		event_prob_list = map(lambda pair: (pair[0], len(pair[1]) / max_num), all_events)
+		max_num = float(self._accidents)
+		counter = self._counter
+		event_prob_list = [(event, counter[event_key] / max_num)
+			for event_key, event in self._first_events.items()]
 		#print('%s: %s' % (max_num, [e[1] for e in event_prob_list]))
 		event_prob_list = filter(lambda pair: pair[1] >= probability, event_prob_list)
 		event_prob_list = list(event_prob_list)
@@ -177,24 +278,43 @@ class CorrelationLooker:
 		return event_prob_list
 
 def read_lines(path):
-	encs = ['utf-8', 'cp1251']
-	for enc in encs:
-		try:
-			with open(path, 'r', encoding=enc) as h:
-				return list(h.readlines())
-		except Exception as e:
-			print(e)
-			pass
-	raise Exception('bad encoding')
+	''' lines of utf-8 or cp1251 log one by one '''
+	with open(path, 'r', encoding='utf-8', errors='surrogateescape') as h:
+		for line in h:
+			if not line.isascii():
+				try:
+					line.encode('utf-8')
+				except UnicodeEncodeError:
+					line = line.encode('utf-8', 'surrogateescape').decode('cp1251')
+			yield line
 
-def find_correlation(mask, depth, path, probability, params, look_before):
+def find_correlation(mask, depth, path, probability, params, look_before, window=None):
 	lines = read_lines(path)
-	indexer = Indexer.try_lines(lines[1:6])
+	head = list(islice(lines, 6))
+	indexer = Indexer.try_lines(head[1:6])
 	mask.indexer = indexer
-	lines = tuple((line.split('/') for line in lines))
+	events = (line.split('/') for line in chain(head, lines))
+	fields = {
+			'p' : indexer.proc,
+			't' : indexer.thread,
+			'f' : indexer.func,
+			'm' : indexer.message
+		}
+	# by full params
+	indexes = [fields[param] for param in params]
+	def key(event):
+		try:
+			return tuple(event[i] for i in indexes)
+		except IndexError:
+			# event without field is not the same as any other
+			return object()
 	looker = CorrelationLooker()
 	# get precursors of all accidents
-	looker.look_in(lines, mask.save_this_line, depth, look_before)
+	if window is None:
+		looker.look_in(events, mask.save_this_line, depth, key, look_before)
+	else:
+		looker.look_in_time(events, mask.save_this_line, window, key,
+			indexer.time, look_before)
 	if looker.accident_count() == 0:
 		print('ACCIDENT NOT FOUND')
 		return
@@ -202,31 +322,15 @@ def find_correlation(mask, depth, path, probability, params, look_before):
 		print('ACCIDENT ONLY ONE')
 		return
 	print('ACCIDENT COUNT', looker.accident_count())
-	# by full params
-	comparers = {
-			'p' : lambda a,b: a[indexer.proc] == b[indexer.proc],
-			't' : lambda a,b: a[indexer.thread] == b[indexer.thread],
-			'f' : lambda a,b: a[indexer.func] == b[indexer.func],
-			'm' : lambda a,b: a[indexer.message] == b[indexer.message]
-		}
-	def compare(funcs, a,b):
-		try:
-			for f in funcs:
-				if not f(a,b):
-					return False
-			return True
-		except:
-			return False
-	def case(name, funcs):
-		funcs = [comparers[name] for name in funcs]
-		reason = looker.get_correlation(lambda a,b: compare(funcs, a, b), probability)
+	def case(name):
+		reason = looker.get_correlation(probability)
 		if len(reason) == 0:
 			print('NOT FOUND')
 		else:
 			print(name)
 			for ans in reason:
 				print('  (%s%%): "%s"' % (int(ans[1] * 100), ('/').join(ans[0]).strip()))
-	case('BY %s' % params, params)
+	case('BY %s' % params)
 
 parser = argparse.ArgumentParser(description='', formatter_class=RawTextHelpFormatter)
 selfdir = os.path.dirname(__file__)
@@ -236,6 +340,7 @@ parser.add_argument('log', help='log file')
 parser.add_argument('-p', help='prop', default='80')
 parser.add_argument('--params', help='compare params', default='p,t,f,m')
 parser.add_argument('--after', help='search in events after accident', action='store_true')
+parser.add_argument('--window-ms', help='search in events in msecs before (after) accident instead of depth', default=None)
 # add argument --frequency
 args = vars(parser.parse_args())
 
@@ -247,11 +352,21 @@ except:
 	print('bad depth')
 	exit()
 
+window = None
+if args['window_ms'] is not None:
+	try:
+		window = int(args['window_ms'])
+		assert window >= 0
+	except:
+		print('bad window')
+		exit()
+
 find_correlation (
 		mask,
 		depth,
 		args['log'],
 		float(args['p']) / 100.0,
 		args['params'].split(','),
-		not args['after']
+		not args['after'],
+		window
 	)
\ No newline at end of file